@@ -53,15 +53,25 @@ def index(
     )
 
 
-@router.get("/create")
-def create(inertia: InertiaDepends, user: CurrentUser):
-    orgs = [
+def get_organization_options():
+    return [
         {"id": o["id"], "name": o["name"]}
         for o in ORGANIZATIONS.values()
         if o["deleted_at"] is None
     ]
 
-    return inertia.render("Contacts/Create", {"organizations": orgs})
+
+@router.get("/create")
+def create(inertia: InertiaDepends, user: CurrentUser):
+    return inertia.render(
+        "Contacts/Create",
+        {
+            # Kept by the client across create/edit navigations
+            "organizations": inertia.once(
+                get_organization_options, key="organizations"
+            ),
+        },
+    )
 
 
 @router.post("")
@@ -97,11 +107,6 @@ def edit(contact_id: int, inertia: InertiaDepends, user: CurrentUser):
     if not contact:
         return RedirectResponse(url="/contacts", status_code=303)
 
-    orgs = [
-        {"id": o["id"], "name": o["name"]}
-        for o in ORGANIZATIONS.values()
-        if o["deleted_at"] is None
-    ]
     contact_with_org = dict(contact)
     if contact["organization_id"]:
         org = ORGANIZATIONS.get(contact["organization_id"])
@@ -110,7 +115,13 @@ def edit(contact_id: int, inertia: InertiaDepends, user: CurrentUser):
         )
 
     return inertia.render(
-        "Contacts/Edit", {"contact": contact_with_org, "organizations": orgs}
+        "Contacts/Edit",
+        {
+            "contact": contact_with_org,
+            "organizations": inertia.once(
+                get_organization_options, key="organizations"
+            ),
+        },
     )
 
 
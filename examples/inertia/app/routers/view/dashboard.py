@@ -71,9 +71,16 @@ def dashboard(inertia: InertiaDepends, user: CurrentUser):
                 "email": user["email"],
             },
             # Slow data deferred - loads after initial page render
-            "statistics": inertia.defer(get_statistics, group="analytics"),
+            # Concurrent dashboard loads share one in-flight computation
+            "statistics": inertia.defer(
+                inertia.coalesce(get_statistics, key="dashboard.statistics"),
+                group="analytics",
+            ),
             "recent_activities": inertia.defer(
-                get_recent_activities, group="analytics"
+                inertia.coalesce(
+                    get_recent_activities, key="dashboard.recent_activities"
+                ),
+                group="analytics",
             ),
             # Another deferred group for separate loading
             "chart_data": inertia.defer(
@@ -81,4 +88,6 @@ def dashboard(inertia: InertiaDepends, user: CurrentUser):
                 group="charts",
             ),
         },
+        # Compute deferred groups right after the initial response is sent
+        prefetch_deferred=True,
     )
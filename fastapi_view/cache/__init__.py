@@ -0,0 +1,15 @@
+from .base import CacheBackend, CacheError, CacheStats, NamespacedCache
+from .file import FileCache
+from .memory import MemoryCache
+from .redis import RedisCache, RedisConnection
+
+__all__ = [
+    "CacheBackend",
+    "CacheError",
+    "CacheStats",
+    "FileCache",
+    "MemoryCache",
+    "NamespacedCache",
+    "RedisCache",
+    "RedisConnection",
+]
@@ -0,0 +1,181 @@
+import abc
+import threading
+import typing as t
+
+from starlette.concurrency import run_in_threadpool
+
+
+class CacheError(RuntimeError):
+    """A cache backend failed to complete an operation."""
+
+
+class CacheStats:
+    """Hit, miss, write and eviction counters of a cache backend."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def record_set(self) -> None:
+        with self._lock:
+            self.sets += 1
+
+    def record_evictions(self, count: int = 1) -> None:
+        with self._lock:
+            self.evictions += count
+
+    @property
+    def hit_ratio(self) -> float | None:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else None
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "evictions": self.evictions,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.sets = self.evictions = 0
+
+
+class CacheBackend(abc.ABC):
+    """
+    A byte-value cache with expiry and tag-based invalidation.
+
+    Backends implement the blocking methods. The `a`-prefixed coroutine
+    variants run them in the threadpool unless a backend can do better, so
+    async endpoints never block the event loop on I/O.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Get the value of `key`, None if missing or expired."""
+
+    @abc.abstractmethod
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        """Store `value` for `ttl` seconds (forever when None), under `tags`."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove `key`, returning whether it was stored."""
+
+    @abc.abstractmethod
+    def invalidate(self, *tags: str) -> int:
+        """Remove the values stored under any of `tags`, returning how many."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove every value."""
+
+    async def aget(self, key: str) -> bytes | None:
+        return await run_in_threadpool(self.get, key)
+
+    async def aset(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        await run_in_threadpool(self.set, key, value, ttl, tuple(tags))
+
+    async def adelete(self, key: str) -> bool:
+        return await run_in_threadpool(self.delete, key)
+
+    async def ainvalidate(self, *tags: str) -> int:
+        return await run_in_threadpool(self.invalidate, *tags)
+
+    def namespaced(self, namespace: str | None) -> "NamespacedCache":
+        """
+        View the backend under a namespace, such as the assets version.
+
+        Keys and tags are prefixed with the namespace, so values stored under
+        another namespace are never served and age out on their own.
+        """
+        return NamespacedCache(self, namespace or "")
+
+
+class NamespacedCache(CacheBackend):
+    """A backend whose keys and tags are prefixed with a namespace."""
+
+    def __init__(self, backend: CacheBackend, namespace: str):
+        self.backend = backend
+        self.namespace = namespace
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.backend.stats
+
+    def get(self, key: str) -> bytes | None:
+        return self.backend.get(self._prefix(key))
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        self.backend.set(
+            self._prefix(key), value, ttl, [self._prefix(tag) for tag in tags]
+        )
+
+    def delete(self, key: str) -> bool:
+        return self.backend.delete(self._prefix(key))
+
+    def invalidate(self, *tags: str) -> int:
+        return self.backend.invalidate(*(self._prefix(tag) for tag in tags))
+
+    def clear(self) -> None:
+        """Remove every value of the underlying backend."""
+        self.backend.clear()
+
+    async def aget(self, key: str) -> bytes | None:
+        return await self.backend.aget(self._prefix(key))
+
+    async def aset(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        await self.backend.aset(
+            self._prefix(key), value, ttl, [self._prefix(tag) for tag in tags]
+        )
+
+    async def adelete(self, key: str) -> bool:
+        return await self.backend.adelete(self._prefix(key))
+
+    async def ainvalidate(self, *tags: str) -> int:
+        return await self.backend.ainvalidate(*(self._prefix(tag) for tag in tags))
+
+    def namespaced(self, namespace: str | None) -> "NamespacedCache":
+        return NamespacedCache(self.backend, self._prefix(namespace or ""))
+
+    def _prefix(self, name: str) -> str:
+        return f"{self.namespace}:{name}"
@@ -0,0 +1,240 @@
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+from .base import CacheBackend, CacheError
+
+# Expiry timestamp (0 for none) and header length before each value
+_PREFIX = struct.Struct(">dI")
+
+
+class FileCache(CacheBackend):
+    """
+    Cache storing each value in its own file under `directory`.
+
+    Values are memory-mapped when read instead of being copied through read
+    buffers, and written to a temporary file that atomically replaces the old
+    one, so several worker processes can share the directory. Expiry uses wall
+    clock time for the same reason.
+
+    Expired values are removed when read, and by a sweep over the directory
+    that runs on a write at most every `sweep_interval` seconds. The sweep
+    also removes the oldest values while the directory holds more than
+    `max_bytes`, and tag files whose values are all gone. Values left behind
+    by other namespaces, e.g. pages of a previous assets version, therefore
+    age out. Removed values are counted as evictions.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_bytes: int | None = 1024 * 1024 * 1024,
+        sweep_interval: float = 60.0,
+    ):
+        super().__init__()
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+
+        self._values = self.directory / "values"
+        self._tags = self.directory / "tags"
+        self._sweep_lock = threading.Lock()
+        self._next_sweep = time.monotonic() + sweep_interval
+
+        self._values.mkdir(parents=True, exist_ok=True)
+        self._tags.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> bytes | None:
+        value = self._read(key)
+        self.stats.record(value is not None)
+
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        path = self._value_path(key)
+        tags = tuple(tags)
+        header = json.dumps({"key": key, "tags": tags}).encode()
+        expires = 0.0 if ttl is None else time.time() + ttl
+
+        try:
+            path.parent.mkdir(exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=path.parent)
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(_PREFIX.pack(expires, len(header)))
+                    file.write(header)
+                    file.write(value)
+
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+
+            for tag in tags:
+                # Appends of a single short line are atomic between processes
+                with open(self._tag_path(tag), "a") as file:
+                    file.write(f"{path.name}\n")
+        except OSError as exc:
+            raise CacheError(f"Failed to write {path}: {exc}") from exc
+
+        self.stats.record_set()
+
+        if time.monotonic() >= self._next_sweep:
+            self.sweep()
+
+    def delete(self, key: str) -> bool:
+        return _unlink(self._value_path(key))
+
+    def invalidate(self, *tags: str) -> int:
+        removed = 0
+        for tag in tags:
+            path = self._tag_path(tag)
+            try:
+                names = set(path.read_text().split())
+            except FileNotFoundError:
+                continue
+
+            _unlink(path)
+            removed += sum(_unlink(self._values / name[:2] / name) for name in names)
+
+        return removed
+
+    def clear(self) -> None:
+        for directory in (self._values, self._tags):
+            shutil.rmtree(directory, ignore_errors=True)
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def sweep(self) -> int:
+        """
+        Remove expired values, then the oldest values beyond `max_bytes`.
+
+        Returns the number of values removed. Only one thread of a process
+        sweeps at a time; a concurrent call returns 0 right away.
+        """
+        if not self._sweep_lock.acquire(blocking=False):
+            return 0
+
+        try:
+            self._next_sweep = time.monotonic() + self.sweep_interval
+            removed = self._sweep_values()
+            self._sweep_tags()
+        finally:
+            self._sweep_lock.release()
+
+        self.stats.record_evictions(removed)
+
+        return removed
+
+    def _sweep_values(self) -> int:
+        now = time.time()
+        removed = 0
+        live: list[tuple[float, int, Path]] = []
+
+        for path in self._values.glob("*/*"):
+            try:
+                with open(path, "rb") as file:
+                    expires, _ = _PREFIX.unpack(file.read(_PREFIX.size))
+                stat = path.stat()
+            except (OSError, struct.error):
+                # Vanished, or a temporary file being written
+                continue
+
+            if expires and expires < now:
+                removed += _unlink(path)
+            else:
+                live.append((stat.st_mtime, stat.st_size, path))
+
+        if self.max_bytes is None:
+            return removed
+
+        size = sum(entry[1] for entry in live)
+        for _, entry_size, path in sorted(live):
+            if size <= self.max_bytes:
+                break
+
+            removed += _unlink(path)
+            size -= entry_size
+
+        return removed
+
+    def _sweep_tags(self) -> None:
+        for path in self._tags.iterdir():
+            try:
+                modified = path.stat().st_mtime
+                names = set(path.read_text().split())
+            except OSError:
+                continue
+
+            if any((self._values / name[:2] / name).exists() for name in names):
+                continue
+
+            # Skip tag files appended to since they were read
+            try:
+                if path.stat().st_mtime == modified:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _read(self, key: str) -> bytes | None:
+        path = self._value_path(key)
+        try:
+            with (
+                open(path, "rb") as file,
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                expires, header_length = _PREFIX.unpack_from(mapped)
+                if expires and expires < time.time():
+                    expired = True
+                else:
+                    expired = False
+                    start = _PREFIX.size + header_length
+                    header = json.loads(mapped[_PREFIX.size : start])
+                    value = mapped[start:] if header["key"] == key else None
+        except (FileNotFoundError, ValueError, struct.error):
+            return None
+        except OSError as exc:
+            raise CacheError(f"Failed to read {path}: {exc}") from exc
+
+        if expired:
+            if _unlink(path):
+                self.stats.record_evictions()
+
+            return None
+
+        return value
+
+    def _value_path(self, key: str) -> Path:
+        name = _digest(key)
+
+        return self._values / name[:2] / name
+
+    def _tag_path(self, tag: str) -> Path:
+        return self._tags / _digest(tag)
+
+
+def _digest(name: str) -> str:
+    return hashlib.blake2b(name.encode(), digest_size=20).hexdigest()
+
+
+def _unlink(path: Path) -> bool:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+
+    return True
@@ -0,0 +1,142 @@
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from .base import CacheBackend
+
+
+class _Entry(t.NamedTuple):
+    value: bytes
+    expires: float | None
+    tags: tuple[str, ...]
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache bounded by the size of its keys and values in bytes.
+
+    When a write exceeds `max_bytes`, the least recently used values are
+    evicted until it fits. Values larger than the whole budget are not stored.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        super().__init__()
+
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes held by keys and values."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires is not None:
+                if entry.expires < time.monotonic():
+                    self._remove(key)
+                    entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        self.stats.record(entry is not None)
+
+        return None if entry is None else entry.value
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        if _entry_size(key, value) > self.max_bytes:
+            return
+
+        expires = None if ttl is None else time.monotonic() + ttl
+        evicted = 0
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            entry = self._entries[key] = _Entry(value, expires, tuple(tags))
+            self._size += _entry_size(key, value)
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+
+        self.stats.record_set()
+        if evicted:
+            self.stats.record_evictions(evicted)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+
+            self._remove(key)
+
+            return True
+
+    def invalidate(self, *tags: str) -> int:
+        with self._lock:
+            keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._remove(key)
+
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+
+    # In-process operations never block, so skip the threadpool
+
+    async def aget(self, key: str) -> bytes | None:
+        return self.get(key)
+
+    async def aset(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        self.set(key, value, ttl, tags)
+
+    async def adelete(self, key: str) -> bool:
+        return self.delete(key)
+
+    async def ainvalidate(self, *tags: str) -> int:
+        return self.invalidate(*tags)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= _entry_size(key, entry.value)
+
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+def _entry_size(key: str, value: bytes) -> int:
+    return len(key.encode()) + len(value)
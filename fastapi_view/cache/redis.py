@@ -0,0 +1,243 @@
+import socket
+import threading
+import typing as t
+
+from .base import CacheBackend, CacheError
+
+RESPValue = t.Union[bytes, int, str, None, list["RESPValue"]]
+
+
+class RedisConnection:
+    """
+    Minimal client of the Redis serialization protocol (RESP2).
+
+    It speaks to Redis and to servers compatible with its protocol, such as
+    Valkey, KeyDB or DragonflyDB, without a client library. Each thread lazily
+    opens its own socket, so commands of concurrent requests never interleave.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        timeout: float | None = 5.0,
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+
+        self._local = threading.local()
+
+    def execute(self, *args: str | bytes | int | float) -> RESPValue:
+        return self.pipeline([args])[0]
+
+    def pipeline(
+        self, commands: t.Sequence[t.Sequence[str | bytes | int | float]]
+    ) -> list[RESPValue]:
+        """Send several commands in one write and read their replies in order."""
+        try:
+            file = self._connection()
+            file.write(b"".join(_encode_command(command) for command in commands))
+            file.flush()
+
+            replies = [_read_reply(file) for _ in commands]
+        except (OSError, EOFError) as exc:
+            self.close()
+            raise CacheError(f"Redis connection failed: {exc}") from exc
+
+        for reply in replies:
+            if isinstance(reply, _ErrorReply):
+                raise CacheError(f"Redis error: {reply}")
+
+        return replies
+
+    def close(self) -> None:
+        file = getattr(self._local, "file", None)
+        if file is not None:
+            self._local.file = None
+            file.close()
+            self._local.socket.close()
+
+    def _connection(self) -> t.BinaryIO:
+        file = getattr(self._local, "file", None)
+        if file is not None:
+            return file
+
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        file = sock.makefile("rwb")
+        self._local.socket, self._local.file = sock, file
+
+        setup = []
+        if self.password is not None:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            file.write(b"".join(_encode_command(command) for command in setup))
+            file.flush()
+            for _ in setup:
+                reply = _read_reply(file)
+                if isinstance(reply, _ErrorReply):
+                    self.close()
+                    raise CacheError(f"Redis error: {reply}")
+
+        return file
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache stored on a Redis-protocol server, shared by every worker.
+
+    Values expire on the server. Each tag is a set of the keys stored under
+    it, which `invalidate` deletes together with the set. Keys stored with a
+    TTL go to a tag set that expires with the longest-lived of them, through
+    `PEXPIRE` with the `NX` and `GT` options of Redis 7, so the sets do not
+    outgrow their values. All keys are prefixed with `prefix`, and `clear`
+    only removes keys with that prefix.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        prefix: str = "fastapi_view:",
+        timeout: float | None = 5.0,
+    ):
+        super().__init__()
+
+        self.prefix = prefix
+        self.connection = RedisConnection(host, port, db, password, timeout)
+
+    def get(self, key: str) -> bytes | None:
+        value = self.connection.execute("GET", self._key(key))
+        self.stats.record(value is not None)
+
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> None:
+        key = self._key(key)
+
+        if ttl is None:
+            commands = [("SET", key, value)]
+            commands += [("SADD", self._tag(tag), key) for tag in tags]
+        else:
+            milliseconds = max(int(ttl * 1000), 1)
+            commands = [("SET", key, value, "PX", milliseconds)]
+            for tag in tags:
+                tag_key = self._expiring_tag(tag)
+                commands += [
+                    ("SADD", tag_key, key),
+                    # Expire a new set, or extend a set expiring sooner
+                    ("PEXPIRE", tag_key, milliseconds, "NX"),
+                    ("PEXPIRE", tag_key, milliseconds, "GT"),
+                ]
+
+        self.connection.pipeline(commands)
+        self.stats.record_set()
+
+    def delete(self, key: str) -> bool:
+        return bool(self.connection.execute("DEL", self._key(key)))
+
+    def invalidate(self, *tags: str) -> int:
+        removed = 0
+        for tag in tags:
+            tag_keys = (self._tag(tag), self._expiring_tag(tag))
+            members = self.connection.pipeline(
+                [("SMEMBERS", tag_key) for tag_key in tag_keys]
+            )
+            keys = {key for tag_members in members for key in tag_members}
+
+            if keys:
+                deleted, _ = self.connection.pipeline(
+                    [("DEL", *keys), ("DEL", *tag_keys)]
+                )
+                removed += deleted
+            else:
+                self.connection.execute("DEL", *tag_keys)
+
+        return removed
+
+    def clear(self) -> None:
+        cursor = b"0"
+        while True:
+            cursor, keys = self.connection.execute(
+                "SCAN", cursor, "MATCH", f"{self.prefix}*", "COUNT", 1000
+            )
+            if keys:
+                self.connection.execute("DEL", *keys)
+
+            if cursor in (b"0", "0"):
+                return
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _expiring_tag(self, tag: str) -> str:
+        return f"{self.prefix}ttl-tag:{tag}"
+
+
+class _ErrorReply(str):
+    pass
+
+
+def _encode_command(command: t.Sequence[str | bytes | int | float]) -> bytes:
+    parts = [b"*%d\r\n" % len(command)]
+    for arg in command:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+
+    return b"".join(parts)
+
+
+def _read_reply(file: t.BinaryIO) -> RESPValue:
+    line = file.readline()
+    if not line.endswith(b"\r\n"):
+        raise EOFError("connection closed by the server")
+
+    kind, payload = line[:1], line[1:-2]
+
+    if kind == b"+":
+        return payload.decode()
+
+    if kind == b"-":
+        return _ErrorReply(payload.decode())
+
+    if kind == b":":
+        return int(payload)
+
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+
+        data = file.read(length + 2)
+        if len(data) != length + 2:
+            raise EOFError("connection closed by the server")
+
+        return data[:-2]
+
+    if kind == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+
+        return [_read_reply(file) for _ in range(length)]
+
+    raise CacheError(f"Unexpected Redis reply: {line!r}")
@@ -0,0 +1,298 @@
+import functools
+import hashlib
+import threading
+import typing as t
+import zlib
+from collections import OrderedDict
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from fastapi_view.config import CompressionSettings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+COMPRESSIBLE_TYPES: tuple[str, ...] = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+CacheKey = tuple[str, bytes]
+
+
+def available_encodings() -> set[str]:
+    encodings = {"gzip"}
+    if brotli is not None:
+        encodings.add("br")
+    if zstandard is not None:
+        encodings.add("zstd")
+
+    return encodings
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into quality values per coding."""
+    qualities = {}
+    for entry in header.split(","):
+        coding, *params = (part.strip() for part in entry.split(";"))
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding.lower()] = quality
+
+    return qualities
+
+
+class CompressedBodyCache:
+    """
+    LRU of compressed bodies, bounded by their total size in bytes.
+
+    Entries are keyed by (encoding, digest of the uncompressed body), so a
+    payload served repeatedly, e.g. an unchanged page being polled, is
+    compressed once.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, bytes] = OrderedDict()
+        self._size = 0
+        self.max_bytes = max_bytes
+
+    def get(self, key: CacheKey) -> bytes | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+
+            return body
+
+    def set(self, key: CacheKey, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = body
+            self._size += len(body)
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCompressor:
+    """
+    Compression of rendered responses, negotiated from Accept-Encoding.
+
+    Bodies smaller than `minimum_size` are sent as is. Compressed bodies are
+    kept in a CompressedBodyCache, and streamed bodies are compressed chunk by
+    chunk with a flush after each one, so the client can decode every chunk as
+    soon as it arrives. brotli and zstd are used when their packages
+    (`brotli`, `zstandard`) are installed.
+    """
+
+    def __init__(self, settings: CompressionSettings | None = None):
+        self.settings = settings or CompressionSettings()
+        self.cache = CompressedBodyCache(self.settings.cache_max_bytes)
+
+        available = available_encodings()
+        self.encodings = [
+            encoding for encoding in self.settings.encodings if encoding in available
+        ]
+
+        # zlib has no reset, copying a fresh object skips its setup instead
+        self._gzip = zlib.compressobj(self.settings.gzip_level, zlib.DEFLATED, 31)
+        self._local = threading.local()
+
+    def negotiate(self, request: Request) -> str | None:
+        """Pick the preferred encoding the client accepts, if any."""
+        accepted = parse_accept_encoding(request.headers.get("accept-encoding", ""))
+        wildcard = accepted.get("*", 0.0)
+
+        choices = [
+            (accepted.get(encoding, wildcard), -index, encoding)
+            for index, encoding in enumerate(self.encodings)
+        ]
+        quality, _, encoding = max(choices, default=(0.0, 0, None))
+
+        return encoding if quality > 0 else None
+
+    def compress(self, request: Request, response: Response) -> Response:
+        """Compress `response` in place for the encoding `request` accepts."""
+        if not self.settings.enabled or not self._compressible(response):
+            return response
+
+        encoding = self.negotiate(request)
+        if encoding is None:
+            return response
+
+        if isinstance(response, StreamingResponse):
+            response.body_iterator = self._compress_stream(
+                response.body_iterator, encoding
+            )
+            del response.headers["content-length"]
+        else:
+            if len(response.body) < self.settings.minimum_size:
+                return response
+
+            response.body = self.compress_body(response.body, encoding)
+            response.headers["content-length"] = str(len(response.body))
+
+        response.headers["content-encoding"] = encoding
+        add_vary(response, "Accept-Encoding")
+
+        etag = response.headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The entity tag describes the uncompressed representation
+            response.headers["etag"] = f"W/{etag}"
+
+        return response
+
+    def compress_body(self, body: bytes, encoding: str) -> bytes:
+        """Compress a complete body, served from the cache when seen before."""
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+
+        compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = self._compress(body, encoding)
+            self.cache.set(key, compressed)
+
+        return compressed
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.settings.brotli_quality)
+
+        if encoding == "zstd":
+            return self._zstd_compressor.compress(body)
+
+        compressor = self._gzip.copy()
+
+        return compressor.compress(body) + compressor.flush()
+
+    async def _compress_stream(
+        self, chunks: t.AsyncIterable[str | bytes], encoding: str
+    ) -> t.AsyncIterator[bytes]:
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=self.settings.brotli_quality)
+            process, flush = compressor.process, compressor.flush
+            finish = compressor.finish
+        elif encoding == "zstd":
+            compressor = self._zstd_compressor.compressobj()
+            process = compressor.compress
+            flush = functools.partial(
+                compressor.flush, zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+            finish = compressor.flush
+        else:
+            compressor = self._gzip.copy()
+            process = compressor.compress
+            flush = functools.partial(compressor.flush, zlib.Z_SYNC_FLUSH)
+            finish = compressor.flush
+
+        async for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+
+            compressed = process(chunk) + flush()
+            if compressed:
+                yield compressed
+
+        yield finish()
+
+    @property
+    def _zstd_compressor(self) -> t.Any:
+        # ZstdCompressor objects are reusable but not thread-safe
+        compressor = getattr(self._local, "zstd", None)
+        if compressor is None:
+            compressor = self._local.zstd = zstandard.ZstdCompressor(
+                level=self.settings.zstd_level
+            )
+
+        return compressor
+
+    def _compressible(self, response: Response) -> bool:
+        if response.status_code in (204, 304):
+            return False
+
+        if "content-encoding" in response.headers:
+            return False
+
+        content_type = response.headers.get("content-type", "")
+
+        return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+def add_vary(response: Response, header: str) -> None:
+    vary = response.headers.get("vary")
+    if vary is None:
+        response.headers["vary"] = header
+    elif header.lower() not in {value.strip().lower() for value in vary.split(",")}:
+        response.headers["vary"] = f"{vary}, {header}"
+
+
+_compressor: ResponseCompressor | None = None
+
+
+def get_compressor() -> ResponseCompressor:
+    global _compressor
+
+    if _compressor is None:
+        _compressor = ResponseCompressor()
+
+    return _compressor
+
+
+def configure_compression(**options: t.Any) -> ResponseCompressor:
+    """
+    Replace the process-wide compression settings.
+
+    Options not given are read from FV_COMPRESSION_* environment variables.
+
+    Example:
+        configure_compression(enabled=True, minimum_size=1024, gzip_level=5)
+    """
+    global _compressor
+
+    _compressor = ResponseCompressor(CompressionSettings(**options))
+
+    return _compressor
+
+
+def compress_response(request: Request, response: Response) -> Response:
+    return get_compressor().compress(request, response)
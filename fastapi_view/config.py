@@ -17,3 +17,20 @@ class ViewSettings(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
     )
+
+
+class CompressionSettings(BaseSettings):
+    enabled: bool = False
+    minimum_size: int = 500
+    encodings: list[str] = ["zstd", "br", "gzip"]
+    gzip_level: int = 6
+    brotli_quality: int = 4
+    zstd_level: int = 3
+    cache_max_bytes: int = 16 * 1024 * 1024
+
+    model_config = SettingsConfigDict(
+        env_prefix="FV_COMPRESSION_",
+        env_file=os.getenv("ENV_FILE", ".env"),
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
@@ -0,0 +1,67 @@
+import asyncio
+import contextvars
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from starlette.concurrency import run_in_threadpool
+
+from .props import CallableProp, is_async_prop
+from .singleflight import _in_event_loop
+
+executor = ThreadPoolExecutor(thread_name_prefix="fastapi-view-inertia")
+
+# Upper bound of the threads running deadline props and concurrent groups
+RENDER_MAX_WORKERS: int = 32
+
+# Props racing a render deadline, and the groups of a partial request resolved
+# concurrently, run here. Group limits wait on `executor`, which must never
+# happen from one of its own workers, and deadline props do not queue behind
+# prefetched or throttled props. The pool is bounded for the whole process, so
+# a spike of renders cannot start threads without limit.
+render_executor = ThreadPoolExecutor(
+    max_workers=RENDER_MAX_WORKERS, thread_name_prefix="fastapi-view-inertia-render"
+)
+
+# Tasks left running after their request, referenced until they finish
+_background_tasks: set[asyncio.Task] = set()
+
+
+def submit(fn: t.Callable[[], t.Any], pool: ThreadPoolExecutor = executor) -> Future:
+    """Run `fn` on the prop executor, keeping the caller's context variables."""
+    return pool.submit(contextvars.copy_context().run, fn)
+
+
+def keep_running(task: asyncio.Task) -> None:
+    """Keep a reference to a task that outlives its request until it is done."""
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def resolve_offloaded(value: t.Any) -> t.Any:
+    """
+    Resolve a prop callable from async code without blocking the event loop.
+
+    Coroutine props are awaited, sync props run in the thread pool.
+    """
+    if is_async_prop(value):
+        prop = value if isinstance(value, CallableProp) else CallableProp(value)
+
+        return await prop.resolve_async()
+
+    return await run_in_threadpool(value)
+
+
+def run_sync(awaitable: t.Awaitable) -> t.Any:
+    """
+    Wait for an awaitable from sync code on a private event loop.
+
+    On an event loop thread the private loop runs in the prop thread pool.
+    """
+
+    async def wait():
+        return await awaitable
+
+    if _in_event_loop():
+        return submit(lambda: asyncio.run(wait())).result()
+
+    return asyncio.run(wait())
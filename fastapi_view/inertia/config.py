@@ -6,6 +6,13 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class InertiaSettings(BaseSettings):
     root_template: str = "app.html"
     assets_version: str | None = None
+    prefetch_ttl: float = 10.0
+    auto_defer_threshold: float = 0.1
+    cheap_group_threshold: float | None = None
+    cheap_group_min_samples: int = 5
+    schema_check: bool = False
+    zstd_dictionary: bool = False
+    surrogate_key_header: str = "Surrogate-Key"
 
     model_config = SettingsConfigDict(
         env_prefix="FV_INERTIA_",
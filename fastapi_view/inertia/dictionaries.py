@@ -0,0 +1,209 @@
+import functools
+import json
+import threading
+import typing as t
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from .concurrency import submit
+from .enums import InertiaHeader
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+ZSTD_MEDIA_TYPE: str = "application/zstd"
+DICTIONARY_MEDIA_TYPE: str = "application/octet-stream"
+
+
+class ComponentDictionary:
+    """A zstd dictionary trained on the page objects of one component."""
+
+    def __init__(self, data: t.Any, level: int):
+        self.data = data
+        self.id = str(data.dict_id())
+        self.level = level
+
+        self._local = threading.local()
+
+    def compress(self, body: bytes) -> bytes:
+        return self._compressor.compress(body)
+
+    def as_bytes(self) -> bytes:
+        return self.data.as_bytes()
+
+    @property
+    def _compressor(self) -> t.Any:
+        # ZstdCompressor objects are reusable but not thread-safe
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(
+                level=self.level, dict_data=self.data
+            )
+
+        return compressor
+
+
+class ZstdDictionaries:
+    """
+    Per-component zstd dictionaries, trained from sampled page objects.
+
+    The page objects of a component repeat the same keys and structure, which
+    leaves little for a compressor to find in a single small body. Once
+    `samples` bodies of a component were collected, a dictionary of
+    `dict_size` bytes is trained from them and later bodies are compressed
+    against it. Training that fails, e.g. on too little data, starts another
+    round of sampling. Without the `zstandard` package nothing is sampled.
+
+    A dictionary keeps substrings of its samples verbatim and is served to any
+    client, so it is trained on the skeleton of each body only: its structure,
+    the page object keys and prop names, with every value and nested key
+    blanked out. Requests only keep a reference to their body; skeletons are
+    built and the dictionary trained on the prop executor.
+    """
+
+    def __init__(self, samples: int = 100, dict_size: int = 16 * 1024, level: int = 3):
+        self.samples = samples
+        self.dict_size = dict_size
+        self.level = level
+
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[bytes]] = {}
+        self._training: set[str] = set()
+        self._dictionaries: dict[str, ComponentDictionary] = {}
+
+    def sample(self, component: str, body: bytes) -> None:
+        if zstandard is None or component in self._dictionaries:
+            return
+
+        with self._lock:
+            if component in self._dictionaries or component in self._training:
+                return
+
+            samples = self._samples.setdefault(component, [])
+            samples.append(body)
+            if len(samples) < self.samples:
+                return
+
+            del self._samples[component]
+            self._training.add(component)
+
+        submit(functools.partial(self._train, component, samples))
+
+    def get(self, component: str) -> ComponentDictionary | None:
+        return self._dictionaries.get(component)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._training.clear()
+            self._dictionaries.clear()
+
+    def _train(self, component: str, bodies: list[bytes]) -> None:
+        skeletons = [
+            skeleton for skeleton in map(page_skeleton, bodies) if skeleton is not None
+        ]
+
+        try:
+            data = zstandard.train_dictionary(self.dict_size, skeletons)
+        except zstandard.ZstdError:
+            data = None
+
+        with self._lock:
+            # Cleared while training, e.g. to change the dictionary size
+            if component not in self._training:
+                return
+
+            self._training.discard(component)
+            if data is not None:
+                self._dictionaries[component] = ComponentDictionary(data, self.level)
+
+
+zstd_dictionaries = ZstdDictionaries()
+
+
+def page_skeleton(body: bytes) -> bytes | None:
+    """
+    The JSON structure of a page object, without its values.
+
+    Only the keys of the page object and the prop names are kept, as keys of
+    nested objects may be data too, such as a map keyed by e-mail address.
+    Blanked keys repeat, so a skeleton is JSON text but not a plain object.
+    """
+    try:
+        page = json.loads(body)
+    except ValueError:
+        return None
+
+    if not isinstance(page, dict):
+        return None
+
+    fields = []
+    for key, value in page.items():
+        if key == "props" and isinstance(value, dict):
+            skeleton = _object_skeleton(value, keep_keys=True)
+        else:
+            skeleton = _skeleton(value)
+        fields.append(f"{_dumps(key)}:{skeleton}")
+
+    return ("{" + ",".join(fields) + "}").encode("utf-8")
+
+
+def _skeleton(value: t.Any) -> str:
+    if isinstance(value, dict):
+        return _object_skeleton(value, keep_keys=False)
+
+    if isinstance(value, list):
+        return "[" + ",".join(map(_skeleton, value)) + "]"
+
+    if isinstance(value, str):
+        return '""'
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return "0"
+
+    return _dumps(value)
+
+
+def _object_skeleton(value: dict, keep_keys: bool) -> str:
+    fields = (
+        (_dumps(key) if keep_keys else '""') + ":" + _skeleton(item)
+        for key, item in value.items()
+    )
+
+    return "{" + ",".join(fields) + "}"
+
+
+def _dumps(value: t.Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def configure_zstd_dictionaries(
+    samples: int = 100, dict_size: int = 16 * 1024, level: int = 3
+) -> ZstdDictionaries:
+    """Change how dictionaries are trained, discarding trained ones."""
+    zstd_dictionaries.clear()
+    zstd_dictionaries.samples = samples
+    zstd_dictionaries.dict_size = dict_size
+    zstd_dictionaries.level = level
+
+    return zstd_dictionaries
+
+
+dictionary_router = APIRouter()
+
+
+@dictionary_router.get("/_inertia/zstd-dictionaries/{component:path}")
+def zstd_dictionary(component: str) -> Response:
+    """Download the trained dictionary of a component."""
+    dictionary = zstd_dictionaries.get(component)
+    if dictionary is None:
+        return Response(status_code=404)
+
+    return Response(
+        dictionary.as_bytes(),
+        media_type=DICTIONARY_MEDIA_TYPE,
+        headers={InertiaHeader.ZSTD_DICTIONARY: dictionary.id},
+    )
@@ -0,0 +1,394 @@
+import dataclasses
+import functools
+import json
+import secrets
+import threading
+import typing as t
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from types import GeneratorType
+
+from fastapi.encoders import ENCODERS_BY_TYPE, jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError, PydanticUndefinedType
+from starlette.concurrency import run_in_threadpool
+
+from .concurrency import run_sync
+from .props import StaticProp
+
+# Number of stream items pulled and encoded per chunk
+STREAM_BATCH_SIZE: int = 500
+
+
+class RawJSON:
+    """
+    A prop value that already is valid JSON, e.g. from a cache or a database.
+
+    The fragment is copied into the page verbatim instead of being parsed and
+    re-encoded. It is not validated: invalid JSON produces an invalid page.
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, encoded: bytes | str):
+        self.encoded = encoded.decode() if isinstance(encoded, bytes) else encoded
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.encoded!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJSON) and other.encoded == self.encoded
+
+    def __hash__(self) -> int:
+        return hash(self.encoded)
+
+
+class JSONStream:
+    """
+    A prop resolved to an iterator or async iterator, e.g. a database cursor.
+
+    Its items are encoded as a JSON array while the response is sent, so the
+    whole list is never held in memory.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterator | AsyncIterator):
+        self.items = items
+
+    def collect(self) -> list:
+        """Consume the stream into a list, for responses that cannot stream."""
+        if isinstance(self.items, AsyncIterator):
+            return run_sync(self.acollect())
+
+        return list(self.items)
+
+    async def acollect(self) -> list:
+        if isinstance(self.items, AsyncIterator):
+            return [item async for item in self.items]
+
+        return await run_in_threadpool(list, self.items)
+
+    async def iter_encoded(self, **kwargs) -> t.AsyncIterator[str]:
+        yield "["
+
+        separator = ""
+        while batch := await self._next_batch():
+            encoded = ",".join(dumps(to_jsonable(item), **kwargs) for item in batch)
+            yield separator + encoded
+            separator = ","
+
+        yield "]"
+
+    async def _next_batch(self) -> list:
+        if isinstance(self.items, AsyncIterator):
+            batch = []
+            async for item in self.items:
+                batch.append(item)
+                if len(batch) == STREAM_BATCH_SIZE:
+                    break
+
+            return batch
+
+        # Sync iterators may block on I/O, pull them in the thread pool.
+        return await run_in_threadpool(_take, self.items, STREAM_BATCH_SIZE)
+
+
+def is_stream(value: t.Any) -> bool:
+    return isinstance(value, (Iterator, AsyncIterator))
+
+
+def encode_models(value: t.Any) -> t.Any:
+    """
+    Encode a pydantic model, or a list of one model type, natively.
+
+    pydantic-core serializes these to a RawJSON fragment much faster than
+    `jsonable_encoder`, which dumps models in JSON mode too, so the output is
+    the same. Dataclasses are left to `jsonable_encoder`: it encodes their
+    fields with FastAPI's encoders (e.g. Decimal as a number), not pydantic's.
+    Other values, and models pydantic cannot serialize, are returned unchanged.
+    """
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return value
+
+        item_type = type(value[0])
+        if not _is_model_type(item_type) or any(
+            type(item) is not item_type for item in value
+        ):
+            return value
+
+        adapter = _type_adapter(
+            list[item_type] if isinstance(value, list) else tuple[item_type, ...]
+        )
+    elif _is_model_type(type(value)):
+        adapter = _type_adapter(type(value))
+    else:
+        return value
+
+    if adapter is None:
+        return value
+
+    try:
+        # jsonable_encoder serializes by alias as well
+        return RawJSON(adapter.dump_json(value, by_alias=True))
+    except PydanticSerializationError:
+        return value
+
+
+class TypeEncoders:
+    """
+    Encoders converting custom value types to JSON-ready values.
+
+    An encoder registered for a type also applies to its subclasses. The
+    encoder of a type is resolved along its MRO once and cached, so each value
+    costs a single dict lookup. Types can be registered by their qualified
+    name (e.g. "numpy.generic") to avoid importing optional libraries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._encoders: dict[type | str, t.Callable[[t.Any], t.Any]] = {}
+        self._resolved: dict[type, t.Callable[[t.Any], t.Any] | None] = {}
+        # Changes with every registration, for caches derived from the encoders
+        self.generation = 0
+
+    def register(
+        self, value_type: type | str, encoder: t.Callable[[t.Any], t.Any]
+    ) -> None:
+        with self._lock:
+            self._encoders[value_type] = encoder
+            self._resolved = {}
+            self.generation += 1
+
+    def lookup(self, value_type: type) -> t.Callable[[t.Any], t.Any] | None:
+        try:
+            return self._resolved[value_type]
+        except KeyError:
+            pass
+
+        encoder = None
+        for base in value_type.__mro__:
+            encoder = self._encoders.get(base) or self._encoders.get(
+                f"{base.__module__}.{base.__qualname__}"
+            )
+            if encoder is not None:
+                break
+
+        self._resolved[value_type] = encoder
+
+        return encoder
+
+
+type_encoders = TypeEncoders()
+
+# FastAPI's encoders, so the output matches jsonable_encoder
+for _value_type, _encoder in ENCODERS_BY_TYPE.items():
+    if _value_type not in (set, frozenset, deque, GeneratorType):
+        type_encoders.register(_value_type, _encoder)
+
+type_encoders.register(BaseModel, lambda value: _encode_model(value))
+type_encoders.register("numpy.generic", lambda value: value.item())
+type_encoders.register("numpy.ndarray", lambda value: value.tolist())
+
+
+def register_encoder(
+    value_type: type | str, encoder: t.Callable[[t.Any], t.Any]
+) -> None:
+    type_encoders.register(value_type, encoder)
+
+
+_JSON_TYPES = frozenset({str, int, float, bool, type(None)})
+_PRE_ENCODED_TYPES = frozenset({RawJSON, JSONStream, StaticProp})
+_SEQUENCE_TYPES = (list, tuple, set, frozenset, deque, GeneratorType)
+
+
+def to_jsonable(value: t.Any) -> t.Any:
+    """
+    Convert a value to JSON-ready data, like `jsonable_encoder`.
+
+    Custom types are encoded through `type_encoders`; raw fragments, streams
+    and static data are left in place. Dataclasses and other objects are
+    converted to dicts like `jsonable_encoder` does, with their fields encoded
+    through the registry as well.
+    """
+    value_type = type(value)
+    if value_type in _JSON_TYPES or value_type in _PRE_ENCODED_TYPES:
+        return value
+
+    if value_type is dict:
+        return _dict_to_jsonable(value)
+
+    if value_type is list or value_type is tuple:
+        return [to_jsonable(item) for item in value]
+
+    encoder = type_encoders.lookup(value_type)
+    if encoder is not None:
+        return to_jsonable(encoder(value))
+
+    if isinstance(value, dict):
+        return _dict_to_jsonable(value)
+
+    if isinstance(value, _SEQUENCE_TYPES):
+        return [to_jsonable(item) for item in value]
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: to_jsonable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+
+    return _object_to_jsonable(value)
+
+
+def _object_to_jsonable(value: t.Any) -> t.Any:
+    # The last resort of jsonable_encoder, encoding the data it finds here
+    if isinstance(value, (str, int, float, PydanticUndefinedType)):
+        return jsonable_encoder(value)
+
+    try:
+        data = dict(value)
+    except Exception:
+        try:
+            data = vars(value)
+        except Exception:
+            # Let jsonable_encoder report the value that cannot be encoded
+            return jsonable_encoder(value, custom_encoder=_CUSTOM_ENCODERS)
+
+    return _dict_to_jsonable(data)
+
+
+def _dict_to_jsonable(value: dict) -> dict:
+    return {
+        key if type(key) is str else to_jsonable(key): to_jsonable(item)
+        for key, item in value.items()
+        # jsonable_encoder drops SQLAlchemy internals by default as well
+        if not (type(key) is str and key.startswith("_sa"))
+    }
+
+
+def dumps(value: t.Any, **kwargs) -> str:
+    """
+    Serialize a JSON-ready value like `json.dumps`, splicing RawJSON fragments.
+
+    Streams are consumed and written as arrays.
+    """
+    return "".join(_serialize(value, streaming=False, **kwargs))
+
+
+async def iter_dumps(value: t.Any, **kwargs) -> t.AsyncIterator[str]:
+    """Serialize like `dumps`, encoding streams incrementally as they are read."""
+    for segment in _serialize(value, streaming=True, **kwargs):
+        if isinstance(segment, JSONStream):
+            async for chunk in segment.iter_encoded(**kwargs):
+                yield chunk
+        else:
+            yield segment
+
+
+def _serialize(value: t.Any, streaming: bool, **kwargs) -> list[str | JSONStream]:
+    """
+    Encode `value`, returning text segments with streams left in between.
+
+    RawJSON fragments (and streams when `streaming`) are first written as
+    unique placeholder strings, which are then replaced in the output.
+    """
+    fragments: list[RawJSON | JSONStream] = []
+    nonce = secrets.token_hex(8)
+
+    def default(obj: t.Any) -> t.Any:
+        if isinstance(obj, StaticProp):
+            return obj.value
+
+        if isinstance(obj, JSONStream) and not streaming:
+            return [to_jsonable(item) for item in obj.collect()]
+
+        if not isinstance(obj, (RawJSON, JSONStream)):
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            )
+
+        fragments.append(obj)
+
+        return f"{nonce}:{len(fragments) - 1}"
+
+    encoded = json.dumps(value, default=default, **kwargs)
+    if not fragments:
+        return [encoded]
+
+    parts = encoded.split(f'"{nonce}:')
+    segments = [parts[0]]
+    for part in parts[1:]:
+        index, rest = part.split('"', 1)
+        fragment = fragments[int(index)]
+        segments.append(fragment.encoded if isinstance(fragment, RawJSON) else fragment)
+        segments.append(rest)
+
+    return segments
+
+
+_JSON_RESPONSE_OPTIONS = {
+    "ensure_ascii": False,
+    "allow_nan": False,
+    "indent": None,
+    "separators": (",", ":"),
+}
+
+
+class InertiaJSONResponse(JSONResponse):
+    """JSON response that splices RawJSON fragments into its content."""
+
+    def render(self, content: t.Any) -> bytes:
+        return dumps(content, **_JSON_RESPONSE_OPTIONS).encode("utf-8")
+
+
+class InertiaStreamingResponse(StreamingResponse):
+    """JSON response encoding the streams of a page while it is sent."""
+
+    media_type = "application/json"
+
+    def __init__(self, content: t.Any, **kwargs):
+        super().__init__(self._encode(content), **kwargs)
+
+    @staticmethod
+    async def _encode(content: t.Any) -> t.AsyncIterator[bytes]:
+        async for chunk in iter_dumps(content, **_JSON_RESPONSE_OPTIONS):
+            yield chunk.encode("utf-8")
+
+
+def _keep(value: t.Any) -> t.Any:
+    return value
+
+
+def _encode_model(value: BaseModel) -> t.Any:
+    encoded = encode_models(value)
+    if encoded is value:
+        return jsonable_encoder(value)
+
+    return encoded
+
+
+_CUSTOM_ENCODERS = {
+    RawJSON: _keep,
+    JSONStream: _keep,
+    StaticProp: _keep,
+    BaseModel: _encode_model,
+}
+
+
+def _is_model_type(value_type: type) -> bool:
+    return issubclass(value_type, BaseModel)
+
+
+@functools.cache
+def _type_adapter(annotation: t.Any) -> TypeAdapter | None:
+    try:
+        return TypeAdapter(annotation)
+    except Exception:
+        # Models with fields pydantic has no schema for
+        return None
+
+
+def _take(items: Iterator, count: int) -> list:
+    return [item for _, item in zip(range(count), items)]
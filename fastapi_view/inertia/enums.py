@@ -8,6 +8,10 @@ class InertiaHeader(StrEnum):
     PARTIAL_ONLY = "X-Inertia-Partial-Data"
     PARTIAL_EXCEPT = "X-Inertia-Partial-Except"
     PARTIAL_COMPONENT = "X-Inertia-Partial-Component"
+    PARTIAL_GROUPS = "X-Inertia-Partial-Groups"
+    EXCEPT_ONCE_PROPS = "X-Inertia-Except-Once-Props"
+    PROP_HASHES = "X-Inertia-Prop-Hashes"
+    ZSTD_DICTIONARY = "X-Inertia-Zstd-Dictionary"
 
     @classmethod
     def values(cls):
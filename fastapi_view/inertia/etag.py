@@ -0,0 +1,30 @@
+import hashlib
+
+IF_NONE_MATCH_HEADER: str = "If-None-Match"
+ETAG_HEADER: str = "ETag"
+
+
+def make_etag(*parts: str | bytes | None) -> str:
+    """Hash the given parts into a quoted strong entity tag."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if part is None:
+            part = b""
+        elif isinstance(part, str):
+            part = part.encode()
+
+        # Length-prefix the parts so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an entity tag (weak comparison)."""
+    if not if_none_match:
+        return False
+
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+    return "*" in candidates or etag.removeprefix("W/") in candidates
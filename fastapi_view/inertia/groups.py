@@ -0,0 +1,178 @@
+import asyncio
+import threading
+import time
+import typing as t
+from collections import deque
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from .concurrency import submit
+from .props import CallableProp, is_async_prop
+
+NO_FALLBACK = object()
+
+
+class GroupLimits:
+    """
+    Throttling for the deferred props of one group, shared by the process.
+
+    At most `max_concurrency` props of the group resolve at the same time.
+    A prop that cannot get a slot and finish within `timeout` seconds resolves
+    to `fallback` (called if callable) or, without one, to a structured error.
+    A timed-out sync computation keeps its slot until it actually finishes, so
+    abandoned work still counts against the limit; one still queued on the
+    executor is cancelled instead. Tasks waiting for a slot are woken when one
+    is released.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        fallback: t.Any = NO_FALLBACK,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.fallback = fallback
+
+        self._slots = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+        # Tasks waiting for a slot, with the event loop each one runs on
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._waiters_lock = threading.Lock()
+
+    def run(self, group: str, prop: CallableProp) -> t.Any:
+        deadline = self._deadline()
+
+        if self._slots is not None and not self._slots.acquire(
+            timeout=self._remaining(deadline)
+        ):
+            return self._timed_out(group)
+
+        if self.timeout is None:
+            try:
+                return prop()
+            finally:
+                self._release()
+
+        future = submit(prop)
+        future.add_done_callback(lambda _: self._release())
+
+        try:
+            return future.result(self._remaining(deadline))
+        except FutureTimeoutError:
+            # Not started yet, do not load the backend when nobody waits
+            future.cancel()
+            return self._timed_out(group)
+
+    async def run_async(self, group: str, prop: CallableProp) -> t.Any:
+        deadline = self._deadline()
+
+        if not await self._acquire_async(deadline):
+            return self._timed_out(group)
+
+        if is_async_prop(prop):
+            try:
+                return await asyncio.wait_for(
+                    prop.resolve_async(), self._remaining(deadline)
+                )
+            except asyncio.TimeoutError:
+                return self._timed_out(group)
+            finally:
+                self._release()
+
+        future = submit(prop)
+        future.add_done_callback(lambda _: self._release())
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)), self._remaining(deadline)
+            )
+        except asyncio.TimeoutError:
+            future.cancel()
+            return self._timed_out(group)
+
+    async def _acquire_async(self, deadline: float | None) -> bool:
+        if self._slots is None:
+            return True
+
+        # Wait for a release instead of blocking a worker thread, which could
+        # leak a slot when the waiting task is cancelled.
+        loop = asyncio.get_running_loop()
+        while not self._slots.acquire(blocking=False):
+            waiter = loop.create_future()
+            with self._waiters_lock:
+                self._waiters.append((loop, waiter))
+
+            try:
+                # A slot released before the waiter was added wakes nobody
+                if self._slots.acquire(blocking=False):
+                    return True
+
+                await asyncio.wait_for(waiter, self._remaining(deadline))
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                # A wake-up still on its way is passed on by _wake
+                waiter.cancel()
+                with self._waiters_lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+
+        return True
+
+    def _release(self) -> None:
+        if self._slots is None:
+            return
+
+        self._slots.release()
+        self._notify()
+
+    def _notify(self) -> None:
+        with self._waiters_lock:
+            if not self._waiters:
+                return
+
+            loop, waiter = self._waiters.popleft()
+
+        try:
+            loop.call_soon_threadsafe(self._wake, waiter)
+        except RuntimeError:
+            # The waiter's loop is closed, hand the slot to the next one
+            self._notify()
+
+    def _wake(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # Timed out or cancelled meanwhile, the next waiter takes the slot
+            self._notify()
+        else:
+            waiter.set_result(None)
+
+    def _deadline(self) -> float | None:
+        return None if self.timeout is None else time.monotonic() + self.timeout
+
+    def _remaining(self, deadline: float | None) -> float | None:
+        return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+    def _timed_out(self, group: str) -> t.Any:
+        if self.fallback is NO_FALLBACK:
+            return {"error": "timeout", "group": group, "timeout": self.timeout}
+
+        return self.fallback() if callable(self.fallback) else self.fallback
+
+
+group_limits: dict[str, GroupLimits] = {}
+
+
+def configure_group(
+    group: str,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+    fallback: t.Any = NO_FALLBACK,
+) -> GroupLimits:
+    limits = group_limits[group] = GroupLimits(max_concurrency, timeout, fallback)
+
+    return limits
@@ -0,0 +1,55 @@
+import hashlib
+
+from .encoder import JSONStream, RawJSON, dumps
+
+# Components whose props carry content hashes
+hashed_components: set[str] = set()
+
+
+def hash_props(component: str) -> None:
+    hashed_components.add(component)
+
+
+def prop_hash(encoded: str) -> str:
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def parse_prop_hashes(header: str) -> dict[str, str]:
+    """Parse a `key=hash,key=hash` request header."""
+    hashes = {}
+    for entry in header.split(","):
+        key, _, digest = entry.strip().partition("=")
+        if key and digest:
+            hashes[key] = digest
+
+    return hashes
+
+
+def apply_prop_hashes(
+    props: dict, known: dict[str, str]
+) -> tuple[dict[str, str], list[str]]:
+    """
+    Hash the encoded props, dropping those the client already has.
+
+    Each prop is encoded once into a RawJSON fragment that is both hashed and
+    sent, so hashing does not add a second encoding pass. Streams are sent
+    without a hash. Returns the hashes of all hashed props and the keys of the
+    props removed because their hash is in `known`.
+    """
+    hashes: dict[str, str] = {}
+    unchanged: list[str] = []
+
+    for key, value in list(props.items()):
+        if isinstance(value, JSONStream):
+            continue
+
+        encoded = dumps(value, ensure_ascii=False)
+        digest = hashes[key] = prop_hash(encoded)
+
+        if known.get(key) == digest:
+            del props[key]
+            unchanged.append(key)
+        else:
+            props[key] = RawJSON(encoded)
+
+    return hashes, unchanged
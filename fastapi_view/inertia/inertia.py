@@ -1,18 +1,78 @@
-import json
+import asyncio
+import functools
+import secrets
+import time
 import typing as t
+from concurrent.futures import wait
+from functools import cached_property
 
 from fastapi import Request
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
+from ..compression import add_vary, compress_response
 from ..view import ViewContext
 from ..vite.extension import ViteExtension
+from .concurrency import keep_running, render_executor, resolve_offloaded, submit
 from .config import InertiaSettings
+from .encoder import (
+    InertiaJSONResponse,
+    InertiaStreamingResponse,
+    JSONStream,
+    RawJSON,
+    dumps,
+    encode_models,
+    is_stream,
+    register_encoder,
+    to_jsonable,
+)
+from .dictionaries import ZSTD_MEDIA_TYPE, zstd_dictionaries
 from .enums import InertiaHeader
-from .props import CallableProp, DeferredProp, IgnoreFirstLoad, MergeProp, OptionalProp
+from .etag import ETAG_HEADER, IF_NONE_MATCH_HEADER, etag_matches, make_etag
+from .groups import NO_FALLBACK, GroupLimits, configure_group, group_limits
+from .hashes import apply_prop_hashes, hash_props, hashed_components, parse_prop_hashes
+from .page_cache import PAGE_CACHE_SCOPE_KEY, cache_page, page_cache
+from .props import (
+    AutoProp,
+    CallableProp,
+    CoalescedProp,
+    DeferredProp,
+    IgnoreFirstLoad,
+    MergeProp,
+    OnceProp,
+    OptionalProp,
+    PrefetchedProp,
+    ResolvedProp,
+    StaticProp,
+    is_async_prop,
+)
+from .plan import PropPaths, PropsPlan, parse_paths, prune
+from .prefetch import PrefetchKey, prefetch_cache
+from .schemas import ComponentSchema, component_schemas, register_component
+from .shared import SharedProvider, share_provider, shared_providers
+from .stats import latency_stats
 
 REQUEST_SESSION_KEY: str = "session"
 FLASH_PROPS_KEY: str = "flash"
+PREFETCH_SESSION_KEY: str = "_inertia_prefetch"
+DEADLINE_GROUP: str = "deadline"
+# Share of a render deadline that props known to be fast may spend inline
+INLINE_DEADLINE_SHARE: float = 0.5
+# Latency samples before a prop counts as known to be fast
+KNOWN_FAST_MIN_SAMPLES: int = 5
+MERGED_GROUP_SEPARATOR: str = "+"
+FLASHED_CACHE_CONTROL: str = "private, no-cache"
+
+# Request headers the JSON responses of a page differ by
+VARY_HEADERS: tuple[str, ...] = (
+    InertiaHeader.INERTIA,
+    InertiaHeader.PARTIAL_COMPONENT,
+    InertiaHeader.PARTIAL_ONLY,
+    InertiaHeader.PARTIAL_EXCEPT,
+    InertiaHeader.PARTIAL_GROUPS,
+    InertiaHeader.EXCEPT_ONCE_PROPS,
+)
 
 
 class PageObject(t.TypedDict, total=False):
@@ -27,6 +87,9 @@ class PageObject(t.TypedDict, total=False):
     prependProps: list[str]
     deepMergeProps: list[str]
     matchPropsOn: dict[str, str]
+    onceProps: dict[str, dict]
+    propHashes: dict[str, str]
+    unchangedProps: list[str]
 
 
 class InertiaShare:
@@ -36,6 +99,33 @@ class InertiaShare:
     def share(self, key: str, value: t.Any):
         self._share[key] = value
 
+    @staticmethod
+    def share_provider(
+        key: str, provider: t.Callable[[Request], t.Any], static: bool = False
+    ) -> SharedProvider:
+        """
+        Share a prop with every Inertia response of the app.
+
+        The provider is only called when the prop is sent, at most once per
+        request. Props shared on the request with `share()` take precedence.
+
+        Args:
+            key: Shared prop key
+            provider: Function or coroutine function taking the request;
+                coroutine functions require `render_async`
+            static: Whether the value is the same for every request; it is
+                then computed and encoded once and reused
+
+        Returns:
+            SharedProvider instance
+
+        Example:
+            Inertia.share_provider('auth', lambda request: get_auth(request))
+            Inertia.share_provider('config', load_app_config, static=True)
+        """
+
+        return share_provider(key, provider, static)
+
 
 class InertiaProp:
     @staticmethod
@@ -104,11 +194,251 @@ class InertiaProp:
 
         return MergeProp(prop).deep_merge()
 
+    @staticmethod
+    def coalesce(prop: t.Any, key: str) -> CoalescedProp:
+        """
+        Create a property whose computation is shared across concurrent requests.
+
+        Args:
+            prop: Callable (sync or async) or value to coalesce
+            key: Identifies the computation; use a key that covers everything
+                the result depends on, never one shared by per-user data
+
+        Returns:
+            CoalescedProp instance
+
+        Example:
+            Inertia.defer(
+                Inertia.coalesce(get_statistics, key="dashboard.statistics"),
+                group="analytics",
+            )
+        """
+
+        return CoalescedProp(prop, key)
+
+    @staticmethod
+    def once(prop: t.Any, key: str | None = None, ttl: float | None = None) -> OnceProp:
+        """
+        Create a property that the client keeps across navigations.
+
+        Args:
+            prop: Callable or value resolved only when the client lacks it
+            key: Key the client stores the value under, defaults to the prop
+                name; pages sharing a key share the client-side value
+            ttl: Seconds after which the client should fetch the value again
+
+        Returns:
+            OnceProp instance
+
+        Example:
+            Inertia.once(lambda: get_organizations(), key='organizations')
+        """
+
+        return OnceProp(prop, key, ttl)
+
+    @staticmethod
+    def auto(prop: t.Any, group: str = "auto") -> AutoProp:
+        """
+        Create a property that is deferred only once it has become slow.
+
+        The prop is resolved inline while the p95 of its measured resolution
+        latency stays below FV_INERTIA_AUTO_DEFER_THRESHOLD seconds, and is
+        sent as a deferred prop of `group` otherwise.
+
+        Args:
+            prop: Callable or value to resolve
+            group: Deferred group used when the prop is deferred
+
+        Returns:
+            AutoProp instance
+
+        Example:
+            Inertia.auto(lambda: get_statistics(), group='analytics')
+        """
+
+        return AutoProp(prop, group)
+
+    @staticmethod
+    def configure_group(
+        group: str,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        fallback: t.Any = NO_FALLBACK,
+    ) -> GroupLimits:
+        """
+        Throttle the deferred props of a group for the whole process.
+
+        Args:
+            group: Deferred group name
+            max_concurrency: Maximum number of the group's props resolving at once
+            timeout: Seconds a prop may wait for a slot and resolve in total
+            fallback: Value (or callable) used when the timeout is exceeded;
+                without it, timed-out props resolve to
+                {"error": "timeout", "group": ..., "timeout": ...}
+
+        Returns:
+            GroupLimits instance
+
+        Example:
+            Inertia.configure_group('analytics', max_concurrency=4, timeout=2.0)
+        """
+
+        return configure_group(group, max_concurrency, timeout, fallback)
+
+    @staticmethod
+    def register_component(component: str, props: type) -> ComponentSchema:
+        """
+        Declare the props schema of a component.
+
+        One serializer per declared prop is built once and used to encode the
+        component's props, skipping generic type dispatch. With
+        FV_INERTIA_SCHEMA_CHECK enabled (e.g. in development), props that do
+        not match their declared type raise PropsSchemaError.
+
+        Args:
+            component: Frontend page component name
+            props: TypedDict or pydantic model whose fields are the prop keys
+
+        Returns:
+            ComponentSchema instance
+
+        Example:
+            Inertia.register_component('Contacts/Index', ContactsIndexProps)
+        """
+
+        return register_component(component, props)
+
+    @staticmethod
+    def cache_page(
+        ttl: float = 60.0,
+        vary_by: t.Mapping[str, t.Callable[[Request], t.Any]] | None = None,
+        tags: t.Iterable[str] = (),
+    ) -> t.Callable:
+        """
+        Decorate an endpoint to serve its serialized pages from a cache.
+
+        Pages are keyed by URL, partial reload headers, assets version and
+        the `vary_by` segments. Hits skip the endpoint entirely.
+
+        Args:
+            ttl: Seconds a page is served from the cache
+            vary_by: Named functions of the request selecting separate pages,
+                such as the user's role, locale or tenant
+            tags: Tags for invalidating the pages with `Inertia.invalidate_pages`
+
+        Returns:
+            Endpoint decorator
+
+        Example:
+            @app.get('/reports')
+            @Inertia.cache_page(ttl=300, vary_by={'role': get_role}, tags=['reports'])
+            def reports(inertia: InertiaDepends): ...
+        """
+
+        return cache_page(ttl, vary_by, tags)
+
+    @staticmethod
+    def invalidate_pages(*tags: str) -> int:
+        """
+        Drop the cached pages carrying any of the tags.
+
+        Every page is also tagged `component:<name>` with its component.
+
+        Returns:
+            Number of pages dropped
+
+        Example:
+            Inertia.invalidate_pages('reports', 'component:Reports/Index')
+        """
+
+        return page_cache.invalidate(*tags)
+
+    @staticmethod
+    def hash_props(component: str) -> None:
+        """
+        Send content hashes with the props of a component.
+
+        Responses list a hash of each prop under `propHashes`. A client echoing
+        them in the X-Inertia-Prop-Hashes header (`key=hash,...`) on a partial
+        reload gets the props whose hash is unchanged omitted from the
+        response and listed under `unchangedProps`, so it keeps its own copy.
+
+        Args:
+            component: Frontend page component name
+
+        Example:
+            Inertia.hash_props('Orders/Index')
+        """
+
+        hash_props(component)
+
+    @staticmethod
+    def register_encoder(
+        value_type: type | str, encoder: t.Callable[[t.Any], t.Any]
+    ) -> None:
+        """
+        Encode values of a custom type (and its subclasses) in page props.
+
+        The encoder of each value type is resolved once and cached, instead of
+        being looked up through an isinstance chain for every value.
+
+        Args:
+            value_type: Type, or its qualified name to avoid an import
+            encoder: Function converting a value to JSON-ready data
+
+        Example:
+            Inertia.register_encoder(Money, lambda money: str(money.amount))
+            Inertia.register_encoder('numpy.float32', float)
+        """
+
+        register_encoder(value_type, encoder)
+
+    @staticmethod
+    def static(value: t.Any) -> StaticProp:
+        """
+        Mark plain JSON data that contains no props, to skip its traversal.
+
+        Large settings trees or JSON blobs are then neither searched for
+        callables nor copied dict by dict on every request.
+
+        Args:
+            value: Data made of dicts, lists, strings, numbers, booleans and None
+
+        Returns:
+            StaticProp instance
+
+        Example:
+            Inertia.static(SETTINGS_TREE)
+        """
+
+        return StaticProp(value)
+
+    @staticmethod
+    def raw(encoded: bytes | str) -> RawJSON:
+        """
+        Create a property from ready-made JSON, sent without re-encoding.
+
+        Args:
+            encoded: Valid JSON document, e.g. from a cache or a database
+
+        Returns:
+            RawJSON instance
+
+        Example:
+            Inertia.raw(redis.get('reports:summary'))
+        """
+
+        return RawJSON(encoded)
+
 
 class Inertia(InertiaShare, InertiaProp):
     _view: ViewContext
 
     _component: str | None = None
+    _cache_control: str | None = None
+    _surrogate_keys: tuple[str, ...] = ()
+    _flashed: bool = False
+    _deadline: float | None = None
 
     def __init__(self, request: Request):
         super().__init__()
@@ -132,58 +462,337 @@ class Inertia(InertiaShare, InertiaProp):
     def _is_partial_request(self) -> bool:
         return (
             InertiaHeader.PARTIAL_ONLY in self._request.headers
-            and self._component
-            == self._request.headers.get(InertiaHeader.PARTIAL_COMPONENT)
+            or InertiaHeader.PARTIAL_GROUPS in self._request.headers
+        ) and self._component == self._request.headers.get(
+            InertiaHeader.PARTIAL_COMPONENT
         )
 
-    @property
-    def _partial_only_keys(self) -> list[str]:
-        keys = self._request.headers.get(InertiaHeader.PARTIAL_ONLY, "").split(",")
+    @cached_property
+    def _partial_only_keys(self) -> frozenset[str]:
+        return self._parse_header_list(InertiaHeader.PARTIAL_ONLY)
+
+    @cached_property
+    def _partial_except_keys(self) -> frozenset[str]:
+        return self._parse_header_list(InertiaHeader.PARTIAL_EXCEPT)
+
+    @cached_property
+    def _partial_only_paths(self) -> PropPaths:
+        return parse_paths(self._partial_only_keys)
+
+    @cached_property
+    def _partial_except_paths(self) -> PropPaths:
+        return parse_paths(self._partial_except_keys)
+
+    @cached_property
+    def _partial_groups(self) -> frozenset[str]:
+        # Groups merged by the cheap group optimizer are named "a+b"
+        return frozenset(
+            group
+            for merged in self._parse_header_list(InertiaHeader.PARTIAL_GROUPS)
+            for group in merged.split(MERGED_GROUP_SEPARATOR)
+        )
 
-        return list(map(lambda s: s.strip(), keys))
+    @cached_property
+    def _except_once_keys(self) -> frozenset[str]:
+        return self._parse_header_list(InertiaHeader.EXCEPT_ONCE_PROPS)
+
+    def _parse_header_list(self, header: str) -> frozenset[str]:
+        """Parse a comma-separated request header once per request."""
+        values = self._request.headers.get(header, "").split(",")
+
+        return frozenset(value for value in map(str.strip, values) if value)
+
+    def render(
+        self,
+        component: str,
+        props: dict | None = None,
+        prefetch_deferred: bool = False,
+        deadline: float | None = None,
+        etag: str | None = None,
+        cache_control: str | None = None,
+        surrogate_keys: t.Iterable[str] = (),
+    ) -> Response:
+        """
+        Render an Inertia page.
 
-    @property
-    def _partial_except_keys(self) -> list[str]:
-        keys = self._request.headers.get(InertiaHeader.PARTIAL_EXCEPT, "").split(",")
+        Args:
+            component: Frontend page component name
+            props: Page props
+            prefetch_deferred: Start computing deferred prop groups in the
+                background once the initial response is sent, so the client's
+                follow-up partial requests are served from memory
+            deadline: Time budget in seconds for resolving props on the
+                initial load; callables still running when it runs out are
+                turned into deferred props of the "deadline" group
+            etag: Cheap version token of the page content, e.g. the latest
+                `updated_at` of the listed rows. Inertia visits are answered
+                with `304 Not Modified` from it without resolving any props;
+                without it the ETag is a hash of the serialized page
+            cache_control: Cache-Control header of the response, e.g.
+                "public, s-maxage=300" for pages a CDN may cache
+            surrogate_keys: Keys for purging the cached page from a CDN,
+                sent in the FV_INERTIA_SURROGATE_KEY_HEADER header
+        """
+        self._component = component
+        self._cache_control = cache_control
+        self._surrogate_keys = tuple(surrogate_keys)
+        self._deadline = deadline
+        etag = self._version_etag(etag)
+        if etag is not None and self._is_not_modified(etag):
+            return self._not_modified(etag)
+
+        plan = self._plan_props(self._page_props(props or {}))
+        if deadline is not None:
+            self._defer_after_deadline(plan, deadline)
+
+        page_object = self._compose_page_object(plan, self._resolve_plan(plan))
+        background = (
+            self._prefetch_deferred_groups(plan, use_async=False)
+            if prefetch_deferred
+            else None
+        )
 
-        return list(map(lambda s: s.strip(), keys))
+        return self._make_response(page_object, background, etag)
+
+    async def render_async(
+        self,
+        component: str,
+        props: dict | None = None,
+        prefetch_deferred: bool = False,
+        deadline: float | None = None,
+        etag: str | None = None,
+        cache_control: str | None = None,
+        surrogate_keys: t.Iterable[str] = (),
+    ) -> Response:
+        """
+        Render like `render`, awaiting async prop callables concurrently.
 
-    def render(self, component: str, props: dict | None = None) -> Response:
+        Use from `async def` endpoints when props are coroutine functions.
+        """
         self._component = component
+        self._cache_control = cache_control
+        self._surrogate_keys = tuple(surrogate_keys)
+        self._deadline = deadline
+        etag = self._version_etag(etag)
+        if etag is not None and self._is_not_modified(etag):
+            return self._not_modified(etag)
+
+        plan = self._plan_props(self._page_props(props or {}))
+        if deadline is not None:
+            await self._defer_after_deadline_async(plan, deadline)
+
+        page_object = self._compose_page_object(
+            plan, await self._resolve_plan_async(plan)
+        )
+        if InertiaHeader.INERTIA not in self._request.headers:
+            # Read async streams here, the HTML page is rendered in one piece
+            props = page_object["props"]
+            for key in self._streamed_props(page_object):
+                props[key] = to_jsonable(await props[key].acollect())
+        background = (
+            self._prefetch_deferred_groups(plan, use_async=True)
+            if prefetch_deferred
+            else None
+        )
 
-        page_object = self._build_page_object(props or {})
+        return self._make_response(page_object, background, etag)
 
+    def _make_response(
+        self,
+        page_object: dict,
+        background: BackgroundTask | None = None,
+        etag: str | None = None,
+    ) -> Response:
         if InertiaHeader.INERTIA in self._request.headers:
-            return JSONResponse(
+            if self._streamed_props(page_object):
+                response = InertiaStreamingResponse(
+                    content=page_object,
+                    headers=self._inertia_headers,
+                    background=background,
+                )
+                if etag is not None:
+                    response.headers[ETAG_HEADER] = etag
+
+                return compress_response(self._request, response)
+
+            response = InertiaJSONResponse(
                 content=page_object,
-                headers={
-                    InertiaHeader.INERTIA: "True",
-                    "Vary": "Accept",
-                },
+                headers=self._inertia_headers,
+                background=background,
+            )
+            # A version token was already checked before resolving
+            revalidate = etag is None
+            if revalidate:
+                etag = make_etag(response.body)
+            response.headers[ETAG_HEADER] = etag
+
+            # Stored even for a 304, polling clients always revalidate
+            self._store_cached_page(response)
+            if revalidate and self._is_not_modified(etag):
+                return self._not_modified(etag, response.background)
+
+            if self._settings.zstd_dictionary:
+                self._compress_with_dictionary(response)
+
+            return compress_response(self._request, response)
+
+        response = self._view.render(
+            self._root_template,
+            {"page": dumps(page_object)},
+            headers={"Vary": InertiaHeader.INERTIA, **self._cache_headers},
+            background=background,
+            compress=False,
+        )
+        self._store_cached_page(response)
+
+        return compress_response(self._request, response)
+
+    def _store_cached_page(self, response: Response) -> None:
+        """Store the page for `cache_page` endpoints, before it is compressed."""
+        target = self._request.scope.get(PAGE_CACHE_SCOPE_KEY)
+        if target is None or self._flashed or response.status_code != 200:
+            return
+
+        target.store(self._component, response)
+
+    def _compress_with_dictionary(self, response: Response) -> None:
+        """Compress the body with the component's trained zstd dictionary."""
+        zstd_dictionaries.sample(self._component, response.body)
+        add_vary(response, InertiaHeader.ZSTD_DICTIONARY)
+
+        dictionary = zstd_dictionaries.get(self._component)
+        if dictionary is None:
+            return
+
+        # Tells clients without it which dictionary to fetch
+        response.headers[InertiaHeader.ZSTD_DICTIONARY] = dictionary.id
+        if self._request.headers.get(InertiaHeader.ZSTD_DICTIONARY) != dictionary.id:
+            return
+
+        response.body = dictionary.compress(response.body)
+        response.headers["content-length"] = str(len(response.body))
+        response.headers["content-type"] = ZSTD_MEDIA_TYPE
+
+        etag = response.headers.get(ETAG_HEADER)
+        if etag and not etag.startswith("W/"):
+            # The entity tag describes the uncompressed page
+            response.headers[ETAG_HEADER] = f"W/{etag}"
+
+    @property
+    def _inertia_headers(self) -> dict[str, str]:
+        vary = VARY_HEADERS
+        if self._component in hashed_components:
+            vary += (InertiaHeader.PROP_HASHES,)
+
+        return {
+            InertiaHeader.INERTIA: "True",
+            "Vary": ", ".join(vary),
+            **self._cache_headers,
+        }
+
+    @property
+    def _cache_headers(self) -> dict[str, str]:
+        headers = {}
+        if self._cache_control is not None:
+            # Flash messages belong to one session, keep them out of shared caches
+            headers["Cache-Control"] = (
+                FLASHED_CACHE_CONTROL if self._flashed else self._cache_control
             )
 
-        return self._view.render(self._root_template, {"page": json.dumps(page_object)})
+        if self._surrogate_keys:
+            headers[self._settings.surrogate_key_header] = " ".join(
+                self._surrogate_keys
+            )
 
-    def _build_page_object(self, props: dict) -> dict:
-        # Resolve metadata configurations (only for initial loads)
-        deferred_props = self._resolve_deferred_props(props)
-        merge_props = self._resolve_merge_props(props)
+        return headers
 
-        # Get flash messages
-        flash_props = self._get_flash_props()
+    def _version_etag(self, token: str | None) -> str | None:
+        """Derive the ETag of an Inertia visit from an endpoint version token."""
+        if token is None or InertiaHeader.INERTIA not in self._request.headers:
+            return None
 
-        # Resolve all props
-        resolved_props = self._resolve_props(props)
+        headers = self._request.headers
+
+        # The same token covers every variant of the page, so tell them apart
+        return make_etag(
+            self._component,
+            token,
+            str(self._request.url),
+            self._assets_version,
+            *(
+                headers.get(header, "")
+                for header in (
+                    InertiaHeader.PARTIAL_COMPONENT,
+                    InertiaHeader.PARTIAL_ONLY,
+                    InertiaHeader.PARTIAL_EXCEPT,
+                    InertiaHeader.PARTIAL_GROUPS,
+                    InertiaHeader.EXCEPT_ONCE_PROPS,
+                )
+            ),
+        )
+
+    def _is_not_modified(self, etag: str) -> bool:
+        session = self._get_request_session()
+        if session and FLASH_PROPS_KEY in session:
+            # Pending flash messages have to reach the client
+            return False
+
+        return etag_matches(self._request.headers.get(IF_NONE_MATCH_HEADER), etag)
+
+    def _not_modified(
+        self, etag: str, background: BackgroundTask | None = None
+    ) -> Response:
+        return Response(
+            status_code=304,
+            headers={**self._inertia_headers, ETAG_HEADER: etag},
+            background=background,
+        )
+
+    def _streamed_props(self, page_object: dict) -> list[str]:
+        return [
+            key
+            for key, value in page_object["props"].items()
+            if isinstance(value, JSONStream)
+        ]
+
+    def _page_props(self, props: dict) -> dict:
+        """
+        Combine shared props, flash messages and page props.
+
+        Shared props and flash messages go through the same planning as page
+        props: callables are resolved lazily and partial reloads filter them by
+        key. Flash messages are only pulled from the session when sent.
+        """
+        return {
+            **self._provided_props,
+            **self._share,
+            FLASH_PROPS_KEY: self._pull_flash_messages,
+            **props,
+        }
+
+    @cached_property
+    def _provided_props(self) -> dict:
+        return {
+            key: provider.bind(self._request)
+            for key, provider in shared_providers.items()
+        }
+
+    def _compose_page_object(self, plan: PropsPlan, resolved_props: dict) -> dict:
+        # Deferred metadata is only collected for initial loads
+        deferred_props = self._merge_cheap_groups(plan.deferred_groups())
+        merge_props = plan.merge_config()
 
         # Build base page object
         page_object = PageObject(
             component=self._component,
-            props={**self._share, **flash_props, **resolved_props},
+            props={
+                key: self._encode_prop(key, value, pruned=key in plan.pruned)
+                for key, value in resolved_props.items()
+            },
             url=str(self._request.url),
             version=self._assets_version,
         )
 
-        # Add metadata ONLY for initial loads
         if deferred_props:
             page_object["deferredProps"] = deferred_props
 
@@ -191,130 +800,626 @@ class Inertia(InertiaShare, InertiaProp):
             # Spread merge config keys into page object
             page_object.update(merge_props)
 
-        return jsonable_encoder(page_object)
+        if plan.once:
+            page_object["onceProps"] = plan.once
+
+        page_object = to_jsonable(page_object)
+        if self._component in hashed_components:
+            self._hash_page_props(page_object)
+
+        return page_object
+
+    def _hash_page_props(self, page_object: dict) -> None:
+        # Only partial reloads merge the response into the client's props
+        known = (
+            parse_prop_hashes(self._request.headers.get(InertiaHeader.PROP_HASHES, ""))
+            if self._component
+            == self._request.headers.get(InertiaHeader.PARTIAL_COMPONENT)
+            else {}
+        )
+
+        hashes, unchanged = apply_prop_hashes(page_object["props"], known)
+        page_object["propHashes"] = hashes
+        if unchanged:
+            page_object["unchangedProps"] = unchanged
+
+    def _encode_prop(self, key: str, value: t.Any, pruned: bool = False) -> t.Any:
+        """
+        Encode a resolved prop ahead of the generic encoder where possible.
+
+        Iterators are encoded while the response is sent. Props declared in
+        the component schema use its serializers, unless a nested partial
+        reload `pruned` them to a part of their declared type. Other models
+        are encoded natively by pydantic.
+        """
+        if is_stream(value):
+            return JSONStream(value)
+
+        schema = None if pruned else component_schemas.get(self._component)
+        if schema is not None:
+            encoded = schema.encode(key, value, check=self._settings.schema_check)
+            if encoded is not value:
+                return encoded
+
+        return encode_models(value)
+
+    def _plan_props(self, props: dict) -> PropsPlan:
+        """
+        Classify every prop in a single pass.
+
+        Initial loads drop lazy props, collect deferred groups (including auto
+        props that became slow) and skip once props the client holds. Partial
+        reloads keep the requested keys and groups, swapping deferred props for
+        prefetched results when available. Merge and once metadata is
+        collected for both.
+        """
+        plan = PropsPlan()
 
-    def _resolve_deferred_props(self, props: dict) -> dict | None:
         if self._is_partial_request:
-            return None
+            self._plan_partial_props(plan, props)
+        else:
+            self._plan_initial_props(plan, props)
+
+        return plan
+
+    def _plan_initial_props(self, plan: PropsPlan, props: dict) -> None:
+        except_once_keys = self._except_once_keys
+        threshold = self._settings.auto_defer_threshold
 
-        deferred_props = {}
         for key, value in props.items():
-            if not isinstance(value, DeferredProp):
-                continue
+            if isinstance(value, MergeProp):
+                plan.add_merge(key, value)
 
-            group = value.group
-            if group not in deferred_props:
-                deferred_props[group] = []
+            elif isinstance(value, OnceProp):
+                plan.add_once(key, value)
 
-            deferred_props[group].append(key)
+                if value.once_key(key) in except_once_keys:
+                    continue
 
-        return deferred_props
+            elif isinstance(value, AutoProp):
+                p95 = latency_stats.p95(self._component, key)
+                if p95 is not None and p95 > threshold:
+                    value = DeferredProp(value, group=value.group)
 
-    def _resolve_merge_props(self, props: dict) -> dict[str, list[str] | dict] | None:
-        """
-        Build merge configuration metadata for client.
+            if isinstance(value, DeferredProp):
+                plan.defer(key, value)
 
-        Returns dictionary with merge instructions:
-        {
-            "mergeProps": ["users", "posts"],
-            "prependProps": ["notifications"],
-            "deepMergeProps": ["settings"],
-            "matchPropsOn": {"users": "id", "posts": "id"}
-        }
+            elif isinstance(value, dict):
+                plan.resolve[key] = self._plan_nested_props(plan, value, f"{key}.")
+
+            elif not isinstance(value, IgnoreFirstLoad):
+                plan.resolve[key] = value
+
+    def _plan_nested_props(self, plan: PropsPlan, props: dict, prefix: str) -> dict:
+        """
+        Leave lazy props nested in a dict prop out of the initial load.
 
-        Returns metadata for both initial and partial requests.
-        The client needs this metadata on every response to know how to merge props.
+        Nested deferred props are announced under their dotted key, so the
+        client can request them later through a partial reload.
         """
-        merge_config = {}
-        merge_props = []
-        prepend_props = []
-        deep_merge_props = []
-        match_props_on = {}
+        planned = {}
 
         for key, value in props.items():
-            if not isinstance(value, MergeProp):
-                continue
+            if isinstance(value, DeferredProp):
+                plan.defer_nested(prefix + key, value)
 
-            # Collect merge props
-            if value.should_merge():
-                merge_props.append(key)
+            elif isinstance(value, dict):
+                planned[key] = self._plan_nested_props(plan, value, f"{prefix}{key}.")
 
-            # Collect prepend props
-            if value.prepends_at_root():
-                prepend_props.append(key)
+            elif not isinstance(value, IgnoreFirstLoad):
+                planned[key] = value
 
-            # Collect deep merge props
-            if value.should_deep_merge():
-                deep_merge_props.append(key)
+        return planned
 
-            # Collect match strategies
-            match_fields = value.matches_on()
-            if match_fields:
-                # Use first match field (Laravel behavior)
-                match_props_on[key] = match_fields[0]
+    def _plan_partial_props(self, plan: PropsPlan, props: dict) -> None:
+        only_paths = self._partial_only_paths
+        except_paths = self._partial_except_paths
+        groups = self._partial_groups
+        prefetch_token = self._get_prefetch_token(create=False)
+        prefetched = {}
 
-        # Only include non-empty arrays
-        if merge_props:
-            merge_config["mergeProps"] = merge_props
-        if prepend_props:
-            merge_config["prependProps"] = prepend_props
-        if deep_merge_props:
-            merge_config["deepMergeProps"] = deep_merge_props
-        if match_props_on:
-            merge_config["matchPropsOn"] = match_props_on
-
-        return merge_config if merge_config else None
-
-    def _resolve_props(self, props: dict) -> dict:
-        props = self._resolve_partial_props(props)
-        props = self._resolve_property_instances(props)
-
-        return props
-
-    def _resolve_partial_props(self, props: dict) -> dict[str, t.Any]:
-        if not self._is_partial_request:
-            return {
-                key: value
-                for key, value in props.items()
-                if not isinstance(value, IgnoreFirstLoad)
-            }
-
-        props_ = {}
         for key, value in props.items():
-            if key not in self._partial_only_keys:
+            if isinstance(value, MergeProp):
+                plan.add_merge(key, value)
+
+            elif isinstance(value, OnceProp):
+                plan.add_once(key, value)
+
+            if isinstance(value, (DeferredProp, AutoProp)) and value.group in groups:
+                only = None
+            elif key in only_paths:
+                only = only_paths[key]
+            elif DEADLINE_GROUP in groups and self._missed_deadline(
+                key, value, prefetch_token
+            ):
+                only = None
+            elif isinstance(value, dict) and groups:
+                # Nested deferred props of the requested groups
+                only = parse_paths(self._nested_group_keys(value, groups)) or None
+                if only is None:
+                    continue
+            else:
                 continue
 
-            if key in self._partial_except_keys:
+            excluded = except_paths.get(key)
+            if key in except_paths and excluded is None:
                 continue
 
-            props_[key] = value
+            if only is not None or excluded is not None:
+                plan.pruned[key] = (only, excluded)
+
+                # Prune before resolving so unrequested nested props never run
+                value = prune(value, only, excluded)
+
+            if prefetch_token is not None and isinstance(value, DeferredProp):
+                if value.group not in prefetched:
+                    prefetched[value.group] = prefetch_cache.take(
+                        self._prefetch_key(prefetch_token, value.group)
+                    )
+
+                future = prefetched[value.group]
+                if future is not None:
+                    value = PrefetchedProp(
+                        value, future, key, timeout=self._settings.prefetch_ttl
+                    )
+
+            elif (
+                prefetch_token is not None
+                and self._deadline is not None
+                and callable(value)
+            ):
+                # Result of a prop that missed the deadline of the initial load
+                future = prefetch_cache.take(
+                    self._prefetch_key(prefetch_token, f"{DEADLINE_GROUP}:{key}")
+                )
+                if future is not None:
+                    value = PrefetchedProp(
+                        value, future, key, timeout=self._settings.prefetch_ttl
+                    )
+
+            plan.resolve[key] = value
+
+    def _missed_deadline(
+        self, key: str, value: t.Any, prefetch_token: str | None
+    ) -> bool:
+        """
+        Check whether a prop belongs to the deadline group of a partial reload.
+
+        The follow-up request only sees the plain callable, so a prop counts
+        as deferred by the deadline when its result is parked for this page
+        or its measured p95 latency exceeds the deadline.
+        """
+        if (
+            self._deadline is None
+            or not callable(value)
+            or isinstance(value, (DeferredProp, AutoProp, IgnoreFirstLoad))
+        ):
+            return False
+
+        if prefetch_token is not None and (
+            self._prefetch_key(prefetch_token, f"{DEADLINE_GROUP}:{key}")
+            in prefetch_cache
+        ):
+            return True
+
+        p95 = latency_stats.p95(self._component, key)
+
+        return p95 is not None and p95 >= self._deadline
+
+    def _nested_group_keys(self, props: dict, groups: frozenset[str]) -> list[str]:
+        keys = []
+
+        for key, value in props.items():
+            if isinstance(value, DeferredProp) and value.group in groups:
+                keys.append(key)
+
+            elif isinstance(value, dict):
+                keys.extend(
+                    f"{key}.{nested}"
+                    for nested in self._nested_group_keys(value, groups)
+                )
 
-        return props_
+        return keys
 
-    def _resolve_property_instances(self, props: dict) -> dict:
+    def _resolve_plan(self, plan: PropsPlan) -> dict:
+        if self._partial_groups:
+            resolved = self._resolve_property_instances_concurrently(plan.resolve)
+        else:
+            resolved = self._resolve_property_instances(plan.resolve)
+
+        # Callables may return dicts, prune their results as well
+        return plan.prune_resolved(resolved)
+
+    async def _resolve_plan_async(self, plan: PropsPlan) -> dict:
+        resolved = await self._resolve_property_instances_async(
+            plan.resolve, offload=bool(self._partial_groups)
+        )
+
+        return plan.prune_resolved(resolved)
+
+    def _merge_cheap_groups(self, deferred_props: dict) -> dict:
+        """
+        Merge consistently cheap deferred groups to save follow-up requests.
+
+        A group is cheap when every prop has at least
+        FV_INERTIA_CHEAP_GROUP_MIN_SAMPLES measurements and a p95 latency within
+        FV_INERTIA_CHEAP_GROUP_THRESHOLD seconds. Two or more cheap groups are
+        merged into one group named "a+b". A single cheap group is kept on its
+        own: joining a slow group would hold its props back until the slow
+        ones resolve.
+        """
+        threshold = self._settings.cheap_group_threshold
+        if threshold is None or len(deferred_props) < 2:
+            return deferred_props
+
+        cheap = [
+            group
+            for group, keys in deferred_props.items()
+            if self._is_measured(keys)
+            and all(self._is_cheap(key, threshold) for key in keys)
+        ]
+
+        if len(cheap) < 2:
+            return deferred_props
+
+        merged_group = MERGED_GROUP_SEPARATOR.join(
+            group for group in deferred_props if group in cheap
+        )
+        merged = {}
+        for group, keys in deferred_props.items():
+            target = merged_group if group in cheap else group
+            merged.setdefault(target, []).extend(keys)
+
+        return merged
+
+    def _is_cheap(self, key: str, threshold: float) -> bool:
+        # Props never measured are not known to be cheap, whatever the minimum
+        p95 = latency_stats.p95(self._component, key)
+
+        return p95 is not None and p95 <= threshold
+
+    def _is_measured(self, keys: list[str]) -> bool:
+        """Check whether every prop of a group has enough latency samples."""
+        min_samples = self._settings.cheap_group_min_samples
+
+        return all(
+            latency_stats.count(self._component, key) >= min_samples for key in keys
+        )
+
+    def _defer_after_deadline(self, plan: PropsPlan, deadline: float) -> None:
+        """
+        Resolve callable props concurrently, deferring those over the budget.
+
+        Props known to be fast run inline; the others start on the render
+        executor, so they do not queue behind prefetched or throttled props.
+        Props that finished in time are kept as resolved values. Running
+        computations cannot be interrupted: they finish in the background and
+        their results are parked for the follow-up partial request.
+        """
+        started = time.monotonic()
+        inline, offloaded = self._split_deadline_candidates(plan, deadline)
+
+        futures = {
+            key: submit(functools.partial(self._call_prop, key, value), render_executor)
+            for key, value in offloaded.items()
+        }
+
+        for key, value in inline.items():
+            plan.resolve[key] = ResolvedProp(self._call_prop(key, value))
+
+        remaining = max(deadline - (time.monotonic() - started), 0)
+        done, _ = wait(futures.values(), timeout=remaining)
+
+        for key, future in futures.items():
+            if future in done:
+                plan.resolve[key] = ResolvedProp(future.result())
+            else:
+                if not self._park_missed_deadline(key, future) and future.cancel():
+                    # Never started, it took at least the deadline
+                    latency_stats.record(self._component, key, deadline)
+                self._defer_missed_deadline(plan, key)
+
+    async def _defer_after_deadline_async(
+        self, plan: PropsPlan, deadline: float
+    ) -> None:
+        """
+        Async counterpart of _defer_after_deadline.
+
+        Coroutine props run as tasks and sync props on the render executor.
+        Pending props keep running for the follow-up request when their
+        results can be parked, and are cancelled otherwise.
+        """
+        inline, offloaded = self._split_deadline_candidates(plan, deadline)
+        candidates = {**inline, **offloaded}
+        if not candidates:
+            return
+
+        sync_props = {
+            key: value for key, value in candidates.items() if not is_async_prop(value)
+        }
+
+        tasks = {}
+        for key, value in candidates.items():
+            if key in sync_props:
+                future = submit(
+                    functools.partial(self._call_prop, key, value), render_executor
+                )
+                tasks[key] = asyncio.wrap_future(future)
+            else:
+                tasks[key] = asyncio.ensure_future(self._call_prop_async(key, value))
+
+        done, _ = await asyncio.wait(tasks.values(), timeout=deadline)
+
+        for key, task in tasks.items():
+            if task in done:
+                plan.resolve[key] = ResolvedProp(task.result())
+            else:
+                if self._park_missed_deadline(key, task):
+                    keep_running(task)
+                else:
+                    task.cancel()
+                    if key not in sync_props:
+                        # Cancelled coroutines took at least the deadline
+                        latency_stats.record(self._component, key, deadline)
+                self._defer_missed_deadline(plan, key)
+
+    def _split_deadline_candidates(
+        self, plan: PropsPlan, deadline: float
+    ) -> tuple[dict, dict]:
+        """
+        Split the callable props into those run inline and those offloaded.
+
+        Props whose measured p95 latency fits, together with the inline props
+        before them, into a share of the deadline are known to be fast and
+        are not worth a thread.
+        """
+        if self._is_partial_request:
+            return {}, {}
+
+        inline, offloaded = {}, {}
+        budget = deadline * INLINE_DEADLINE_SHARE
+
+        for key, value in plan.resolve.items():
+            if not callable(value):
+                continue
+
+            p95 = None
+            if latency_stats.count(self._component, key) >= KNOWN_FAST_MIN_SAMPLES:
+                p95 = latency_stats.p95(self._component, key)
+
+            if p95 is not None and p95 <= budget:
+                inline[key] = value
+                budget -= p95
+            else:
+                offloaded[key] = value
+
+        return inline, offloaded
+
+    def _park_missed_deadline(self, key: str, future: t.Any) -> bool:
+        """
+        Park the result of a prop that missed the deadline once it finishes.
+
+        Like prefetched groups, results are parked per session and page, so
+        the follow-up partial request does not compute the prop again.
+        """
+        token = self._get_prefetch_token(create=True)
+        if token is None:
+            return False
+
+        parked = prefetch_cache.park(
+            self._prefetch_key(token, f"{DEADLINE_GROUP}:{key}"),
+            self._settings.prefetch_ttl,
+        )
+
+        def settle(done) -> None:
+            if done.cancelled():
+                parked.set_exception(RuntimeError(f"Prop {key!r} was cancelled"))
+            elif done.exception() is not None:
+                parked.set_exception(done.exception())
+            else:
+                parked.set_result({key: done.result()})
+
+        future.add_done_callback(settle)
+
+        return True
+
+    def _defer_missed_deadline(self, plan: PropsPlan, key: str) -> None:
+        plan.defer(key, DeferredProp(plan.resolve.pop(key), group=DEADLINE_GROUP))
+
+    def _prefetch_deferred_groups(
+        self, plan: PropsPlan, use_async: bool
+    ) -> BackgroundTask | None:
+        """
+        Park one future per deferred group and return the task settling them.
+
+        Only initial loads of sessions are prefetched: the session token keeps
+        one user's precomputed props from being served to another. Props that
+        missed the render deadline already park their results per prop.
+        """
+        if self._is_partial_request or not plan.deferred:
+            return None
+
+        token = self._get_prefetch_token(create=True)
+        if token is None:
+            return None
+
+        ttl = self._settings.prefetch_ttl
+        pending = [
+            (prefetch_cache.park(self._prefetch_key(token, group), ttl), group_props)
+            for group, group_props in plan.deferred.items()
+            if not (group == DEADLINE_GROUP and self._deadline is not None)
+        ]
+        if not pending:
+            return None
+
+        async def prefetch():
+            await asyncio.gather(
+                *(
+                    self._prefetch_group(future, group_props, use_async)
+                    for future, group_props in pending
+                )
+            )
+
+        return BackgroundTask(prefetch)
+
+    async def _prefetch_group(self, future, props: dict, use_async: bool) -> None:
+        try:
+            if use_async:
+                resolved = await self._resolve_property_instances_async(props)
+            else:
+                resolved = await run_in_threadpool(
+                    self._resolve_property_instances, props
+                )
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(resolved)
+
+    def _prefetch_key(self, token: str, group: str) -> PrefetchKey:
+        # Partial reloads are sent to the URL of the page they complete
+        return (token, str(self._request.url), self._component, group)
+
+    def _get_prefetch_token(self, create: bool) -> str | None:
+        session = self._get_request_session()
+        if session is None:
+            return None
+
+        if PREFETCH_SESSION_KEY not in session and create:
+            session[PREFETCH_SESSION_KEY] = secrets.token_urlsafe(16)
+
+        return session.get(PREFETCH_SESSION_KEY)
+
+    def _resolve_property_instances(self, props: dict, prefix: str = "") -> dict:
         """
         Resolve special property instances (CallableProp, DeferredProp, etc.)
 
         This is equivalent to Laravel's resolvePropertyInstances() method.
         It executes callables for props that survived the filtering stage.
+        Nested props are timed under their dotted key path (`prefix`).
         """
         resolved = {}
 
         for key, value in props.items():
             if isinstance(value, CallableProp):
-                resolved[key] = value()
+                resolved[key] = self._call_prop(prefix + key, value)
 
             elif callable(value):
-                resolved[key] = value()
+                resolved[key] = self._call_prop(prefix + key, value)
 
             elif isinstance(value, dict):
-                resolved[key] = self._resolve_property_instances(value)
+                resolved[key] = self._resolve_property_instances(
+                    value, f"{prefix}{key}."
+                )
 
             else:
                 resolved[key] = value
 
         return resolved
 
+    def _resolve_property_instances_concurrently(self, props: dict) -> dict:
+        """
+        Resolve top-level callables in parallel on the render executor.
+
+        Used when a partial request asks for several deferred groups at once,
+        so the groups do not resolve one after another.
+        """
+        callables = {key: value for key, value in props.items() if callable(value)}
+        if not callables:
+            return self._resolve_property_instances(props)
+
+        # Group limits submit to the shared executor and wait, which must
+        # never happen from one of its own workers
+        futures = {
+            key: submit(functools.partial(self._call_prop, key, value), render_executor)
+            for key, value in callables.items()
+        }
+        resolved = self._resolve_property_instances(
+            {key: value for key, value in props.items() if key not in futures}
+        )
+
+        return {
+            key: futures[key].result() if key in futures else resolved[key]
+            for key in props
+        }
+
+    async def _resolve_property_instances_async(
+        self, props: dict, prefix: str = "", offload: bool = False
+    ) -> dict:
+        """
+        Async counterpart of _resolve_property_instances.
+
+        Callables may be coroutine functions; all pending props of one level
+        are awaited concurrently while the key order of `props` is kept.
+        With `offload`, sync callables run in the thread pool so they resolve
+        concurrently as well.
+        """
+        resolved = {}
+        pending = {}
+
+        for key, value in props.items():
+            if callable(value):
+                pending[key] = self._call_prop_async(prefix + key, value, offload)
+
+            elif isinstance(value, dict):
+                pending[key] = self._resolve_property_instances_async(
+                    value, f"{prefix}{key}."
+                )
+
+            resolved[key] = value
+
+        results = await asyncio.gather(*pending.values())
+        resolved.update(zip(pending.keys(), results))
+
+        return resolved
+
+    def _call_prop(self, key: str, prop: t.Callable) -> t.Any:
+        """Call a prop, recording its latency for the component."""
+        limits = self._get_group_limits(prop)
+        if limits is not None:
+            prop = functools.partial(limits.run, prop.group, prop)
+
+        if not getattr(prop, "track_latency", True):
+            return prop()
+
+        started = time.perf_counter()
+        value = prop()
+        latency_stats.record(self._component, key, time.perf_counter() - started)
+
+        return value
+
+    async def _call_prop_async(
+        self, key: str, prop: t.Callable, offload: bool = False
+    ) -> t.Any:
+        """
+        Async counterpart of _call_prop.
+
+        With `offload`, sync callables run in the thread pool instead of
+        blocking the event loop.
+        """
+        if not isinstance(prop, CallableProp):
+            prop = CallableProp(prop)
+
+        limits = self._get_group_limits(prop)
+
+        started = time.perf_counter()
+        if limits is not None:
+            value = await limits.run_async(prop.group, prop)
+        elif offload:
+            value = await resolve_offloaded(prop)
+        else:
+            value = await prop.resolve_async()
+
+        if prop.track_latency:
+            latency_stats.record(self._component, key, time.perf_counter() - started)
+
+        return value
+
+    def _get_group_limits(self, prop: t.Any) -> GroupLimits | None:
+        if not isinstance(prop, DeferredProp):
+            return None
+
+        return group_limits.get(prop.group)
+
     def flash(self, key: str, value: t.Any):
         session = self._get_request_session()
 
@@ -334,14 +1439,15 @@ class Inertia(InertiaShare, InertiaProp):
 
         return self._request.session
 
-    def _get_flash_props(self) -> dict:
+    def _pull_flash_messages(self) -> dict:
         session = self._get_request_session()
         if session is None:
-            return {FLASH_PROPS_KEY: {}}
+            return {}
 
-        props = session.pop(FLASH_PROPS_KEY, {})
+        messages = session.pop(FLASH_PROPS_KEY, {})
+        self._flashed = bool(messages)
 
-        return {FLASH_PROPS_KEY: props}
+        return messages
 
 
 def get_inertia_context(request: Request):
@@ -0,0 +1,342 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import struct
+import typing as t
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.background import BackgroundTask, BackgroundTasks
+
+from ..cache import (
+    CacheBackend,
+    CacheError,
+    CacheStats,
+    MemoryCache,
+    NamespacedCache,
+)
+from ..compression import compress_response
+from .config import InertiaSettings
+from .enums import InertiaHeader
+from .etag import IF_NONE_MATCH_HEADER, etag_matches
+
+logger = logging.getLogger(__name__)
+
+# Request scope key under which a cached endpoint asks Inertia to store its page
+PAGE_CACHE_SCOPE_KEY: str = "fastapi_view.page_cache"
+COMPONENT_TAG_PREFIX: str = "component:"
+# Session key of pending flash messages, as used by Inertia.flash
+FLASH_SESSION_KEY: str = "flash"
+
+# Request headers that select a variant of a page
+KEY_HEADERS: tuple[str, ...] = (
+    InertiaHeader.INERTIA,
+    InertiaHeader.PARTIAL_COMPONENT,
+    InertiaHeader.PARTIAL_ONLY,
+    InertiaHeader.PARTIAL_EXCEPT,
+    InertiaHeader.PARTIAL_GROUPS,
+    InertiaHeader.EXCEPT_ONCE_PROPS,
+    InertiaHeader.PROP_HASHES,
+)
+
+Segments = t.Mapping[str, t.Callable[[Request], t.Any]]
+
+# Length of the JSON header preceding the body of a stored page
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+class CachedPage:
+    """The serialized response of a page, before it was compressed."""
+
+    __slots__ = ("body", "status_code", "raw_headers")
+
+    def __init__(
+        self, body: bytes, status_code: int, raw_headers: list[tuple[bytes, bytes]]
+    ):
+        self.body = body
+        self.status_code = status_code
+        self.raw_headers = raw_headers
+
+    @classmethod
+    def from_response(cls, response: Response) -> "CachedPage":
+        return cls(response.body, response.status_code, list(response.raw_headers))
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CachedPage":
+        (length,) = _HEADER_LENGTH.unpack_from(data)
+        start = _HEADER_LENGTH.size + length
+        header = json.loads(data[_HEADER_LENGTH.size : start])
+
+        return cls(
+            data[start:],
+            header["status"],
+            [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in header["headers"]
+            ],
+        )
+
+    def dumps(self) -> bytes:
+        header = json.dumps(
+            {
+                "status": self.status_code,
+                "headers": [
+                    (name.decode("latin-1"), value.decode("latin-1"))
+                    for name, value in self.raw_headers
+                ],
+            }
+        ).encode()
+
+        return _HEADER_LENGTH.pack(len(header)) + header + self.body
+
+    @property
+    def etag(self) -> str | None:
+        for name, value in self.raw_headers:
+            if name == b"etag":
+                return value.decode("latin-1")
+
+        return None
+
+    def to_response(self) -> Response:
+        response = Response(self.body, status_code=self.status_code)
+        response.raw_headers = list(self.raw_headers)
+
+        return response
+
+    def not_modified(self) -> Response:
+        response = Response(status_code=304)
+        response.raw_headers = [
+            (name, value)
+            for name, value in self.raw_headers
+            if name not in (b"content-length", b"content-type")
+        ]
+
+        return response
+
+
+class PageCache:
+    """
+    Serialized Inertia pages, kept in a `fastapi_view.cache` backend.
+
+    Pages are namespaced by the assets version, so a deploy never serves pages
+    referencing the assets of the previous build. Every page is tagged
+    `component:<name>` besides its declared tags.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None):
+        self.backend = backend or MemoryCache()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.backend.stats
+
+    def current(self) -> NamespacedCache:
+        """The backend under the namespace of the current assets version."""
+        return self.backend.namespaced(f"pages:{InertiaSettings().assets_version}")
+
+    def invalidate(self, *tags: str) -> int:
+        return self.current().invalidate(*tags)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+page_cache = PageCache()
+
+
+def configure_page_cache(backend: CacheBackend) -> PageCache:
+    """
+    Keep cached pages in `backend`, e.g. a RedisCache shared by all workers.
+
+    Example:
+        configure_page_cache(RedisCache(host="cache.internal"))
+    """
+    page_cache.backend = backend
+
+    return page_cache
+
+
+class PageCacheTarget:
+    """Where the page rendered for a cache miss is to be stored."""
+
+    def __init__(
+        self, cache: CacheBackend, key: str, ttl: float, tags: t.Iterable[str]
+    ):
+        self.cache = cache
+        self.key = key
+        self.ttl = ttl
+        self.tags = frozenset(tags)
+
+    def store(self, component: str, response: Response) -> None:
+        """Store the page once the response was sent, off the request path."""
+        task = BackgroundTask(
+            self._set,
+            CachedPage.from_response(response).dumps(),
+            self.tags | {f"{COMPONENT_TAG_PREFIX}{component}"},
+        )
+
+        if response.background is None:
+            response.background = task
+        elif isinstance(response.background, BackgroundTasks):
+            response.background.tasks.append(task)
+        else:
+            response.background = BackgroundTasks([response.background, task])
+
+    def _set(self, data: bytes, tags: frozenset[str]) -> None:
+        try:
+            self.cache.set(self.key, data, self.ttl, tags)
+        except CacheError:
+            logger.warning("Failed to store page %s", self.key, exc_info=True)
+
+
+def page_cache_key(request: Request, segments: Segments) -> str:
+    """
+    Key of the page variant requested.
+
+    The URL and the partial reload headers identify the component and the
+    props requested, and `segments` whatever else the page depends on, such
+    as the user's role or locale.
+    """
+    parts = [
+        str(request.url),
+        *(request.headers.get(header, "") for header in KEY_HEADERS),
+        *(f"{name}={segment(request)}" for name, segment in sorted(segments.items())),
+    ]
+
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def cache_page(
+    ttl: float = 60.0,
+    vary_by: Segments | None = None,
+    tags: t.Iterable[str] = (),
+) -> t.Callable:
+    """
+    Cache the pages rendered by an Inertia endpoint.
+
+    A cache hit is answered with the stored bytes without calling the
+    endpoint, so no prop is resolved or encoded. Only complete responses are
+    stored: streamed pages, pages with flash messages and error responses are
+    not. The endpoint may take the request or not; it is injected for the
+    decorator either way. Cache errors are logged and the page is rendered as
+    on a miss.
+
+    Args:
+        ttl: Seconds a page is served from the cache
+        vary_by: Named functions of the request whose results select separate
+            cached pages, e.g. {"role": lambda request: request.state.user.role}
+        tags: Tags for invalidating the pages with `page_cache.invalidate`
+
+    Example:
+        @app.get("/dashboard")
+        @cache_page(ttl=30, vary_by={"role": user_role}, tags=["dashboard"])
+        def dashboard(inertia: InertiaDepends): ...
+    """
+    segments = dict(vary_by or {})
+    tags = tuple(tags)
+
+    def decorator(endpoint: t.Callable) -> t.Callable:
+        signature = inspect.signature(endpoint)
+        request_param = next(
+            (
+                name
+                for name, param in signature.parameters.items()
+                if param.annotation is Request
+            ),
+            None,
+        )
+        injected = request_param is None
+        if injected:
+            request_param = "_page_cache_request"
+            signature = signature.replace(
+                parameters=[
+                    *signature.parameters.values(),
+                    inspect.Parameter(
+                        request_param,
+                        inspect.Parameter.KEYWORD_ONLY,
+                        annotation=Request,
+                    ),
+                ]
+            )
+
+        def lookup(kwargs: dict) -> tuple[Request, NamespacedCache | None, str]:
+            request = kwargs.pop(request_param) if injected else kwargs[request_param]
+            if _has_pending_flash(request):
+                return request, None, ""
+
+            return request, page_cache.current(), page_cache_key(request, segments)
+
+        def respond(
+            request: Request, cache: CacheBackend, key: str, data: bytes | None
+        ) -> Response | None:
+            if data is None:
+                request.scope[PAGE_CACHE_SCOPE_KEY] = PageCacheTarget(
+                    cache, key, ttl, tags
+                )
+                return None
+
+            return _cached_response(request, CachedPage.loads(data))
+
+        if inspect.iscoroutinefunction(endpoint):
+
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request, cache, key = lookup(kwargs)
+                if cache is not None:
+                    response = respond(request, cache, key, await _aget(cache, key))
+                    if response is not None:
+                        return response
+
+                return await endpoint(*args, **kwargs)
+
+        else:
+
+            @functools.wraps(endpoint)
+            def wrapper(*args, **kwargs):
+                request, cache, key = lookup(kwargs)
+                if cache is not None:
+                    response = respond(request, cache, key, _get(cache, key))
+                    if response is not None:
+                        return response
+
+                return endpoint(*args, **kwargs)
+
+        wrapper.__signature__ = signature
+
+        return wrapper
+
+    return decorator
+
+
+def _get(cache: CacheBackend, key: str) -> bytes | None:
+    # An unavailable cache must not fail the page, it is rendered instead
+    try:
+        return cache.get(key)
+    except CacheError:
+        logger.warning("Failed to look up page %s", key, exc_info=True)
+        return None
+
+
+async def _aget(cache: CacheBackend, key: str) -> bytes | None:
+    try:
+        return await cache.aget(key)
+    except CacheError:
+        logger.warning("Failed to look up page %s", key, exc_info=True)
+        return None
+
+
+def _cached_response(request: Request, page: CachedPage) -> Response:
+    etag = page.etag
+    if etag is not None and etag_matches(
+        request.headers.get(IF_NONE_MATCH_HEADER), etag
+    ):
+        return page.not_modified()
+
+    return compress_response(request, page.to_response())
+
+
+def _has_pending_flash(request: Request) -> bool:
+    # Flash messages are pulled while rendering, which a cache hit skips
+    return "session" in request.scope and FLASH_SESSION_KEY in request.session
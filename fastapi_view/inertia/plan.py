@@ -0,0 +1,156 @@
+import typing as t
+
+from pydantic import BaseModel
+
+from .props import DeferredProp, MergeProp, OnceProp, StaticProp
+
+# Dotted partial reload keys as a tree, e.g. "user.permissions" and "contacts"
+# become {"user": {"permissions": None}, "contacts": None}; None selects the
+# whole sub-tree.
+PropPaths = dict[str, "PropPaths | None"]
+
+
+def parse_paths(keys: t.Iterable[str]) -> PropPaths:
+    """Parse dotted prop keys into a tree of requested paths."""
+    paths: PropPaths = {}
+
+    for key in keys:
+        node = paths
+        *parents, leaf = key.split(".")
+
+        for part in parents:
+            if part in node and node[part] is None:
+                break
+
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = None
+
+    return paths
+
+
+def prune(value: t.Any, only: PropPaths | None, excluded: PropPaths | None) -> t.Any:
+    """
+    Keep the `only` paths of a nested dict prop and drop its `excluded` paths.
+
+    `None` means no restriction. Pydantic models are pruned as they are sent,
+    dumped by alias in JSON mode like `jsonable_encoder` does. Other values
+    that are not dicts are returned as is.
+    """
+    if isinstance(value, StaticProp):
+        value = value.value
+
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json", by_alias=True)
+
+    if not isinstance(value, dict):
+        return value
+
+    pruned = {}
+    for key, item in value.items():
+        item_only = None
+        if only is not None:
+            if key not in only:
+                continue
+
+            item_only = only[key]
+
+        item_excluded = None
+        if excluded is not None and key in excluded:
+            if excluded[key] is None:
+                continue
+
+            item_excluded = excluded[key]
+
+        if item_only is not None or item_excluded is not None:
+            item = prune(item, item_only, item_excluded)
+
+        pruned[key] = item
+
+    return pruned
+
+
+class PropsPlan:
+    """
+    How each prop of one render is handled, classified in a single pass.
+
+    `resolve` holds the props to resolve for this response in page order,
+    `deferred` the props left for follow-up requests by group and `pruned`
+    the nested paths kept of partially reloaded props; the remaining
+    attributes collect the merge and once-prop metadata sent to the client.
+    """
+
+    def __init__(self):
+        self.resolve: dict[str, t.Any] = {}
+        self.deferred: dict[str, dict[str, DeferredProp]] = {}
+        self.pruned: dict[str, tuple[PropPaths | None, PropPaths | None]] = {}
+        self.once: dict[str, dict] = {}
+
+        self._nested_deferred: dict[str, list[str]] = {}
+
+        self._merge_props: list[str] = []
+        self._prepend_props: list[str] = []
+        self._deep_merge_props: list[str] = []
+        self._match_props_on: dict[str, str] = {}
+
+    def defer(self, key: str, prop: DeferredProp) -> None:
+        self.deferred.setdefault(prop.group, {})[key] = prop
+
+    def defer_nested(self, key: str, prop: DeferredProp) -> None:
+        """Announce a deferred prop inside a dict prop under its dotted key."""
+        self._nested_deferred.setdefault(prop.group, []).append(key)
+
+    def prune_resolved(self, resolved: dict) -> dict:
+        """Cut resolved props down to the nested paths that were requested."""
+        for key, (only, excluded) in self.pruned.items():
+            resolved[key] = prune(resolved[key], only, excluded)
+
+        return resolved
+
+    def add_merge(self, key: str, prop: MergeProp) -> None:
+        # Collect merge props
+        if prop.should_merge():
+            self._merge_props.append(key)
+
+        # Collect prepend props
+        if prop.prepends_at_root():
+            self._prepend_props.append(key)
+
+        # Collect deep merge props
+        if prop.should_deep_merge():
+            self._deep_merge_props.append(key)
+
+        # Collect match strategies
+        match_fields = prop.matches_on()
+        if match_fields:
+            # Use first match field (Laravel behavior)
+            self._match_props_on[key] = match_fields[0]
+
+    def add_once(self, key: str, prop: OnceProp) -> None:
+        self.once[prop.once_key(key)] = {
+            "prop": key,
+            "expiresAt": prop.expires_at(),
+        }
+
+    def deferred_groups(self) -> dict[str, list[str]]:
+        """Get the deferred prop keys by group, as sent in `deferredProps`."""
+        groups = {group: list(props) for group, props in self.deferred.items()}
+        for group, keys in self._nested_deferred.items():
+            groups.setdefault(group, []).extend(keys)
+
+        return groups
+
+    def merge_config(self) -> dict[str, list[str] | dict] | None:
+        merge_config = {}
+
+        # Only include non-empty arrays
+        if self._merge_props:
+            merge_config["mergeProps"] = self._merge_props
+        if self._prepend_props:
+            merge_config["prependProps"] = self._prepend_props
+        if self._deep_merge_props:
+            merge_config["deepMergeProps"] = self._deep_merge_props
+        if self._match_props_on:
+            merge_config["matchPropsOn"] = self._match_props_on
+
+        return merge_config if merge_config else None
@@ -0,0 +1,74 @@
+import threading
+import time
+from concurrent.futures import Future
+
+# (session token, page URL, component, group or "deadline:<prop key>")
+PrefetchKey = tuple[str, str, str, str]
+
+
+class PrefetchCache:
+    """
+    Short-lived store of deferred prop groups computed ahead of their request.
+
+    Entries are futures keyed by (session token, URL, component, group), so
+    pages of one component with different query strings, e.g. paginated or
+    filtered listings, never receive each other's results. Props that missed
+    a render deadline are parked one by one, under `deadline:<prop key>`. An
+    entry is parked while the initial page is rendered, settled once its
+    computation finished, and taken (removed) by the follow-up partial request
+    for it. Entries that are never taken expire after their TTL.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._lock = threading.Lock()
+        self._entries: dict[PrefetchKey, tuple[float, Future]] = {}
+        self._max_entries = max_entries
+
+    def park(self, key: PrefetchKey, ttl: float) -> Future:
+        """Register a pending computation for `key` and return its future."""
+        future = Future()
+        now = time.monotonic()
+
+        with self._lock:
+            self._purge(now)
+
+            if len(self._entries) >= self._max_entries:
+                # Dicts keep insertion order, so the first entry is the oldest.
+                del self._entries[next(iter(self._entries))]
+
+            self._entries[key] = (now + ttl, future)
+
+        return future
+
+    def take(self, key: PrefetchKey) -> Future | None:
+        """Remove and return the future parked for `key`, if still fresh."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+        if entry is None or entry[0] < time.monotonic():
+            return None
+
+        return entry[1]
+
+    def __contains__(self, key: PrefetchKey) -> bool:
+        """Check whether a fresh entry is parked for `key`, without taking it."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+        return entry is not None and entry[0] >= time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _purge(self, now: float) -> None:
+        expired = [key for key, (expires, _) in self._entries.items() if expires < now]
+
+        for key in expired:
+            del self._entries[key]
+
+
+prefetch_cache = PrefetchCache()
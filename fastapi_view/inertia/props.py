@@ -1,17 +1,88 @@
+import asyncio
+import inspect
+import time
 import typing as t
+from concurrent.futures import Future
+
+from .singleflight import single_flight
 
 
 class IgnoreFirstLoad:
     pass
 
 
+class StaticProp:
+    """
+    Plain JSON data that contains no props, sent without being traversed.
+
+    The value is neither searched for callables nor copied by the encoder, so
+    it must only contain JSON types (dict, list, str, int, float, bool, None).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: t.Any):
+        self.value = value
+
+
 class CallableProp:
+    # Whether resolving the prop is timed for the latency statistics
+    track_latency: bool = True
+
     def __init__(self, prop: t.Any):
         self._prop = prop
 
     def __call__(self):
         return self._prop() if callable(self._prop) else self._prop
 
+    async def resolve_async(self):
+        """Resolve the prop, awaiting coroutine functions and awaitable results."""
+        if isinstance(self._prop, CallableProp):
+            return await self._prop.resolve_async()
+
+        value = self()
+        if inspect.isawaitable(value):
+            value = await value
+
+        return value
+
+
+class ResolvedProp(CallableProp):
+    """A property holding an already resolved value, returned as-is."""
+
+    track_latency = False
+
+    def __call__(self):
+        return self._prop
+
+
+def is_async_prop(value: t.Any) -> bool:
+    """Check whether a prop (or the callable it wraps) is a coroutine function."""
+    while isinstance(value, CallableProp):
+        value = value._prop
+
+    return inspect.iscoroutinefunction(value)
+
+
+class CoalescedProp(CallableProp):
+    """
+    A property whose computation is shared by concurrent requests.
+
+    Requests resolving a prop with the same key while a computation is in
+    flight wait for that computation instead of starting their own.
+    """
+
+    def __init__(self, prop: t.Any, key: str):
+        super().__init__(prop)
+
+        self.key = key
+
+    def __call__(self):
+        return single_flight.call(self.key, super().__call__)
+
+    async def resolve_async(self):
+        return await single_flight.acall(self.key, super().resolve_async)
+
 
 class OptionalProp(IgnoreFirstLoad, CallableProp):
     pass
@@ -24,6 +95,81 @@ class DeferredProp(IgnoreFirstLoad, CallableProp):
         self.group = group
 
 
+class AutoProp(CallableProp):
+    """
+    A property resolved inline while it is historically fast.
+
+    Once the measured p95 resolution latency of the prop crosses the
+    configured threshold, it is sent as a deferred prop of `group` instead.
+    """
+
+    def __init__(self, prop: t.Any, group: str = "auto"):
+        super().__init__(prop)
+
+        self.group = group
+
+
+class OnceProp(CallableProp):
+    """
+    A property the client keeps across navigations once it has received it.
+
+    The value is only computed and sent when the client does not report
+    holding it already through the X-Inertia-Except-Once-Props header.
+    """
+
+    def __init__(self, prop: t.Any, key: str | None = None, ttl: float | None = None):
+        super().__init__(prop)
+
+        self.key = key
+        self.ttl = ttl
+
+    def once_key(self, prop_key: str) -> str:
+        """Get the key the client stores the value under."""
+        return self.key or prop_key
+
+    def expires_at(self) -> int | None:
+        """Get the expiry timestamp in milliseconds, if a TTL is configured."""
+        if self.ttl is None:
+            return None
+
+        return int((time.time() + self.ttl) * 1000)
+
+
+class PrefetchedProp(CallableProp):
+    """
+    A deferred property whose group was computed ahead of its partial request.
+
+    The future resolves to the resolved props of the whole group. If that
+    computation failed or does not finish within `timeout` seconds, the
+    original prop is resolved instead.
+    """
+
+    track_latency = False
+
+    def __init__(self, prop: t.Any, future: Future, key: str, timeout: float):
+        super().__init__(prop)
+
+        self._future = future
+        self._key = key
+        self._timeout = timeout
+
+    def __call__(self):
+        try:
+            return self._future.result(self._timeout)[self._key]
+        except Exception:
+            return super().__call__()
+
+    async def resolve_async(self):
+        try:
+            group = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(self._future)), self._timeout
+            )
+
+            return group[self._key]
+        except Exception:
+            return await super().resolve_async()
+
+
 class MergeProp(IgnoreFirstLoad, CallableProp):
     """
     A property that merges with existing client-side data during partial reloads.
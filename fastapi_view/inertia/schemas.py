@@ -0,0 +1,186 @@
+import dataclasses
+import datetime
+import enum
+import ipaddress
+import pathlib
+import typing as t
+import uuid
+
+from fastapi.encoders import ENCODERS_BY_TYPE
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import PydanticSerializationError
+from typing_extensions import is_typeddict
+
+from .encoder import JSONStream, RawJSON, type_encoders
+from .props import StaticProp
+
+# Values that already have their own encoding
+_PRE_ENCODED = (RawJSON, JSONStream, StaticProp)
+
+# Types whose FastAPI encoder pydantic's JSON serializer agrees with. Aware
+# datetimes ("Z" vs "+00:00"), Decimal and timedelta are encoded differently.
+_PYDANTIC_MATCHES = (
+    bytes,
+    datetime.date,
+    datetime.time,
+    enum.Enum,
+    ipaddress.IPv4Address,
+    ipaddress.IPv4Interface,
+    ipaddress.IPv4Network,
+    ipaddress.IPv6Address,
+    ipaddress.IPv6Interface,
+    ipaddress.IPv6Network,
+    pathlib.Path,
+    uuid.UUID,
+)
+
+
+class PropsSchemaError(TypeError):
+    """A prop value does not match the type declared in its component schema."""
+
+
+class ComponentSchema:
+    """
+    The declared props of a component, with one serializer per prop.
+
+    `schema` is a TypedDict or a pydantic model whose fields are the prop keys.
+    The serializers are built once, so encoding a prop skips the per-value type
+    dispatch of `jsonable_encoder`. Props declaring types that pydantic encodes
+    differently than the generic encoder, such as Decimal or types with a
+    registered encoder, are left to the generic encoder so that declaring a
+    schema never changes the page. With `check`, values are validated
+    strictly against their declared type first, and raise PropsSchemaError on
+    a mismatch. Dicts are valid values for model and TypedDict types, as
+    props are commonly passed as plain data.
+    """
+
+    def __init__(self, schema: type):
+        self.schema = schema
+        self.adapters: dict[str, TypeAdapter] = {}
+
+        self._types: dict[str, frozenset] = {}
+        self._serialized: frozenset[str] = frozenset()
+        self._generation: int | None = None
+
+        for key, annotation in _prop_types(schema).items():
+            try:
+                self.adapters[key] = TypeAdapter(annotation)
+            except Exception:
+                # Types pydantic has no schema for use the generic encoder
+                continue
+
+            self._types[key] = frozenset(_leaf_types(annotation, set()))
+
+    def encode(self, key: str, value: t.Any, check: bool = False) -> t.Any:
+        """Encode a declared prop to a RawJSON fragment, else return it as is."""
+        adapter = self.adapters.get(key)
+        if adapter is None or isinstance(value, _PRE_ENCODED):
+            return value
+
+        if check:
+            try:
+                adapter.validate_python(value, strict=True)
+            except ValidationError as exc:
+                raise PropsSchemaError(
+                    f"Prop '{key}' does not match {self.schema.__name__}: {exc}"
+                ) from exc
+
+        if key not in self._serialized_props():
+            return value
+
+        try:
+            encoded = adapter.dump_json(value, by_alias=True, warnings=False)
+        except PydanticSerializationError:
+            return value
+
+        return RawJSON(encoded)
+
+    def _serialized_props(self) -> frozenset[str]:
+        # Registered encoders may change which types pydantic can encode
+        if self._generation != type_encoders.generation:
+            self._serialized = frozenset(
+                key
+                for key, types in self._types.items()
+                if all(_encoded_alike(value_type) for value_type in types)
+            )
+            self._generation = type_encoders.generation
+
+        return self._serialized
+
+
+def _prop_types(schema: type) -> dict[str, t.Any]:
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return {name: field.annotation for name, field in schema.model_fields.items()}
+
+    return t.get_type_hints(schema)
+
+
+def _leaf_types(annotation: t.Any, seen: set) -> t.Iterator[type]:
+    """
+    Yield the value types a prop annotation may contain.
+
+    Containers, unions, TypedDicts and dataclasses are walked, models are
+    yielded whole. Annotations without a fixed type yield `object`.
+    """
+    origin = t.get_origin(annotation)
+    if origin is t.Annotated:
+        yield from _leaf_types(t.get_args(annotation)[0], seen)
+    elif origin is t.Literal:
+        yield from (type(value) for value in t.get_args(annotation))
+    elif origin is not None:
+        if isinstance(origin, type):
+            yield origin
+
+        for arg in t.get_args(annotation):
+            if arg is not Ellipsis:
+                yield from _leaf_types(arg, seen)
+    elif annotation is None or annotation is type(None):
+        return
+    elif not isinstance(annotation, type):
+        # Any, type variables and forward references
+        yield object
+    elif annotation in seen:
+        return
+    elif is_typeddict(annotation) or dataclasses.is_dataclass(annotation):
+        seen.add(annotation)
+        for field_type in t.get_type_hints(annotation).values():
+            yield from _leaf_types(field_type, seen)
+    else:
+        yield annotation
+
+
+def _encoded_alike(value_type: type) -> bool:
+    """Whether pydantic encodes values of a type like `to_jsonable` does."""
+    if value_type is object:
+        return False
+
+    if issubclass(value_type, BaseModel):
+        # Models are encoded by pydantic on the generic path too
+        return True
+
+    encoder = type_encoders.lookup(value_type)
+    if encoder is None:
+        return True
+
+    return (
+        issubclass(value_type, _PYDANTIC_MATCHES)
+        and not issubclass(value_type, datetime.datetime)
+        and encoder is _fastapi_encoder(value_type)
+    )
+
+
+def _fastapi_encoder(value_type: type) -> t.Callable[[t.Any], t.Any] | None:
+    for base in value_type.__mro__:
+        if base in ENCODERS_BY_TYPE:
+            return ENCODERS_BY_TYPE[base]
+
+    return None
+
+
+component_schemas: dict[str, ComponentSchema] = {}
+
+
+def register_component(component: str, props: type) -> ComponentSchema:
+    schema = component_schemas[component] = ComponentSchema(props)
+
+    return schema
@@ -0,0 +1,113 @@
+import inspect
+import typing as t
+
+from fastapi import Request
+
+from .encoder import RawJSON, dumps, to_jsonable
+from .props import CallableProp
+
+_NOT_RESOLVED = object()
+
+
+class SharedProvider:
+    """
+    An app-level shared prop, computed from the request by `provider`.
+
+    The provider may be a function or a coroutine function taking the request;
+    coroutine functions are only resolved by `render_async`.
+    A static provider does not depend on the request: it is evaluated the first
+    time it is sent and its JSON encoding is spliced into every later response
+    of the process.
+    """
+
+    def __init__(self, provider: t.Callable[[Request], t.Any], static: bool = False):
+        self.provider = provider
+        self.static = static
+
+        self._encoded: t.Any = _NOT_RESOLVED
+
+    def bind(self, request: Request) -> "ProvidedProp":
+        return ProvidedProp(self, request)
+
+    def encode(self, value: t.Any) -> t.Any:
+        # Concurrent first uses may both encode, the first stored value wins.
+        if self._encoded is _NOT_RESOLVED:
+            self._encoded = RawJSON(dumps(to_jsonable(value), ensure_ascii=False))
+
+        return self._encoded
+
+    def clear(self) -> None:
+        self._encoded = _NOT_RESOLVED
+
+
+class ProvidedProp(CallableProp):
+    """A shared provider bound to one request, resolved at most once."""
+
+    def __init__(self, provider: SharedProvider, request: Request):
+        super().__init__(provider.provider)
+
+        self._provider = provider
+        self._request = request
+        self._value: t.Any = _NOT_RESOLVED
+
+    @property
+    def track_latency(self) -> bool:
+        # Static values are only computed once, there is nothing to measure.
+        return not self._cached
+
+    @property
+    def _cached(self) -> bool:
+        return (
+            self._value is not _NOT_RESOLVED
+            or self._provider._encoded is not _NOT_RESOLVED
+        )
+
+    def __call__(self):
+        if self._provider.static and self._provider._encoded is not _NOT_RESOLVED:
+            return self._provider._encoded
+
+        if self._value is _NOT_RESOLVED:
+            value = self._prop(self._request)
+            if inspect.isawaitable(value):
+                if inspect.iscoroutine(value):
+                    value.close()
+
+                raise TypeError(
+                    f"Shared provider {self._provider_name} is async, "
+                    "use render_async() to render it."
+                )
+
+            self._value = self._finish(value)
+
+        return self._value
+
+    async def resolve_async(self):
+        if self._provider.static and self._provider._encoded is not _NOT_RESOLVED:
+            return self._provider._encoded
+
+        if self._value is _NOT_RESOLVED:
+            value = self._prop(self._request)
+            if inspect.isawaitable(value):
+                value = await value
+
+            self._value = self._finish(value)
+
+        return self._value
+
+    @property
+    def _provider_name(self) -> str:
+        return getattr(self._prop, "__qualname__", repr(self._prop))
+
+    def _finish(self, value: t.Any) -> t.Any:
+        return self._provider.encode(value) if self._provider.static else value
+
+
+shared_providers: dict[str, SharedProvider] = {}
+
+
+def share_provider(
+    key: str, provider: t.Callable[[Request], t.Any], static: bool = False
+) -> SharedProvider:
+    shared = shared_providers[key] = SharedProvider(provider, static)
+
+    return shared
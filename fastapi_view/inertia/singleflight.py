@@ -0,0 +1,128 @@
+import asyncio
+import inspect
+import threading
+import typing as t
+from concurrent.futures import Future
+
+# Settles the shared future of a leader that was cancelled or interrupted
+_ABANDONED = object()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent computations that share a key.
+
+    The first caller for a key runs the computation, callers arriving while it
+    is still in flight wait for it and share its result (or exception). Once the
+    computation settles the key is released, so later calls compute afresh.
+    A leader that is cancelled releases the key without failing its followers:
+    they join again and one of them takes over the computation.
+
+    In-flight calls are tracked as `concurrent.futures.Future` objects, which
+    lets worker threads (sync endpoints) and event loops (async endpoints) wait
+    on the same computation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[t.Hashable, Future] = {}
+
+    def call(self, key: t.Hashable, fn: t.Callable[[], t.Any]) -> t.Any:
+        """Run `fn` once per key among concurrent callers, blocking followers."""
+        while True:
+            future, is_leader = self._join(key)
+            if is_leader:
+                break
+
+            if _in_event_loop():
+                # Blocking the loop thread could deadlock an async leader that
+                # runs on the same loop, so compute independently instead.
+                return fn()
+
+            result = future.result()
+            if result is not _ABANDONED:
+                return result
+
+        try:
+            result = fn()
+        except Exception as exc:
+            self._settle(key, future, exception=exc)
+            raise
+        except BaseException:
+            self._settle(key, future, result=_ABANDONED)
+            raise
+
+        self._settle(key, future, result=result)
+
+        return result
+
+    async def acall(self, key: t.Hashable, fn: t.Callable[[], t.Any]) -> t.Any:
+        """Async variant of `call`; `fn` may return a value or an awaitable."""
+        while True:
+            future, is_leader = self._join(key)
+            if is_leader:
+                break
+
+            # Shield so a cancelled follower does not cancel the shared future.
+            result = await asyncio.shield(asyncio.wrap_future(future))
+            if result is not _ABANDONED:
+                return result
+
+        try:
+            result = fn()
+            if inspect.isawaitable(result):
+                result = await result
+        except Exception as exc:
+            self._settle(key, future, exception=exc)
+            raise
+        except BaseException:
+            # Cancellation belongs to the leader's request, not the followers'
+            self._settle(key, future, result=_ABANDONED)
+            raise
+
+        self._settle(key, future, result=result)
+
+        return result
+
+    def in_flight(self, key: t.Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def _join(self, key: t.Hashable) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+
+            future = Future()
+            self._calls[key] = future
+
+            return future, True
+
+    def _settle(
+        self,
+        key: t.Hashable,
+        future: Future,
+        result: t.Any = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+    return True
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,53 @@
+import math
+import threading
+from collections import deque
+
+StatsKey = tuple[str | None, str]
+
+
+class LatencyStats:
+    """
+    Rolling prop resolution latencies per (component, prop key).
+
+    Only the latest `window` samples of each prop are kept, so percentiles
+    follow changes in data size and load instead of the process lifetime.
+    """
+
+    def __init__(self, window: int = 100):
+        self._lock = threading.Lock()
+        self._samples: dict[StatsKey, deque[float]] = {}
+        self.window = window
+
+    def record(self, component: str | None, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get((component, key))
+            if samples is None:
+                samples = self._samples[(component, key)] = deque(maxlen=self.window)
+
+            samples.append(seconds)
+
+    def percentile(
+        self, component: str | None, key: str, q: float = 0.95
+    ) -> float | None:
+        """Get the `q` percentile (nearest-rank) in seconds, None without samples."""
+        with self._lock:
+            samples = sorted(self._samples.get((component, key), ()))
+
+        if not samples:
+            return None
+
+        return samples[max(math.ceil(q * len(samples)) - 1, 0)]
+
+    def p95(self, component: str | None, key: str) -> float | None:
+        return self.percentile(component, key, 0.95)
+
+    def count(self, component: str | None, key: str) -> int:
+        with self._lock:
+            return len(self._samples.get((component, key), ()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+latency_stats = LatencyStats()
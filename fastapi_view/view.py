@@ -3,6 +3,7 @@ from fastapi.responses import Response
 from fastapi.templating import Jinja2Templates
 from starlette.background import BackgroundTask
 
+from fastapi_view.compression import compress_response
 from fastapi_view.config import ViewSettings
 
 
@@ -25,11 +26,12 @@ class ViewContext:
         headers: dict[str, str] | None = None,
         media_type: str | None = None,
         background: BackgroundTask | None = None,
+        compress: bool = True,
     ) -> Response:
         if not view.endswith(".html"):
             view = f"{view}.html"
 
-        return self._templates.TemplateResponse(
+        response = self._templates.TemplateResponse(
             request=self._request,
             name=view,
             context=context,
@@ -39,6 +41,11 @@ class ViewContext:
             background=background,
         )
 
+        if not compress:
+            return response
+
+        return compress_response(self._request, response)
+
 
 def get_view_context(request: Request):
     return ViewContext(request=request)
@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_view import ViewDepends, compression
+from fastapi_view.compression import configure_compression
+from fastapi_view.inertia import InertiaDepends
+from fastapi_view.inertia.enums import InertiaHeader
+
+ROWS = [{"id": index, "name": f"Row {index}"} for index in range(100)]
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+    monkeypatch.setattr(compression, "_compressor", None)
+
+    configure_compression(enabled=True, encodings=["gzip"])
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI(title="Compression Integration Test App")
+
+    @app.get("/rows")
+    def rows(inertia: InertiaDepends):
+        return inertia.render("Rows", {"rows": ROWS})
+
+    @app.get("/streamed-rows")
+    def streamed_rows(inertia: InertiaDepends):
+        return inertia.render("Rows", {"rows": lambda: iter(ROWS)})
+
+    @app.get("/small")
+    def small(inertia: InertiaDepends):
+        return inertia.render("Small", {"id": 1})
+
+    @app.get("/")
+    def index(view: ViewDepends):
+        return view.render("index", {"name": "World " * 200})
+
+    return app
+
+
+def test_inertia_json_response_compressed(app):
+    """Test Inertia JSON responses are gzip-compressed"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/rows",
+            headers={InertiaHeader.INERTIA: "true", "Accept-Encoding": "gzip"},
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"].startswith('W/"')
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json()["props"]["rows"] == ROWS
+
+
+def test_not_modified_with_compressed_etag(app):
+    """Test the weakened ETag still revalidates the page"""
+    with TestClient(app) as client:
+        headers = {InertiaHeader.INERTIA: "true", "Accept-Encoding": "gzip"}
+        etag = client.get("/rows", headers=headers).headers["etag"]
+
+        response = client.get("/rows", headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert "content-encoding" not in response.headers
+
+
+def test_streamed_inertia_response_compressed(app):
+    """Test streaming responses are compressed while they are sent"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/streamed-rows",
+            headers={InertiaHeader.INERTIA: "true", "Accept-Encoding": "gzip"},
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["props"]["rows"] == ROWS
+
+
+def test_small_response_not_compressed(app):
+    """Test responses under the threshold are sent as is"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/small",
+            headers={InertiaHeader.INERTIA: "true", "Accept-Encoding": "gzip"},
+        )
+
+        assert "content-encoding" not in response.headers
+
+
+@pytest.mark.parametrize("path", ["/", "/rows"])
+def test_html_responses_compressed(app, path):
+    """Test ViewContext renders are compressed, including Inertia pages"""
+    with TestClient(app) as client:
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.headers["content-encoding"] == "gzip"
+
+
+def test_identity_requested(app):
+    """Test clients not accepting gzip get plain responses"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/rows",
+            headers={InertiaHeader.INERTIA: "true", "Accept-Encoding": "identity"},
+        )
+
+        assert "content-encoding" not in response.headers
+        assert response.json()["props"]["rows"] == ROWS
@@ -11,6 +11,7 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from fastapi_view.inertia import Inertia, InertiaDepends
 from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.inertia import VARY_HEADERS
 from fastapi_view.inertia.props import OptionalProp
 
 
@@ -78,6 +79,33 @@ def app() -> FastAPI:
 
         return inertia.render("SharedDemo", {"page_data": "Page specific data"})
 
+    @app.get("/lazy-shared-demo")
+    def lazy_shared_demo(inertia: InertiaDepends):
+        def get_permissions():
+            app.state.permission_calls += 1
+
+            return ["edit"]
+
+        inertia.share("app_name", "Test App")
+        inertia.share("permissions", get_permissions)
+
+        return inertia.render("LazySharedDemo", {"page_data": "Page specific data"})
+
+    app.state.permission_calls = 0
+
+    @app.get("/async-demo")
+    async def async_demo(inertia: InertiaDepends):
+        async def get_stats():
+            return {"views": 100}
+
+        return await inertia.render_async(
+            "AsyncDemo",
+            {
+                "stats": inertia.coalesce(get_stats, key="async-demo.stats"),
+                "lazy_data": inertia.optional(get_stats),
+            },
+        )
+
     return app
 
 
@@ -114,7 +142,7 @@ def test_inertia_json_response(app):
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/json"
         assert response.headers[InertiaHeader.INERTIA] == "True"
-        assert response.headers["vary"] == "Accept"
+        assert response.headers["vary"] == ", ".join(VARY_HEADERS)
 
         data = response.json()
         assert data["component"] == "Index"
@@ -160,7 +188,7 @@ def test_inertia_partial_request(app):
         data = response.json()
 
         props = data["props"]
-        assert "flash" in props
+        assert "flash" not in props
         assert "public_data" in props
         assert "timestamp" in props
         assert "private_data" not in props
@@ -183,7 +211,7 @@ def test_inertia_partial_request_with_except(app):
         data = response.json()
 
         props = data["props"]
-        assert "flash" in props
+        assert "flash" not in props
         assert "public_data" in props
         assert "timestamp" in props
         assert "private_data" not in props
@@ -205,6 +233,48 @@ def test_inertia_shared_props(app):
         assert props["page_data"] == "Page specific data"
 
 
+def test_inertia_shared_callables_resolved_lazily(app):
+    """Test shared callables are resolved and filtered like page props"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/lazy-shared-demo", headers={InertiaHeader.INERTIA: "true"}
+        )
+
+        assert response.json()["props"]["permissions"] == ["edit"]
+        assert app.state.permission_calls == 1
+
+        response = client.get(
+            "/lazy-shared-demo",
+            headers={
+                InertiaHeader.INERTIA: "true",
+                InertiaHeader.PARTIAL_COMPONENT: "LazySharedDemo",
+                InertiaHeader.PARTIAL_ONLY: "page_data",
+            },
+        )
+
+        assert response.json()["props"] == {"page_data": "Page specific data"}
+        assert app.state.permission_calls == 1
+
+
+def test_inertia_shared_props_filtered_by_except_keys(app):
+    """Test partial except keys apply to shared props"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/shared-demo",
+            headers={
+                InertiaHeader.INERTIA: "true",
+                InertiaHeader.PARTIAL_COMPONENT: "SharedDemo",
+                InertiaHeader.PARTIAL_EXCEPT: "user",
+                InertiaHeader.PARTIAL_ONLY: "app_name, user.name, page_data",
+            },
+        )
+
+        assert response.json()["props"] == {
+            "app_name": "Test App",
+            "page_data": "Page specific data",
+        }
+
+
 def test_inertia_callable_props(app):
     """Test dynamic property resolution"""
 
@@ -268,12 +338,33 @@ def test_inertia_optional_prop_in_partial(app):
         data = response.json()
         props = data["props"]
 
-        assert "flash" in props
+        assert "flash" not in props
         # Specified OptionalProp should exist in partial request
         assert "lazy_data" in props
         assert props["lazy_data"] == "Lazy loaded data"
 
 
+def test_inertia_render_async(app):
+    """Test render_async resolves coroutine props in async endpoints"""
+
+    with TestClient(app) as client:
+        response = client.get("/async-demo", headers={InertiaHeader.INERTIA: "true"})
+
+        assert response.status_code == 200
+        assert response.json()["props"] == {"flash": {}, "stats": {"views": 100}}
+
+        response = client.get(
+            "/async-demo",
+            headers={
+                InertiaHeader.INERTIA: "true",
+                InertiaHeader.PARTIAL_COMPONENT: "AsyncDemo",
+                InertiaHeader.PARTIAL_ONLY: "lazy_data",
+            },
+        )
+
+        assert response.json()["props"] == {"lazy_data": {"views": 100}}
+
+
 @pytest.fixture
 def app_with_session() -> FastAPI:
     """FastAPI app with SessionMiddleware for flash tests"""
@@ -359,6 +450,28 @@ def test_flash_messages_with_shared_props(app_with_session):
         assert props["stats"]["views"] == 100
 
 
+def test_flash_messages_kept_when_filtered_out(app_with_session):
+    """Test flash messages stay in the session until a response sends them"""
+    with TestClient(app_with_session) as client:
+        response = client.post(
+            "/create-user",
+            headers={
+                InertiaHeader.INERTIA: "true",
+                InertiaHeader.PARTIAL_COMPONENT: "CreateUser",
+                InertiaHeader.PARTIAL_ONLY: "user_id",
+            },
+        )
+
+        assert response.json()["props"] == {"user_id": 123}
+
+        response = client.get("/dashboard", headers={InertiaHeader.INERTIA: "true"})
+
+        assert response.json()["props"]["flash"] == {
+            "success": "User created successfully",
+            "info": "Check your email for confirmation",
+        }
+
+
 def test_flash_supports_complex_data_types(app_with_session):
     """Test flash messages support complex data types"""
     with TestClient(app_with_session) as client:
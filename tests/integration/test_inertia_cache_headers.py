@@ -0,0 +1,138 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from fastapi_view.inertia import Inertia, InertiaDepends
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.hashes import hashed_components
+
+INERTIA_HEADERS = {InertiaHeader.INERTIA: "true"}
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+    yield
+
+    hashed_components.clear()
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI(title="Cache Headers Integration Test App")
+    app.add_middleware(SessionMiddleware, secret_key="test-secret")
+
+    @app.get("/pricing")
+    def pricing(inertia: InertiaDepends):
+        return inertia.render(
+            "Pricing",
+            {"plans": [{"name": "Pro"}]},
+            cache_control="public, max-age=0, s-maxage=300",
+            surrogate_keys=["pricing", "plans"],
+        )
+
+    @app.get("/account")
+    def account(inertia: InertiaDepends):
+        return inertia.render("Account", {"name": "John"})
+
+    @app.post("/subscribe")
+    def subscribe(inertia: InertiaDepends):
+        inertia.flash("success", "Subscribed")
+
+        return inertia.render(
+            "Pricing", {"plans": []}, cache_control="public, s-maxage=300"
+        )
+
+    return app
+
+
+def vary(response) -> list[str]:
+    return [header.strip() for header in response.headers["vary"].split(",")]
+
+
+def test_html_response_varies_by_inertia_header(app):
+    """Test the HTML page is not served to Inertia visits from a shared cache"""
+    with TestClient(app) as client:
+        response = client.get("/account")
+
+        assert InertiaHeader.INERTIA in vary(response)
+        assert "cache-control" not in response.headers
+
+
+def test_json_response_varies_by_partial_headers(app):
+    """Test every header selecting a JSON variant is listed in Vary"""
+    with TestClient(app) as client:
+        response = client.get("/account", headers=INERTIA_HEADERS)
+
+        assert vary(response) == [
+            InertiaHeader.INERTIA,
+            InertiaHeader.PARTIAL_COMPONENT,
+            InertiaHeader.PARTIAL_ONLY,
+            InertiaHeader.PARTIAL_EXCEPT,
+            InertiaHeader.PARTIAL_GROUPS,
+            InertiaHeader.EXCEPT_ONCE_PROPS,
+            "Cookie",
+        ]
+
+
+def test_hashed_components_vary_by_prop_hashes(app):
+    """Test the echoed prop hashes select a variant as well"""
+    Inertia.hash_props("Account")
+
+    with TestClient(app) as client:
+        response = client.get("/account", headers=INERTIA_HEADERS)
+
+        assert InertiaHeader.PROP_HASHES in vary(response)
+
+
+@pytest.mark.parametrize("headers", [{}, INERTIA_HEADERS])
+def test_cache_control_and_surrogate_keys(app, headers):
+    """Test cache headers are declared per render on both variants"""
+    with TestClient(app) as client:
+        response = client.get("/pricing", headers=headers)
+
+        assert response.headers["cache-control"] == "public, max-age=0, s-maxage=300"
+        assert response.headers["surrogate-key"] == "pricing plans"
+
+
+def test_not_modified_keeps_cache_headers(app):
+    """Test revalidated responses refresh the cache headers"""
+    with TestClient(app) as client:
+        etag = client.get("/pricing", headers=INERTIA_HEADERS).headers["etag"]
+
+        response = client.get(
+            "/pricing", headers={**INERTIA_HEADERS, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "public, max-age=0, s-maxage=300"
+        assert InertiaHeader.PARTIAL_ONLY in vary(response)
+
+
+def test_surrogate_key_header_setting(app, monkeypatch):
+    """Test the surrogate key header name is configurable"""
+    monkeypatch.setenv("FV_INERTIA_SURROGATE_KEY_HEADER", "Cache-Tag")
+
+    with TestClient(app) as client:
+        response = client.get("/pricing", headers=INERTIA_HEADERS)
+
+        assert response.headers["cache-tag"] == "pricing plans"
+        assert "surrogate-key" not in response.headers
+
+
+def test_flashed_pages_kept_out_of_shared_caches(app):
+    """Test pages carrying flash messages are never publicly cacheable"""
+    with TestClient(app) as client:
+        response = client.post("/subscribe", headers=INERTIA_HEADERS)
+
+        assert response.json()["props"]["flash"] == {"success": "Subscribed"}
+        assert response.headers["cache-control"] == "private, no-cache"
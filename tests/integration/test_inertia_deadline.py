@@ -0,0 +1,274 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from fastapi_view.inertia import InertiaDepends
+from fastapi_view.inertia.concurrency import RENDER_MAX_WORKERS, executor
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.prefetch import prefetch_cache
+from fastapi_view.inertia.stats import latency_stats
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+    prefetch_cache.clear()
+    latency_stats.clear()
+
+
+@pytest.fixture
+def calls() -> dict:
+    return {"report": 0, "async_report": 0}
+
+
+@pytest.fixture
+def app(calls) -> FastAPI:
+    app = FastAPI(title="Deadline Integration Test App")
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+
+    def slow_report():
+        calls["report"] += 1
+        time.sleep(0.3)
+
+        return {"rows": 10}
+
+    async def slow_async_report():
+        calls["async_report"] += 1
+        await asyncio.sleep(0.3)
+
+        return {"rows": 20}
+
+    async def fast_async_stats():
+        return {"users": 3}
+
+    @app.get("/reports")
+    def reports(inertia: InertiaDepends):
+        return inertia.render(
+            "Reports",
+            {
+                "title": "Reports",
+                "stats": lambda: {"users": 3},
+                "nested": lambda: {"callback": lambda: "not called"},
+                "report": slow_report,
+                "optional": inertia.optional(slow_report),
+            },
+            deadline=0.1,
+        )
+
+    @app.get("/prefetched-reports")
+    def prefetched_reports(inertia: InertiaDepends):
+        return inertia.render(
+            "PrefetchedReports",
+            {"title": "Reports", "report": slow_report},
+            prefetch_deferred=True,
+            deadline=0.1,
+        )
+
+    @app.get("/async-reports")
+    async def async_reports(inertia: InertiaDepends):
+        return await inertia.render_async(
+            "AsyncReports",
+            {
+                "stats": fast_async_stats,
+                "sync_report": slow_report,
+                "async_report": slow_async_report,
+            },
+            deadline=0.1,
+        )
+
+    @app.get("/many")
+    def many(inertia: InertiaDepends):
+        def prop(index):
+            time.sleep(0.02)
+
+            return index
+
+        return inertia.render(
+            "Many",
+            {f"prop_{index}": lambda index=index: prop(index) for index in range(50)},
+            deadline=0.25,
+        )
+
+    @app.get("/threads")
+    def threads(inertia: InertiaDepends):
+        return inertia.render(
+            "Threads",
+            {
+                "endpoint": threading.get_ident(),
+                "known_fast": threading.get_ident,
+                "unknown": threading.get_ident,
+            },
+            deadline=0.25,
+        )
+
+    return app
+
+
+def partial_headers(component: str, only: str) -> dict:
+    return {
+        InertiaHeader.INERTIA: "true",
+        InertiaHeader.PARTIAL_COMPONENT: component,
+        InertiaHeader.PARTIAL_ONLY: only,
+    }
+
+
+def test_slow_props_are_deferred_after_deadline(app):
+    """Test props over the time budget are moved to deferredProps"""
+    with TestClient(app) as client:
+        started = time.monotonic()
+        response = client.get("/reports", headers={InertiaHeader.INERTIA: "true"})
+        elapsed = time.monotonic() - started
+
+        data = response.json()
+
+        assert elapsed < 0.3
+        assert data["props"]["title"] == "Reports"
+        assert data["props"]["stats"] == {"users": 3}
+        # Values resolved within the budget are not walked again
+        assert data["props"]["nested"]["callback"] != "not called"
+        assert "report" not in data["props"]
+        assert "optional" not in data["props"]
+        assert data["deferredProps"] == {"deadline": ["report"]}
+
+
+def test_deadline_deferred_props_served_on_partial_request(app):
+    """Test deadline-deferred props resolve on the follow-up partial request"""
+    with TestClient(app) as client:
+        response = client.get("/reports", headers=partial_headers("Reports", "report"))
+
+        data = response.json()
+
+        assert data["props"] == {"report": {"rows": 10}}
+        assert "deferredProps" not in data
+
+
+def test_render_async_defers_sync_and_async_props_after_deadline(app):
+    """Test render_async applies the budget to coroutine and sync props"""
+    with TestClient(app) as client:
+        started = time.monotonic()
+        response = client.get("/async-reports", headers={InertiaHeader.INERTIA: "true"})
+        elapsed = time.monotonic() - started
+
+        data = response.json()
+
+        assert elapsed < 0.3
+        assert data["props"] == {"flash": {}, "stats": {"users": 3}}
+        assert data["deferredProps"] == {"deadline": ["sync_report", "async_report"]}
+
+
+def test_deadline_props_do_not_queue_behind_other_requests(app):
+    """Test deadline props do not wait behind a busy prop executor"""
+    release = threading.Event()
+    blockers = [executor.submit(release.wait) for _ in range(executor._max_workers)]
+
+    try:
+        with TestClient(app) as client:
+            response = client.get("/many", headers={InertiaHeader.INERTIA: "true"})
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+
+    data = response.json()
+
+    assert "deferredProps" not in data
+    assert data["props"]["prop_49"] == 49
+
+
+def test_known_fast_props_resolve_inline(app):
+    """Test props with a fast measured p95 are not offloaded to a thread"""
+    for _ in range(5):
+        latency_stats.record("Threads", "known_fast", 0.001)
+
+    with TestClient(app) as client:
+        props = client.get("/threads", headers={InertiaHeader.INERTIA: "true"}).json()[
+            "props"
+        ]
+
+    assert props["known_fast"] == props["endpoint"]
+    assert props["unknown"] != props["endpoint"]
+    assert latency_stats.count("Threads", "known_fast") == 6
+
+
+def test_missed_results_parked_for_follow_up_request(app, calls):
+    """Test a prop that missed the deadline is not computed again"""
+    with TestClient(app) as client:
+        client.get("/reports", headers={InertiaHeader.INERTIA: "true"})
+
+        response = client.get("/reports", headers=partial_headers("Reports", "report"))
+
+        assert response.json()["props"] == {"report": {"rows": 10}}
+        assert calls["report"] == 1
+
+        # The parked result is consumed by the first follow-up
+        client.get("/reports", headers=partial_headers("Reports", "report"))
+
+        assert calls["report"] == 2
+
+
+def test_missed_async_results_parked_for_follow_up_request(app, calls):
+    """Test render_async keeps missed props running for the follow-up request"""
+    with TestClient(app) as client:
+        client.get("/async-reports", headers={InertiaHeader.INERTIA: "true"})
+
+        response = client.get(
+            "/async-reports",
+            headers=partial_headers("AsyncReports", "sync_report,async_report"),
+        )
+
+        assert response.json()["props"] == {
+            "sync_report": {"rows": 10},
+            "async_report": {"rows": 20},
+        }
+        assert calls == {"report": 1, "async_report": 1}
+
+
+def test_missed_props_not_prefetched_again(app, calls):
+    """Test prefetching leaves props that missed the deadline to their own park"""
+    with TestClient(app) as client:
+        client.get("/prefetched-reports", headers={InertiaHeader.INERTIA: "true"})
+
+        response = client.get(
+            "/prefetched-reports",
+            headers=partial_headers("PrefetchedReports", "report"),
+        )
+
+        assert response.json()["props"] == {"report": {"rows": 10}}
+        assert calls["report"] == 1
+
+
+def test_concurrent_renders_share_bounded_threads(app):
+    """Test the threads running deadline props are capped for the process"""
+    with TestClient(app) as client:
+        threads = [
+            threading.Thread(
+                target=client.get,
+                args=("/many",),
+                kwargs={"headers": {InertiaHeader.INERTIA: "true"}},
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    render_threads = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("fastapi-view-inertia-render")
+    ]
+
+    assert 0 < len(render_threads) <= RENDER_MAX_WORKERS
@@ -0,0 +1,171 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from fastapi_view.inertia import InertiaDepends
+from fastapi_view.inertia.enums import InertiaHeader
+
+INERTIA_HEADERS = {InertiaHeader.INERTIA: "true"}
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+
+@pytest.fixture
+def state() -> dict:
+    return {"calls": 0, "count": 1, "version": "v1"}
+
+
+@pytest.fixture
+def app(state) -> FastAPI:
+    app = FastAPI(title="ETag Integration Test App")
+    app.add_middleware(SessionMiddleware, secret_key="test-secret")
+
+    def count_messages():
+        state["calls"] += 1
+        return state["count"]
+
+    @app.get("/inbox")
+    def inbox(inertia: InertiaDepends):
+        return inertia.render("Inbox", {"count": count_messages, "title": "Inbox"})
+
+    @app.get("/versioned-inbox")
+    def versioned_inbox(inertia: InertiaDepends):
+        return inertia.render("Inbox", {"count": count_messages}, etag=state["version"])
+
+    @app.get("/async-versioned-inbox")
+    async def async_versioned_inbox(inertia: InertiaDepends):
+        return await inertia.render_async(
+            "Inbox", {"count": count_messages}, etag=state["version"]
+        )
+
+    @app.get("/flash")
+    def flash(request: Request):
+        request.session["flash"] = {"success": "Saved"}
+        return {}
+
+    return app
+
+
+def test_inertia_response_has_body_etag(app):
+    """Test Inertia JSON responses carry a hash of the body as ETag"""
+    with TestClient(app) as client:
+        first = client.get("/inbox", headers=INERTIA_HEADERS)
+        second = client.get("/inbox", headers=INERTIA_HEADERS)
+
+        assert first.status_code == 200
+        assert first.headers["etag"].startswith('"')
+        assert first.headers["etag"] == second.headers["etag"]
+
+
+def test_matching_body_etag_not_modified(app, state):
+    """Test an unchanged page is answered with 304 Not Modified"""
+    with TestClient(app) as client:
+        etag = client.get("/inbox", headers=INERTIA_HEADERS).headers["etag"]
+
+        response = client.get(
+            "/inbox", headers={**INERTIA_HEADERS, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert response.headers[InertiaHeader.INERTIA] == "True"
+
+        state["count"] = 2
+        response = client.get(
+            "/inbox", headers={**INERTIA_HEADERS, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["props"]["count"] == 2
+
+
+def test_html_response_has_no_etag(app):
+    """Test the first visit HTML page is not tagged"""
+    with TestClient(app) as client:
+        response = client.get("/inbox")
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+
+def test_partial_reloads_tagged_per_variant(app):
+    """Test partial reloads do not share the full page ETag"""
+    with TestClient(app) as client:
+        etag = client.get("/inbox", headers=INERTIA_HEADERS).headers["etag"]
+
+        response = client.get(
+            "/inbox",
+            headers={
+                **INERTIA_HEADERS,
+                InertiaHeader.PARTIAL_COMPONENT: "Inbox",
+                InertiaHeader.PARTIAL_ONLY: "count",
+                "If-None-Match": etag,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["props"] == {"count": 1}
+
+
+@pytest.mark.parametrize("path", ["/versioned-inbox", "/async-versioned-inbox"])
+def test_version_token_skips_prop_resolution(app, state, path):
+    """Test a matching version token answers 304 without resolving props"""
+    with TestClient(app) as client:
+        etag = client.get(path, headers=INERTIA_HEADERS).headers["etag"]
+
+        assert state["calls"] == 1
+
+        response = client.get(path, headers={**INERTIA_HEADERS, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert state["calls"] == 1
+
+        state["version"] = "v2"
+        response = client.get(path, headers={**INERTIA_HEADERS, "If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert state["calls"] == 2
+
+
+def test_version_token_etag_differs_per_partial_variant(app):
+    """Test the token ETag covers the partial reload headers"""
+    with TestClient(app) as client:
+        full = client.get("/versioned-inbox", headers=INERTIA_HEADERS)
+        partial = client.get(
+            "/versioned-inbox",
+            headers={
+                **INERTIA_HEADERS,
+                InertiaHeader.PARTIAL_COMPONENT: "Inbox",
+                InertiaHeader.PARTIAL_ONLY: "count",
+            },
+        )
+
+        assert full.headers["etag"] != partial.headers["etag"]
+
+
+def test_pending_flash_messages_bypass_not_modified(app, state):
+    """Test flash messages are delivered even when the page is unchanged"""
+    with TestClient(app) as client:
+        etag = client.get("/versioned-inbox", headers=INERTIA_HEADERS).headers["etag"]
+        client.get("/flash")
+
+        response = client.get(
+            "/versioned-inbox", headers={**INERTIA_HEADERS, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["props"]["flash"] == {"success": "Saved"}
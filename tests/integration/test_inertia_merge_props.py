@@ -10,6 +10,7 @@ from pyquery import PyQuery as pq
 
 from fastapi_view.inertia import Inertia, InertiaDepends
 from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.inertia import VARY_HEADERS
 
 
 class Post(BaseModel):
@@ -494,4 +495,4 @@ def test_merge_props_response_headers(client: TestClient):
 
     assert response.status_code == 200
     assert response.headers[InertiaHeader.INERTIA] == "True"
-    assert response.headers["Vary"] == "Accept"
+    assert response.headers["Vary"] == ", ".join(VARY_HEADERS)
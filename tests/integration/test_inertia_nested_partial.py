@@ -0,0 +1,193 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from fastapi_view.inertia import InertiaDepends
+from fastapi_view.inertia.enums import InertiaHeader
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+
+class Contact(BaseModel):
+    id: int
+    first_name: str = Field(alias="firstName")
+
+
+class ContactPage(BaseModel):
+    data: list[Contact]
+    total: int
+    links: dict[str, str | None]
+
+
+CONTACT_PAGE = ContactPage(
+    data=[Contact(id=1, firstName="John")],
+    total=1,
+    links={"next": None},
+)
+
+
+@pytest.fixture
+def calls() -> list:
+    return []
+
+
+@pytest.fixture
+def app(calls: list) -> FastAPI:
+    app = FastAPI(title="Nested Partial Reload Integration Test App")
+
+    def track(name, value):
+        def resolve():
+            calls.append(name)
+
+            return value
+
+        return resolve
+
+    @app.get("/contacts")
+    def contacts(inertia: InertiaDepends):
+        return inertia.render(
+            "Contacts/Index",
+            {
+                "contacts": {
+                    "data": track("data", [{"id": 1}]),
+                    "links": track("links", {"next": "/contacts?page=2"}),
+                },
+                "user": {
+                    "name": "John",
+                    "permissions": inertia.optional(track("permissions", ["edit"])),
+                    "teams": inertia.defer(track("teams", ["core"]), group="teams"),
+                },
+                "filters": track("filters", {"search": "", "trashed": {"with": False}}),
+            },
+        )
+
+    @app.get("/contact-pages")
+    def contact_pages(inertia: InertiaDepends):
+        return inertia.render(
+            "Contacts/Index",
+            {"contacts": lambda: CONTACT_PAGE, "page": CONTACT_PAGE},
+        )
+
+    return app
+
+
+def partial_headers(only: str | None = None, excluded: str | None = None) -> dict:
+    headers = {
+        InertiaHeader.INERTIA: "true",
+        InertiaHeader.PARTIAL_COMPONENT: "Contacts/Index",
+    }
+    if only is not None:
+        headers[InertiaHeader.PARTIAL_ONLY] = only
+    if excluded is not None:
+        headers[InertiaHeader.PARTIAL_EXCEPT] = excluded
+
+    return headers
+
+
+def test_nested_lazy_props_left_out_of_initial_load(app, calls):
+    """Test nested optional and deferred props are not resolved initially"""
+    with TestClient(app) as client:
+        response = client.get("/contacts", headers={InertiaHeader.INERTIA: "true"})
+
+        data = response.json()
+
+        assert data["props"]["user"] == {"name": "John"}
+        assert data["deferredProps"] == {"teams": ["user.teams"]}
+        assert "permissions" not in calls
+        assert "teams" not in calls
+
+
+def test_nested_only_key_resolves_requested_subtree(app, calls):
+    """Test a dotted only key resolves and sends just that sub-tree"""
+    with TestClient(app) as client:
+        response = client.get("/contacts", headers=partial_headers("contacts.data"))
+
+        assert response.json()["props"] == {
+            "contacts": {"data": [{"id": 1}]},
+        }
+        assert calls == ["data"]
+
+
+def test_nested_only_key_resolves_lazy_prop_on_demand(app, calls):
+    """Test a nested optional prop is resolved when requested by path"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/contacts", headers=partial_headers("user.permissions, user.teams")
+        )
+
+        assert response.json()["props"] == {
+            "user": {"permissions": ["edit"], "teams": ["core"]},
+        }
+        assert calls == ["permissions", "teams"]
+
+
+def test_nested_only_key_prunes_callable_result(app):
+    """Test dict results of callables are pruned to the requested path"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/contacts", headers=partial_headers("filters.trashed.with")
+        )
+
+        assert response.json()["props"] == {
+            "filters": {"trashed": {"with": False}},
+        }
+
+
+def test_nested_except_key_drops_subtree(app, calls):
+    """Test a dotted except key drops only that sub-tree"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/contacts", headers=partial_headers("contacts", "contacts.links")
+        )
+
+        assert response.json()["props"] == {
+            "contacts": {"data": [{"id": 1}]},
+        }
+        assert calls == ["data"]
+
+
+def test_nested_deferred_props_loaded_by_group(app, calls):
+    """Test nested deferred props are served for their requested group"""
+    with TestClient(app) as client:
+        headers = partial_headers()
+        headers[InertiaHeader.PARTIAL_GROUPS] = "teams"
+
+        response = client.get("/contacts", headers=headers)
+
+        assert response.json()["props"] == {
+            "user": {"teams": ["core"]},
+        }
+        assert calls == ["teams"]
+
+
+def test_nested_keys_prune_pydantic_models(app):
+    """Test model values and callable results are pruned by their sent keys"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/contact-pages",
+            headers=partial_headers("contacts.data, page.total", "page.links"),
+        )
+
+        assert response.json()["props"] == {
+            "contacts": {"data": [{"id": 1, "firstName": "John"}]},
+            "page": {"total": 1},
+        }
+
+        response = client.get(
+            "/contact-pages", headers=partial_headers("page", "page.data")
+        )
+
+        assert response.json()["props"] == {
+            "page": {"total": 1, "links": {"next": None}}
+        }
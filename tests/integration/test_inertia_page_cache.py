@@ -0,0 +1,238 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from fastapi_view.inertia import Inertia, InertiaDepends
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.cache import CacheError, MemoryCache
+from fastapi_view.inertia.page_cache import configure_page_cache, page_cache
+
+INERTIA_HEADERS = {InertiaHeader.INERTIA: "true"}
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+    configure_page_cache(MemoryCache())
+
+
+@pytest.fixture
+def calls() -> list[str]:
+    return []
+
+
+def user_role(request: Request) -> str:
+    return request.headers.get("X-Role", "guest")
+
+
+@pytest.fixture
+def app(calls) -> FastAPI:
+    app = FastAPI(title="Page Cache Integration Test App")
+    app.add_middleware(SessionMiddleware, secret_key="test-secret")
+
+    def report():
+        calls.append("report")
+        return {"total": len(calls)}
+
+    @app.get("/reports")
+    @Inertia.cache_page(ttl=60, vary_by={"role": user_role}, tags=["reports"])
+    def reports(inertia: InertiaDepends):
+        return inertia.render("Reports", {"report": report, "summary": report})
+
+    @app.get("/async-reports")
+    @Inertia.cache_page(ttl=60)
+    async def async_reports(request: Request, inertia: InertiaDepends):
+        assert isinstance(request, Request)
+
+        return await inertia.render_async("Reports", {"report": report})
+
+    @app.get("/expired-reports")
+    @Inertia.cache_page(ttl=0)
+    def expired_reports(inertia: InertiaDepends):
+        return inertia.render("Reports", {"report": report})
+
+    @app.get("/polled-reports")
+    @Inertia.cache_page(ttl=60)
+    def polled_reports(inertia: InertiaDepends):
+        calls.append("polled")
+        return inertia.render("Reports", {"report": {"total": 1}})
+
+    @app.get("/flash")
+    def flash(inertia: InertiaDepends):
+        inertia.flash("success", "Saved")
+        return {}
+
+    return app
+
+
+def test_cache_hit_skips_endpoint(app, calls):
+    """Test a cached page is served without resolving props"""
+    with TestClient(app) as client:
+        first = client.get("/reports", headers=INERTIA_HEADERS)
+        second = client.get("/reports", headers=INERTIA_HEADERS)
+
+        assert calls == ["report", "report"]
+        assert second.content == first.content
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.headers[InertiaHeader.INERTIA] == "True"
+        assert second.headers["content-type"] == "application/json"
+
+
+def test_html_and_json_cached_separately(app, calls):
+    """Test the HTML page and the Inertia JSON are separate entries"""
+    with TestClient(app) as client:
+        html = client.get("/reports")
+        json_response = client.get("/reports", headers=INERTIA_HEADERS)
+
+        assert html.headers["content-type"] == "text/html; charset=utf-8"
+        assert json_response.headers["content-type"] == "application/json"
+        assert client.get("/reports").content == html.content
+        assert len(calls) == 4
+
+
+def test_partial_reloads_cached_separately(app):
+    """Test partial reload variants do not share an entry"""
+    with TestClient(app) as client:
+        client.get("/reports", headers=INERTIA_HEADERS)
+        partial = client.get(
+            "/reports",
+            headers={
+                **INERTIA_HEADERS,
+                InertiaHeader.PARTIAL_COMPONENT: "Reports",
+                InertiaHeader.PARTIAL_ONLY: "report",
+            },
+        )
+
+        assert set(partial.json()["props"]) == {"report"}
+
+
+def test_segments_select_separate_pages(app, calls):
+    """Test vary_by segments key separate entries"""
+    with TestClient(app) as client:
+        admin = client.get("/reports", headers={**INERTIA_HEADERS, "X-Role": "admin"})
+        guest = client.get("/reports", headers=INERTIA_HEADERS)
+
+        assert admin.json()["props"] != guest.json()["props"]
+        assert len(calls) == 4
+
+        client.get("/reports", headers={**INERTIA_HEADERS, "X-Role": "admin"})
+
+        assert len(calls) == 4
+
+
+def test_invalidate_pages_by_tag(app, calls):
+    """Test declared and component tags invalidate cached pages"""
+    with TestClient(app) as client:
+        client.get("/reports", headers=INERTIA_HEADERS)
+        client.get("/async-reports", headers=INERTIA_HEADERS)
+
+        assert Inertia.invalidate_pages("reports") == 1
+
+        client.get("/reports", headers=INERTIA_HEADERS)
+        client.get("/async-reports", headers=INERTIA_HEADERS)
+
+        assert len(calls) == 5
+        assert Inertia.invalidate_pages("component:Reports") == 2
+        assert len(page_cache.backend) == 0
+
+
+def test_async_endpoint_cached(app, calls):
+    """Test async endpoints taking the request are cached as well"""
+    with TestClient(app) as client:
+        first = client.get("/async-reports", headers=INERTIA_HEADERS)
+        second = client.get("/async-reports", headers=INERTIA_HEADERS)
+
+        assert second.content == first.content
+        assert calls == ["report"]
+
+
+def test_expired_pages_rendered_again(app, calls):
+    """Test pages are only served within their TTL"""
+    with TestClient(app) as client:
+        client.get("/expired-reports", headers=INERTIA_HEADERS)
+        client.get("/expired-reports", headers=INERTIA_HEADERS)
+
+        assert calls == ["report", "report"]
+
+
+def test_cached_page_not_modified(app, calls):
+    """Test cache hits revalidate against the stored ETag"""
+    with TestClient(app) as client:
+        etag = client.get("/reports", headers=INERTIA_HEADERS).headers["etag"]
+
+        response = client.get(
+            "/reports", headers={**INERTIA_HEADERS, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+        assert len(calls) == 2
+
+
+def test_revalidating_requests_refill_cache(app, calls):
+    """Test a 304 on a cache miss still stores the page for later polls"""
+    with TestClient(app) as client:
+        etag = client.get("/polled-reports", headers=INERTIA_HEADERS).headers["etag"]
+        page_cache.clear()
+
+        for _ in range(3):
+            response = client.get(
+                "/polled-reports", headers={**INERTIA_HEADERS, "If-None-Match": etag}
+            )
+
+            assert response.status_code == 304
+
+        assert calls == ["polled", "polled"]
+
+
+def test_pending_flash_messages_bypass_cache(app, calls):
+    """Test flash messages are delivered and their pages are not stored"""
+    with TestClient(app) as client:
+        client.get("/reports", headers=INERTIA_HEADERS)
+        client.get("/flash")
+
+        response = client.get("/reports", headers=INERTIA_HEADERS)
+
+        assert response.json()["props"]["flash"] == {"success": "Saved"}
+        assert (
+            client.get("/reports", headers=INERTIA_HEADERS).json()["props"]["flash"]
+            == {}
+        )
+        assert len(calls) == 4
+
+
+class UnavailableCache(MemoryCache):
+    def get(self, key):
+        raise CacheError("Redis connection failed")
+
+    def set(self, key, value, ttl=None, tags=()):
+        raise CacheError("Redis connection failed")
+
+
+def test_unavailable_cache_fails_open(app, calls, caplog):
+    """Test cache errors are logged and pages rendered as on a miss"""
+    configure_page_cache(UnavailableCache())
+
+    with TestClient(app) as client:
+        sync_response = client.get("/reports", headers=INERTIA_HEADERS)
+        async_response = client.get("/async-reports", headers=INERTIA_HEADERS)
+
+    assert sync_response.status_code == 200
+    assert async_response.status_code == 200
+    assert calls == ["report", "report", "report"]
+    assert [record.message.split()[:3] for record in caplog.records] == [
+        ["Failed", "to", "look"],
+        ["Failed", "to", "store"],
+        ["Failed", "to", "look"],
+        ["Failed", "to", "store"],
+    ]
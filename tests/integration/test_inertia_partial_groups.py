@@ -0,0 +1,216 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from fastapi_view.inertia import Inertia, InertiaDepends
+from fastapi_view.inertia.concurrency import executor
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.groups import group_limits
+from fastapi_view.inertia.prefetch import prefetch_cache
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+    prefetch_cache.clear()
+
+    yield
+
+    group_limits.clear()
+
+
+def slow(value):
+    def resolve():
+        time.sleep(0.2)
+
+        return value
+
+    return resolve
+
+
+async def slow_async():
+    await asyncio.sleep(0.2)
+
+    return "async"
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI(title="Partial Groups Integration Test App")
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+
+    @app.get("/dashboard")
+    def dashboard(inertia: InertiaDepends):
+        return inertia.render(
+            "Dashboard",
+            {
+                "user": "John",
+                "stats": inertia.defer(slow("stats"), group="analytics"),
+                "activities": inertia.defer(slow("activities"), group="analytics"),
+                "charts": inertia.defer(slow("charts"), group="charts"),
+                "audit": inertia.defer(slow("audit"), group="audit"),
+                "trend": inertia.auto(slow("trend"), group="charts"),
+            },
+        )
+
+    @app.get("/async-dashboard")
+    async def async_dashboard(inertia: InertiaDepends):
+        return await inertia.render_async(
+            "AsyncDashboard",
+            {
+                "stats": inertia.defer(slow("stats"), group="analytics"),
+                "charts": inertia.defer(slow_async, group="charts"),
+                "audit": inertia.defer(slow("audit"), group="audit"),
+            },
+        )
+
+    @app.get("/reports")
+    def reports(inertia: InertiaDepends):
+        return inertia.render(
+            "DeadlineReports",
+            {"summary": lambda: "summary", "report": slow("report")},
+            deadline=0.05,
+        )
+
+    @app.get("/throttled")
+    def throttled(inertia: InertiaDepends):
+        return inertia.render(
+            "Throttled",
+            {
+                f"prop_{index}": inertia.defer(
+                    lambda index=index: time.sleep(0.05) or index, group="throttled"
+                )
+                for index in range(executor._max_workers * 2)
+            },
+        )
+
+    return app
+
+
+def groups_headers(component: str, groups: str) -> dict:
+    return {
+        InertiaHeader.INERTIA: "true",
+        InertiaHeader.PARTIAL_COMPONENT: component,
+        InertiaHeader.PARTIAL_GROUPS: groups,
+    }
+
+
+def test_multiple_deferred_groups_in_one_request(app):
+    """Test several groups resolve concurrently into one response"""
+    with TestClient(app) as client:
+        started = time.monotonic()
+        response = client.get(
+            "/dashboard", headers=groups_headers("Dashboard", "analytics, charts")
+        )
+        elapsed = time.monotonic() - started
+
+        data = response.json()
+
+        assert data["props"] == {
+            "stats": "stats",
+            "activities": "activities",
+            "charts": "charts",
+            "trend": "trend",
+        }
+        assert "deferredProps" not in data
+        assert elapsed < 0.6
+
+
+def test_partial_groups_combined_with_only_keys(app):
+    """Test group and key selection are combined"""
+    with TestClient(app) as client:
+        headers = groups_headers("Dashboard", "audit")
+        headers[InertiaHeader.PARTIAL_ONLY] = "user"
+
+        response = client.get("/dashboard", headers=headers)
+
+        assert response.json()["props"] == {
+            "user": "John",
+            "audit": "audit",
+        }
+
+
+def test_partial_groups_ignored_for_other_components(app):
+    """Test the header only applies to the matching partial component"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/dashboard", headers=groups_headers("Other", "analytics")
+        )
+
+        data = response.json()
+
+        assert data["props"] == {"flash": {}, "user": "John"}
+        assert set(data["deferredProps"]) == {"analytics", "charts", "audit"}
+
+
+def test_multiple_deferred_groups_in_async_render(app):
+    """Test render_async resolves sync and async groups concurrently"""
+    with TestClient(app) as client:
+        started = time.monotonic()
+        response = client.get(
+            "/async-dashboard",
+            headers=groups_headers("AsyncDashboard", "analytics,charts,audit"),
+        )
+        elapsed = time.monotonic() - started
+
+        assert response.json()["props"] == {
+            "stats": "stats",
+            "charts": "async",
+            "audit": "audit",
+        }
+        assert elapsed < 0.5
+
+
+def test_deadline_group_requested_by_name(app):
+    """Test props deferred by a render deadline are served as the deadline group"""
+    with TestClient(app) as client:
+        initial = client.get("/reports", headers={InertiaHeader.INERTIA: "true"})
+
+        assert initial.json()["deferredProps"] == {"deadline": ["report"]}
+
+        response = client.get(
+            "/reports", headers=groups_headers("DeadlineReports", "deadline")
+        )
+
+        assert response.json()["props"] == {"report": "report"}
+
+
+def test_deadline_group_without_session(app):
+    """Test deadline group membership falls back to measured latency"""
+    with TestClient(app) as client:
+        client.get("/reports", headers={InertiaHeader.INERTIA: "true"})
+        client.cookies.clear()
+        prefetch_cache.clear()
+
+        time.sleep(0.2)
+        response = client.get(
+            "/reports", headers=groups_headers("DeadlineReports", "deadline")
+        )
+
+        assert response.json()["props"] == {"report": "report"}
+
+
+def test_throttled_groups_do_not_starve_the_prop_executor(app):
+    """Test group limits do not wait on the executor running the group"""
+    Inertia.configure_group("throttled", timeout=1.0)
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/throttled", headers=groups_headers("Throttled", "throttled")
+        )
+
+    props = response.json()["props"]
+
+    assert props == {f"prop_{index}": index for index in range(len(props))}
+    assert len(props) == executor._max_workers * 2
@@ -0,0 +1,150 @@
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from fastapi_view.inertia import InertiaDepends
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.prefetch import prefetch_cache
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+    prefetch_cache.clear()
+
+
+@pytest.fixture
+def calls() -> dict:
+    return {"stats": 0, "charts": 0}
+
+
+@pytest.fixture
+def app(calls) -> FastAPI:
+    app = FastAPI(title="Prefetch Integration Test App")
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+
+    def get_stats():
+        calls["stats"] += 1
+
+        return {"users": 3}
+
+    async def get_charts():
+        calls["charts"] += 1
+
+        return [1, 2, 3]
+
+    @app.get("/dashboard")
+    def dashboard(inertia: InertiaDepends):
+        return inertia.render(
+            "Dashboard",
+            {
+                "user": "John",
+                "stats": inertia.defer(get_stats, group="analytics"),
+            },
+            prefetch_deferred=True,
+        )
+
+    @app.get("/async-dashboard")
+    async def async_dashboard(inertia: InertiaDepends):
+        return await inertia.render_async(
+            "AsyncDashboard",
+            {
+                "stats": inertia.defer(get_stats, group="analytics"),
+                "charts": inertia.defer(get_charts, group="charts"),
+            },
+            prefetch_deferred=True,
+        )
+
+    @app.get("/rows")
+    def rows(inertia: InertiaDepends, x: int):
+        return inertia.render(
+            "Rows",
+            {"rows": inertia.defer(lambda: f"rows for x={x}")},
+            prefetch_deferred=True,
+        )
+
+    return app
+
+
+def partial_headers(component: str, only: str) -> dict:
+    return {
+        InertiaHeader.INERTIA: "true",
+        InertiaHeader.PARTIAL_COMPONENT: component,
+        InertiaHeader.PARTIAL_ONLY: only,
+    }
+
+
+def test_deferred_groups_prefetched_after_initial_load(app, calls):
+    """Test follow-up partial request is served from the prefetched result"""
+    with TestClient(app) as client:
+        response = client.get("/dashboard", headers={InertiaHeader.INERTIA: "true"})
+
+        assert response.json()["deferredProps"] == {"analytics": ["stats"]}
+        assert "stats" not in response.json()["props"]
+        assert calls["stats"] == 1
+
+        response = client.get(
+            "/dashboard", headers=partial_headers("Dashboard", "stats")
+        )
+
+        assert response.json()["props"]["stats"] == {"users": 3}
+        assert calls["stats"] == 1
+
+        # The prefetched result is consumed by the first follow-up
+        response = client.get(
+            "/dashboard", headers=partial_headers("Dashboard", "stats")
+        )
+
+        assert response.json()["props"]["stats"] == {"users": 3}
+        assert calls["stats"] == 2
+
+
+def test_deferred_groups_prefetched_in_async_render(app, calls):
+    """Test prefetching works for render_async with async deferred props"""
+    with TestClient(app) as client:
+        client.get("/async-dashboard")
+
+        assert calls == {"stats": 1, "charts": 1}
+
+        response = client.get(
+            "/async-dashboard", headers=partial_headers("AsyncDashboard", "charts")
+        )
+
+        assert response.json()["props"]["charts"] == [1, 2, 3]
+        assert calls == {"stats": 1, "charts": 1}
+
+
+def test_prefetched_results_are_bound_to_the_session(app, calls):
+    """Test another session never receives prefetched results"""
+    with TestClient(app) as client:
+        client.get("/dashboard", headers={InertiaHeader.INERTIA: "true"})
+
+    with TestClient(app) as other_client:
+        response = other_client.get(
+            "/dashboard", headers=partial_headers("Dashboard", "stats")
+        )
+
+        assert response.json()["props"]["stats"] == {"users": 3}
+        assert calls["stats"] == 2
+
+
+def test_prefetched_results_are_bound_to_the_url(app):
+    """Test pages of one component with different queries keep their results"""
+    with TestClient(app) as client:
+        client.get("/rows?x=1", headers={InertiaHeader.INERTIA: "true"})
+        client.get("/rows?x=2", headers={InertiaHeader.INERTIA: "true"})
+
+        first = client.get("/rows?x=1", headers=partial_headers("Rows", "rows"))
+        second = client.get("/rows?x=2", headers=partial_headers("Rows", "rows"))
+
+        assert first.json()["props"] == {"rows": "rows for x=1"}
+        assert second.json()["props"] == {"rows": "rows for x=2"}
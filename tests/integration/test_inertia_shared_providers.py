@@ -0,0 +1,138 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from fastapi_view.inertia import Inertia, InertiaDepends
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.shared import shared_providers
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+
+    yield
+
+    shared_providers.clear()
+
+
+@pytest.fixture
+def calls() -> list:
+    return []
+
+
+@pytest.fixture
+def app(calls: list) -> FastAPI:
+    app = FastAPI(title="Shared Providers Integration Test App")
+
+    def get_auth(request: Request):
+        calls.append("auth")
+
+        return {"user": request.headers.get("x-user", "guest")}
+
+    async def get_permissions(request: Request):
+        calls.append("permissions")
+
+        return ["edit"]
+
+    def get_config(request: Request):
+        calls.append("config")
+
+        return {"name": "Test App", "launched": date(2024, 1, 1)}
+
+    Inertia.share_provider("auth", get_auth)
+    Inertia.share_provider("permissions", get_permissions)
+    Inertia.share_provider("config", get_config, static=True)
+
+    @app.get("/dashboard")
+    def dashboard(inertia: InertiaDepends):
+        return inertia.render("Dashboard", {"stats": {"views": 100}})
+
+    @app.get("/async-dashboard")
+    async def async_dashboard(inertia: InertiaDepends):
+        return await inertia.render_async("Dashboard", {"stats": {"views": 100}})
+
+    @app.get("/impersonate")
+    async def impersonate(inertia: InertiaDepends):
+        inertia.share("auth", {"user": "admin"})
+
+        return await inertia.render_async("Dashboard", {})
+
+    return app
+
+
+def test_providers_shared_with_every_response(app, calls):
+    """Test app-level providers are resolved for each request"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/async-dashboard",
+            headers={InertiaHeader.INERTIA: "true", "x-user": "john"},
+        )
+
+        assert response.json()["props"] == {
+            "auth": {"user": "john"},
+            "permissions": ["edit"],
+            "config": {"name": "Test App", "launched": "2024-01-01"},
+            "flash": {},
+            "stats": {"views": 100},
+        }
+        assert sorted(calls) == ["auth", "config", "permissions"]
+
+
+def test_providers_skipped_when_filtered_out(app, calls):
+    """Test providers only run when their key survives partial filtering"""
+    with TestClient(app) as client:
+        response = client.get(
+            "/dashboard",
+            headers={
+                InertiaHeader.INERTIA: "true",
+                InertiaHeader.PARTIAL_COMPONENT: "Dashboard",
+                InertiaHeader.PARTIAL_ONLY: "auth, stats",
+            },
+        )
+
+        assert response.json()["props"] == {
+            "auth": {"user": "guest"},
+            "stats": {"views": 100},
+        }
+        assert calls == ["auth"]
+
+
+def test_async_provider_rejected_by_sync_render(app, calls):
+    """Test sync render refuses async providers instead of running a loop"""
+    with TestClient(app) as client:
+        with pytest.raises(TypeError, match="use render_async"):
+            client.get("/dashboard", headers={InertiaHeader.INERTIA: "true"})
+
+        assert "permissions" not in calls
+
+
+def test_static_provider_computed_once(app, calls):
+    """Test static providers are evaluated and encoded once per process"""
+    with TestClient(app) as client:
+        for _ in range(3):
+            response = client.get(
+                "/async-dashboard", headers={InertiaHeader.INERTIA: "true"}
+            )
+
+            assert response.json()["props"]["config"]["launched"] == "2024-01-01"
+
+        assert calls.count("config") == 1
+        assert calls.count("auth") == 3
+
+
+def test_request_share_overrides_provider(app, calls):
+    """Test props shared on the request take precedence over providers"""
+    with TestClient(app) as client:
+        response = client.get("/impersonate", headers={InertiaHeader.INERTIA: "true"})
+
+        assert response.json()["props"]["auth"] == {"user": "admin"}
+        assert "auth" not in calls
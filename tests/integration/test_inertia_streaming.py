@@ -0,0 +1,106 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pyquery import PyQuery as pq
+
+from fastapi_view.inertia import InertiaDepends
+from fastapi_view.inertia import encoder
+from fastapi_view.inertia.enums import InertiaHeader
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+    monkeypatch.setattr(encoder, "STREAM_BATCH_SIZE", 2)
+
+
+def fetch_rows():
+    for index in range(5):
+        yield {"id": index, "created": date(2024, 1, index + 1)}
+
+
+async def fetch_rows_async():
+    for row in fetch_rows():
+        yield row
+
+
+EXPECTED_ROWS = [
+    {"id": index, "created": f"2024-01-0{index + 1}"} for index in range(5)
+]
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI(title="Streaming Integration Test App")
+
+    @app.get("/export")
+    def export(inertia: InertiaDepends):
+        return inertia.render(
+            "Export",
+            {"rows": fetch_rows, "total": 5, "empty": lambda: iter([])},
+        )
+
+    @app.get("/async-export")
+    async def async_export(inertia: InertiaDepends):
+        return await inertia.render_async(
+            "Export", {"rows": fetch_rows_async, "total": 5}
+        )
+
+    @app.get("/users")
+    def users(inertia: InertiaDepends):
+        return inertia.render("Users", {"users": [{"id": 1}]})
+
+    return app
+
+
+def test_iterator_props_streamed(app):
+    """Test iterator props are encoded into a streaming JSON response"""
+    with TestClient(app) as client:
+        response = client.get("/export", headers={InertiaHeader.INERTIA: "true"})
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers[InertiaHeader.INERTIA] == "True"
+        assert "content-length" not in response.headers
+
+        props = json.loads(response.content)["props"]
+
+        assert props["rows"] == EXPECTED_ROWS
+        assert props["total"] == 5
+        assert props["empty"] == []
+
+
+def test_async_iterator_props_streamed(app):
+    """Test async iterator props are streamed from render_async"""
+    with TestClient(app) as client:
+        response = client.get("/async-export", headers={InertiaHeader.INERTIA: "true"})
+
+        assert "content-length" not in response.headers
+        assert json.loads(response.content)["props"]["rows"] == EXPECTED_ROWS
+
+
+@pytest.mark.parametrize("path", ["/export", "/async-export"])
+def test_iterator_props_collected_for_html_response(app, path):
+    """Test the initial HTML page embeds the consumed iterator"""
+    with TestClient(app) as client:
+        response = client.get(path)
+
+        page_data = json.loads(pq(response.text)("#app").attr("data-page"))
+
+        assert page_data["props"]["rows"] == EXPECTED_ROWS
+
+
+def test_pages_without_iterators_not_streamed(app):
+    """Test regular pages keep a sized JSON response"""
+    with TestClient(app) as client:
+        response = client.get("/users", headers={InertiaHeader.INERTIA: "true"})
+
+        assert response.headers["content-length"] == str(len(response.content))
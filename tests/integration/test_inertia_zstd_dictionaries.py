@@ -0,0 +1,200 @@
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_view.inertia import InertiaDepends, dictionaries
+from fastapi_view.inertia.dictionaries import (
+    configure_zstd_dictionaries,
+    dictionary_router,
+    page_skeleton,
+    zstd_dictionaries,
+)
+from fastapi_view.inertia.enums import InertiaHeader
+
+INERTIA_HEADERS = {InertiaHeader.INERTIA: "true"}
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    templates_path = Path("tests/templates").resolve()
+    monkeypatch.setenv("FV_TEMPLATES_PATH", str(templates_path))
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "inertia.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_VITE_DEV_MODE", "true")
+    monkeypatch.setenv("FV_INERTIA_ZSTD_DICTIONARY", "true")
+
+    configure_zstd_dictionaries(samples=40, dict_size=2048)
+
+    yield
+
+    configure_zstd_dictionaries()
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI(title="Zstd Dictionary Integration Test App")
+    app.include_router(dictionary_router)
+
+    @app.get("/orders/{order_id}")
+    def order(inertia: InertiaDepends, order_id: int):
+        return inertia.render(
+            "Orders/Show",
+            {
+                "order": {
+                    "id": order_id,
+                    "status": ["pending", "paid", "shipped"][order_id % 3],
+                    "customer": {
+                        "name": f"Customer {order_id}",
+                        "email": f"customer-{order_id}@example.com",
+                        "api_key": f"sk_live_{order_id:04d}_SECRET",
+                        "tier": "gold",
+                    },
+                    "lines": [
+                        {"sku": f"SKU-{order_id * 7 + line}", "quantity": line}
+                        for line in range(order_id % 4 + 1)
+                    ],
+                },
+                "contacts": {
+                    f"alice{order_id}@corp.com": {"orders": order_id},
+                },
+            },
+        )
+
+    return app
+
+
+def train(client: TestClient) -> None:
+    for order_id in range(40):
+        client.get(f"/orders/{order_id}", headers=INERTIA_HEADERS)
+
+    # Dictionaries are trained off the request path
+    deadline = time.monotonic() + 5
+    while zstd_dictionaries._training and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_dictionary_not_served_before_training(app):
+    """Test components without a dictionary get plain JSON and a 404 download"""
+    with TestClient(app) as client:
+        response = client.get("/orders/1", headers=INERTIA_HEADERS)
+
+        assert response.headers["content-type"] == "application/json"
+        assert InertiaHeader.ZSTD_DICTIONARY in response.headers["vary"]
+        assert InertiaHeader.ZSTD_DICTIONARY not in response.headers
+        assert client.get("/_inertia/zstd-dictionaries/Orders/Show").status_code == 404
+
+
+def test_nothing_sampled_without_zstandard(app, monkeypatch):
+    """Test the zstandard package is optional"""
+    monkeypatch.setattr(dictionaries, "zstandard", None)
+
+    with TestClient(app) as client:
+        train(client)
+
+        assert zstd_dictionaries.get("Orders/Show") is None
+
+
+def test_payload_compressed_with_trained_dictionary(app):
+    """Test clients holding the dictionary get dictionary-compressed pages"""
+    zstandard = pytest.importorskip("zstandard")
+
+    with TestClient(app) as client:
+        train(client)
+
+        plain = client.get("/orders/41", headers=INERTIA_HEADERS)
+        dictionary_id = plain.headers[InertiaHeader.ZSTD_DICTIONARY]
+
+        download = client.get("/_inertia/zstd-dictionaries/Orders/Show")
+
+        assert download.status_code == 200
+        assert download.headers[InertiaHeader.ZSTD_DICTIONARY] == dictionary_id
+
+        response = client.get(
+            "/orders/41",
+            headers={**INERTIA_HEADERS, InertiaHeader.ZSTD_DICTIONARY: dictionary_id},
+        )
+
+        assert response.headers["content-type"] == "application/zstd"
+        assert response.headers["etag"] == f"W/{plain.headers['etag']}"
+        assert len(response.content) < len(plain.content)
+
+        decompressor = zstandard.ZstdDecompressor(
+            dict_data=zstandard.ZstdCompressionDict(download.content)
+        )
+
+        assert decompressor.decompress(response.content) == plain.content
+
+
+def test_dictionary_trained_without_payload_values(app):
+    """Test the public dictionary does not leak values of sampled pages"""
+    pytest.importorskip("zstandard")
+
+    with TestClient(app) as client:
+        train(client)
+
+        download = client.get("/_inertia/zstd-dictionaries/Orders/Show")
+
+        assert download.status_code == 200
+        assert b"contacts" in download.content
+        assert b"SECRET" not in download.content
+        assert b"api_key" not in download.content
+        assert b"corp.com" not in download.content
+        assert b"@example.com" not in download.content
+        assert b"Customer" not in download.content
+        assert b"SKU-" not in download.content
+
+
+def test_page_skeleton():
+    """Test skeletons keep page keys, prop names and structure but no values"""
+    body = (
+        b'{"component":"A","props":{"n":1.5,"ok":true,"x":null,"rows":["a","b"],'
+        b'"users":{"a@corp.com":{"id":1},"b@corp.com":{"id":2}}}}'
+    )
+
+    assert page_skeleton(body) == (
+        b'{"component":"","props":{"n":0,"ok":true,"x":null,"rows":["",""],'
+        b'"users":{"":{"":0},"":{"":0}}}}'
+    )
+    assert page_skeleton(b"not json") is None
+
+
+def test_sampling_keeps_bodies_until_trained(app, monkeypatch):
+    """Test requests only collect bodies, training runs on the prop executor"""
+    pytest.importorskip("zstandard")
+    skeletons = []
+    monkeypatch.setattr(
+        dictionaries,
+        "page_skeleton",
+        lambda body: skeletons.append(body) or page_skeleton(body),
+    )
+
+    with TestClient(app) as client:
+        for order_id in range(39):
+            client.get(f"/orders/{order_id}", headers=INERTIA_HEADERS)
+
+        assert skeletons == []
+
+        train(client)
+
+        assert len(skeletons) == 40
+        assert zstd_dictionaries.get("Orders/Show") is not None
+
+
+def test_unknown_dictionary_gets_plain_json(app):
+    """Test clients holding an outdated dictionary get plain JSON"""
+    pytest.importorskip("zstandard")
+
+    with TestClient(app) as client:
+        train(client)
+
+        response = client.get(
+            "/orders/41",
+            headers={**INERTIA_HEADERS, InertiaHeader.ZSTD_DICTIONARY: "1"},
+        )
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["props"]["order"]["id"] == 41
@@ -0,0 +1,15 @@
+from fastapi_view.inertia import Inertia
+
+
+def build_page_object(inertia: Inertia, props: dict) -> dict:
+    """Plan, resolve and compose a page object the way render does"""
+    plan = inertia._plan_props(inertia._page_props(props))
+
+    return inertia._compose_page_object(plan, inertia._resolve_plan(plan))
+
+
+async def build_page_object_async(inertia: Inertia, props: dict) -> dict:
+    """Plan, resolve and compose a page object the way render_async does"""
+    plan = inertia._plan_props(inertia._page_props(props))
+
+    return inertia._compose_page_object(plan, await inertia._resolve_plan_async(plan))
@@ -0,0 +1,209 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from fastapi_view.cache import CacheBackend, FileCache, MemoryCache, NamespacedCache
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache(request, tmp_path) -> CacheBackend:
+    if request.param == "memory":
+        return MemoryCache()
+
+    return FileCache(tmp_path / "cache")
+
+
+def test_get_and_set(cache):
+    """Test values are stored and read back as bytes"""
+    cache.set("page", b'{"id":1}')
+
+    assert cache.get("page") == b'{"id":1}'
+    assert cache.get("other") is None
+
+
+def test_overwrite(cache):
+    """Test setting a key again replaces its value"""
+    cache.set("page", b"old")
+    cache.set("page", b"new")
+
+    assert cache.get("page") == b"new"
+
+
+def test_ttl_expiry(cache, monkeypatch):
+    """Test values are not served after their TTL"""
+    cache.set("page", b"value", ttl=10)
+    cache.set("forever", b"value")
+
+    now = time.time()
+    monotonic = time.monotonic()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    monkeypatch.setattr(time, "monotonic", lambda: monotonic + 11)
+
+    assert cache.get("page") is None
+    assert cache.get("forever") == b"value"
+
+
+def test_delete(cache):
+    """Test delete reports whether the key was stored"""
+    cache.set("page", b"value")
+
+    assert cache.delete("page") is True
+    assert cache.delete("page") is False
+    assert cache.get("page") is None
+
+
+def test_invalidate_tags(cache):
+    """Test values are dropped by any of their tags"""
+    cache.set("a", b"1", tags=["reports", "user:1"])
+    cache.set("b", b"2", tags=["reports"])
+    cache.set("c", b"3", tags=["users"])
+
+    assert cache.invalidate("reports", "missing") == 2
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+    assert cache.invalidate("reports") == 0
+
+
+def test_clear(cache):
+    """Test clear removes every value"""
+    cache.set("a", b"1", tags=["tag"])
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert cache.invalidate("tag") == 0
+
+
+def test_stats(cache):
+    """Test hits, misses and writes are counted"""
+    cache.set("a", b"1")
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats.as_dict() == {"hits": 2, "misses": 1, "sets": 1, "evictions": 0}
+    assert cache.stats.hit_ratio == pytest.approx(2 / 3)
+
+
+def test_async_interface(cache):
+    """Test the coroutine variants of every operation"""
+
+    async def scenario():
+        await cache.aset("a", b"1", tags=["tag"])
+        value = await cache.aget("a")
+        invalidated = await cache.ainvalidate("tag")
+        await cache.aset("b", b"2")
+
+        return value, invalidated, await cache.adelete("b")
+
+    assert asyncio.run(scenario()) == (b"1", 1, True)
+
+
+def test_namespaces_are_isolated(cache):
+    """Test namespaced keys and tags do not collide"""
+    v1 = cache.namespaced("v1")
+    v2 = cache.namespaced("v2")
+
+    v1.set("page", b"one", tags=["pages"])
+    v2.set("page", b"two", tags=["pages"])
+
+    assert isinstance(v1, NamespacedCache)
+    assert v1.get("page") == b"one"
+    assert v1.invalidate("pages") == 1
+    assert v2.get("page") == b"two"
+    assert v1.stats is cache.stats
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Test the byte budget evicts the least recently used values"""
+    cache = MemoryCache(max_bytes=25)
+    cache.set("a", b"x" * 9)
+    cache.set("b", b"x" * 9)
+    cache.get("a")
+    cache.set("c", b"x" * 9)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.size == 20
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_skips_values_over_budget():
+    """Test values larger than the whole budget are not stored"""
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", b"x" * 5)
+    cache.set("big", b"x" * 20)
+
+    assert cache.get("big") is None
+    assert cache.get("a") == b"xxxxx"
+
+
+def test_file_cache_shared_between_instances(tmp_path):
+    """Test workers sharing a directory see each other's values"""
+    writer = FileCache(tmp_path)
+    reader = FileCache(tmp_path)
+
+    writer.set("page", b"value", tags=["pages"])
+
+    assert reader.get("page") == b"value"
+    assert reader.invalidate("pages") == 1
+    assert writer.get("page") is None
+
+
+def test_file_cache_counts_expired_values_as_evictions(tmp_path, monkeypatch):
+    """Test expired files are removed when read"""
+    cache = FileCache(tmp_path)
+    cache.set("page", b"value", ttl=1)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 2)
+
+    assert cache.get("page") is None
+    assert cache.stats.evictions == 1
+    assert not [path for path in (tmp_path / "values").rglob("*") if path.is_file()]
+
+
+def test_file_cache_sweep_removes_expired_values_and_tags(tmp_path, monkeypatch):
+    """Test the sweep removes values never read again and their tag files"""
+    cache = FileCache(tmp_path)
+    cache.set("old", b"value", ttl=1, tags=["v1"])
+    cache.set("current", b"value", ttl=100, tags=["v2"])
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 2)
+
+    assert cache.sweep() == 1
+    assert cache.stats.evictions == 1
+    assert cache.get("current") == b"value"
+    assert len(list((tmp_path / "tags").iterdir())) == 1
+
+
+def test_file_cache_sweep_bounds_size(tmp_path):
+    """Test the sweep removes the oldest values beyond max_bytes"""
+    cache = FileCache(tmp_path, max_bytes=250)
+    for index in range(3):
+        cache.set(f"page-{index}", b"x" * 100)
+        path = cache._value_path(f"page-{index}")
+        os.utime(path, (index, index))
+
+    assert cache.sweep() == 2
+    assert cache.get("page-0") is None
+    assert cache.get("page-1") is None
+    assert cache.get("page-2") is not None
+
+
+def test_file_cache_sweeps_on_write_after_interval(tmp_path, monkeypatch):
+    """Test writes trigger a sweep once the interval elapsed"""
+    cache = FileCache(tmp_path, max_bytes=0, sweep_interval=60)
+    cache.set("a", b"value")
+
+    assert cache.get("a") == b"value"
+
+    monotonic = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: monotonic + 61)
+    cache.set("b", b"value")
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
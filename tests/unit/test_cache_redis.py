@@ -0,0 +1,296 @@
+import asyncio
+import fnmatch
+import socketserver
+import threading
+import time
+
+import pytest
+
+from fastapi_view.cache import CacheError, RedisCache, RedisConnection
+
+
+class RESPServer(socketserver.ThreadingTCPServer):
+    """Stand-in for a Redis server, implementing the commands RedisCache uses"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, password: str | None = None):
+        super().__init__(("127.0.0.1", 0), RESPHandler)
+
+        self.password = password
+        self.data: dict[bytes, bytes | set[bytes]] = {}
+        self.expires: dict[bytes, float] = {}
+        self.commands: list[list[bytes]] = []
+        self.lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def lookup(self, key: bytes):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key)
+
+        return self.data.get(key)
+
+
+class RESPHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        authenticated = self.server.password is None
+
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+
+            self.server.commands.append(command)
+            name, args = command[0].upper(), command[1:]
+
+            if name == b"AUTH":
+                authenticated = args[0].decode() == self.server.password
+                reply = b"+OK" if authenticated else b"-WRONGPASS invalid password"
+            elif not authenticated:
+                reply = b"-NOAUTH Authentication required."
+            else:
+                with self.server.lock:
+                    reply = self.execute(name, args)
+
+            self.wfile.write(reply + b"\r\n")
+
+    def read_command(self) -> list[bytes] | None:
+        line = self.rfile.readline()
+        if not line:
+            return None
+
+        command = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            command.append(self.rfile.read(length + 2)[:-2])
+
+        return command
+
+    def execute(self, name: bytes, args: list[bytes]) -> bytes:
+        server = self.server
+
+        if name in (b"PING", b"SELECT"):
+            return b"+OK"
+
+        if name == b"GET":
+            value = server.lookup(args[0])
+            return b"$-1" if value is None else b"$%d\r\n%s" % (len(value), value)
+
+        if name == b"SET":
+            server.data[args[0]] = args[1]
+            server.expires.pop(args[0], None)
+            if len(args) == 4 and args[2].upper() == b"PX":
+                server.expires[args[0]] = time.monotonic() + int(args[3]) / 1000
+            return b"+OK"
+
+        if name == b"DEL":
+            deleted = [server.data.pop(key, None) for key in args]
+            return b":%d" % sum(value is not None for value in deleted)
+
+        if name == b"PEXPIRE":
+            if server.lookup(args[0]) is None:
+                return b":0"
+
+            expires = time.monotonic() + int(args[1]) / 1000
+            current = server.expires.get(args[0])
+            option = args[2].upper() if len(args) > 2 else None
+            if (option == b"NX" and current is not None) or (
+                option == b"GT" and (current is None or expires <= current)
+            ):
+                return b":0"
+
+            server.expires[args[0]] = expires
+            return b":1"
+
+        if name == b"SADD":
+            members = server.data.setdefault(args[0], set())
+            added = set(args[1:]) - members
+            members.update(added)
+            return b":%d" % len(added)
+
+        if name == b"SMEMBERS":
+            members = server.lookup(args[0]) or set()
+            return encode_array(sorted(members))
+
+        if name == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [
+                key for key in server.data if fnmatch.fnmatch(key.decode(), pattern)
+            ]
+            return b"*2\r\n$1\r\n0\r\n" + encode_array(keys)
+
+        return b"-ERR unknown command '%s'" % name
+
+
+def encode_array(items: list[bytes]) -> bytes:
+    return b"*%d" % len(items) + b"".join(
+        b"\r\n$%d\r\n%s" % (len(item), item) for item in items
+    )
+
+
+@pytest.fixture
+def server():
+    server = RESPServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache(server) -> RedisCache:
+    cache = RedisCache(port=server.port, prefix="test:")
+
+    yield cache
+
+    cache.connection.close()
+
+
+def test_get_and_set(cache, server):
+    """Test values round-trip through the server under the prefix"""
+    cache.set("page", b"\x00binary\r\nvalue")
+
+    assert cache.get("page") == b"\x00binary\r\nvalue"
+    assert cache.get("missing") is None
+    assert b"test:page" in server.data
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 1, "sets": 1, "evictions": 0}
+
+
+def test_ttl_sent_in_milliseconds(cache, server):
+    """Test the TTL is set on the server with SET PX"""
+    cache.set("page", b"value", ttl=1.5)
+
+    assert server.commands[-1] == [b"SET", b"test:page", b"value", b"PX", b"1500"]
+
+
+def test_expired_values_not_served(cache):
+    """Test values expire on the server"""
+    cache.set("page", b"value", ttl=0.01)
+    time.sleep(0.05)
+
+    assert cache.get("page") is None
+
+
+def test_set_pipelines_tags(cache, server):
+    """Test the value and its tags are written in one round trip"""
+    cache.set("page", b"value", tags=["reports"])
+
+    assert server.commands[-2:] == [
+        [b"SET", b"test:page", b"value"],
+        [b"SADD", b"test:tag:reports", b"test:page"],
+    ]
+
+
+def test_expiring_tag_sets_outlive_their_values(cache, server):
+    """Test tag sets of expiring values expire with the longest-lived value"""
+    cache.set("a", b"1", ttl=10, tags=["reports"])
+    cache.set("b", b"2", ttl=100, tags=["reports"])
+    cache.set("c", b"3", ttl=5, tags=["reports"])
+
+    tag_key = b"test:ttl-tag:reports"
+    remaining = server.expires[tag_key] - time.monotonic()
+
+    assert server.data[tag_key] == {b"test:a", b"test:b", b"test:c"}
+    assert 99 < remaining <= 100
+    assert b"test:tag:reports" not in server.data
+
+
+def test_expired_tag_sets_are_removed(cache, server):
+    """Test tag sets do not outgrow their values"""
+    cache.set("page", b"value", ttl=0.01, tags=["reports"])
+    time.sleep(0.05)
+
+    assert server.lookup(b"test:ttl-tag:reports") is None
+    assert cache.invalidate("reports") == 0
+
+
+def test_invalidate_tags(cache, server):
+    """Test values and the tag sets are deleted by tag"""
+    cache.set("a", b"1", tags=["reports"])
+    cache.set("b", b"2", ttl=60, tags=["reports", "users"])
+    cache.set("c", b"3", tags=["users"])
+
+    assert cache.invalidate("reports", "missing") == 2
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+    assert b"test:tag:reports" not in server.data
+    assert b"test:ttl-tag:reports" not in server.data
+
+
+def test_delete(cache):
+    """Test delete reports whether the key was stored"""
+    cache.set("page", b"value")
+
+    assert cache.delete("page") is True
+    assert cache.delete("page") is False
+
+
+def test_clear_only_removes_prefixed_keys(cache, server):
+    """Test clear leaves keys of other applications alone"""
+    server.data[b"other:key"] = b"value"
+    cache.set("page", b"value", tags=["tag"])
+
+    cache.clear()
+
+    assert server.data == {b"other:key": b"value"}
+
+
+def test_namespaced_cache(cache, server):
+    """Test namespaces prefix keys and tags on the server"""
+    cache.namespaced("v1").set("page", b"value", tags=["tag"])
+
+    assert server.data[b"test:tag:v1:tag"] == {b"test:v1:page"}
+
+
+def test_async_interface(cache):
+    """Test the coroutine variants run the commands in a thread"""
+
+    async def scenario():
+        await cache.aset("page", b"value")
+        return await cache.aget("page")
+
+    assert asyncio.run(scenario()) == b"value"
+
+
+def test_authentication_and_database(server):
+    """Test AUTH and SELECT are sent when connecting"""
+    server.password = "secret"
+    connection = RedisConnection(port=server.port, password="secret", db=2)
+
+    assert connection.execute("PING") == "OK"
+    assert server.commands[:2] == [[b"AUTH", b"secret"], [b"SELECT", b"2"]]
+
+    connection.close()
+
+
+def test_server_errors_raise_cache_error(server):
+    """Test error replies and failed authentication raise CacheError"""
+    connection = RedisConnection(port=server.port)
+
+    with pytest.raises(CacheError, match="unknown command"):
+        connection.execute("FLUSHALL")
+
+    server.password = "secret"
+    with pytest.raises(CacheError, match="WRONGPASS"):
+        RedisConnection(port=server.port, password="wrong").execute("PING")
+
+    connection.close()
+
+
+def test_connection_failure_raises_cache_error(server):
+    """Test an unreachable server raises CacheError"""
+    port = server.port
+    server.shutdown()
+    server.server_close()
+
+    with pytest.raises(CacheError, match="connection failed"):
+        RedisConnection(port=port, timeout=0.5).execute("PING")
@@ -0,0 +1,215 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from fastapi_view import compression
+from fastapi_view.compression import (
+    CompressedBodyCache,
+    ResponseCompressor,
+    configure_compression,
+    parse_accept_encoding,
+)
+from fastapi_view.config import CompressionSettings
+
+PAYLOAD = {"rows": [{"id": index, "name": f"Row {index}"} for index in range(100)]}
+
+
+@pytest.fixture(autouse=True)
+def reset_compression(monkeypatch):
+    monkeypatch.setattr(compression, "_compressor", None)
+
+
+@pytest.fixture
+def compressor() -> ResponseCompressor:
+    return ResponseCompressor(CompressionSettings(enabled=True, encodings=["gzip"]))
+
+
+def make_request(accept_encoding: str) -> Request:
+    return Request(
+        scope={
+            "type": "http",
+            "path": "/",
+            "headers": [(b"accept-encoding", accept_encoding.encode())],
+        }
+    )
+
+
+async def read_stream(response: StreamingResponse) -> list[bytes]:
+    return [chunk async for chunk in response.body_iterator]
+
+
+def test_parse_accept_encoding():
+    """Test quality values are parsed per coding"""
+    assert parse_accept_encoding("gzip, br;q=0.5, zstd;q=0, deflate;q=x") == {
+        "gzip": 1.0,
+        "br": 0.5,
+        "zstd": 0.0,
+        "deflate": 0.0,
+    }
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("*", "gzip"),
+        ("gzip;q=0", None),
+        ("br", None),
+        ("", None),
+    ],
+)
+def test_negotiate(compressor, accept_encoding, expected):
+    """Test the encoding is negotiated from Accept-Encoding"""
+    assert compressor.negotiate(make_request(accept_encoding)) == expected
+
+
+def test_unavailable_encodings_skipped(monkeypatch):
+    """Test brotli and zstd are only offered when installed"""
+    monkeypatch.setattr(compression, "brotli", None)
+    monkeypatch.setattr(compression, "zstandard", None)
+
+    compressor = ResponseCompressor(CompressionSettings(enabled=True))
+
+    assert compressor.encodings == ["gzip"]
+    assert compressor.negotiate(make_request("zstd, br, gzip;q=0.1")) == "gzip"
+
+
+def test_compress_response_body(compressor):
+    """Test bodies over the threshold are gzip-compressed"""
+    response = compressor.compress(
+        make_request("gzip"), JSONResponse(PAYLOAD, headers={"Vary": "Accept"})
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept, Accept-Encoding"
+    assert response.headers["content-length"] == str(len(response.body))
+    assert json.loads(gzip.decompress(response.body)) == PAYLOAD
+
+
+def test_small_body_not_compressed(compressor):
+    """Test bodies under the minimum size are sent as is"""
+    response = compressor.compress(make_request("gzip"), JSONResponse({"id": 1}))
+
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        Response(b"x" * 1000, media_type="image/png"),
+        Response(status_code=304, headers={"content-type": "application/json"}),
+        Response(
+            b"x" * 1000,
+            media_type="text/plain",
+            headers={"content-encoding": "identity"},
+        ),
+    ],
+)
+def test_incompressible_responses_skipped(compressor, response):
+    """Test binary, bodiless and already encoded responses are left alone"""
+    body = response.body
+
+    assert compressor.compress(make_request("gzip"), response).body == body
+    assert response.headers.get("content-encoding") != "gzip"
+
+
+def test_disabled_by_default():
+    """Test compression is opt-in"""
+    compressor = ResponseCompressor(CompressionSettings())
+
+    response = compressor.compress(make_request("gzip"), JSONResponse(PAYLOAD))
+
+    assert "content-encoding" not in response.headers
+
+
+def test_strong_etag_weakened(compressor):
+    """Test compressed responses keep a weak form of their ETag"""
+    response = compressor.compress(
+        make_request("gzip"), JSONResponse(PAYLOAD, headers={"ETag": '"abc"'})
+    )
+
+    assert response.headers["etag"] == 'W/"abc"'
+
+
+def test_compressed_bodies_cached(compressor, mocker):
+    """Test an identical body is compressed once"""
+    spy = mocker.spy(compressor, "_compress")
+    body = json.dumps(PAYLOAD).encode()
+
+    first = compressor.compress_body(body, "gzip")
+    second = compressor.compress_body(body, "gzip")
+
+    assert first == second
+    assert spy.call_count == 1
+    assert len(compressor.cache) == 1
+
+
+def test_body_cache_bounded_by_bytes():
+    """Test least recently used bodies are evicted over the byte budget"""
+    cache = CompressedBodyCache(max_bytes=10)
+    cache.set(("gzip", b"a"), b"12345")
+    cache.set(("gzip", b"b"), b"12345")
+    cache.get(("gzip", b"a"))
+    cache.set(("gzip", b"c"), b"123")
+    cache.set(("gzip", b"d"), b"x" * 11)
+
+    assert cache.get(("gzip", b"b")) is None
+    assert cache.get(("gzip", b"a")) == b"12345"
+    assert cache.get(("gzip", b"d")) is None
+    assert cache.size == 8
+
+
+def test_stream_compressed_per_chunk(compressor):
+    """Test every streamed chunk can be decoded as soon as it arrives"""
+
+    async def chunks():
+        yield '{"rows":['
+        yield b'{"id":1}'
+        yield "]}"
+
+    response = StreamingResponse(chunks(), media_type="application/json")
+    compressor.compress(make_request("gzip"), response)
+
+    compressed = asyncio.run(read_stream(response))
+    decoder = zlib.decompressobj(31)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert decoder.decompress(compressed[0]) == b'{"rows":['
+    assert b"".join(decoder.decompress(chunk) for chunk in compressed[1:]) == (
+        b'{"id":1}]}'
+    )
+
+
+def test_configure_compression():
+    """Test configure_compression replaces the process-wide compressor"""
+    compressor = configure_compression(enabled=True, minimum_size=10)
+
+    assert compression.get_compressor() is compressor
+    assert compressor.settings.minimum_size == 10
+
+
+def test_brotli_compression():
+    """Test brotli is used when installed"""
+    brotli = pytest.importorskip("brotli")
+    compressor = ResponseCompressor(CompressionSettings(enabled=True))
+
+    response = compressor.compress(make_request("br, gzip"), JSONResponse(PAYLOAD))
+
+    assert response.headers["content-encoding"] == "br"
+    assert json.loads(brotli.decompress(response.body)) == PAYLOAD
+
+
+def test_zstd_compression():
+    """Test zstd is used when installed"""
+    zstandard = pytest.importorskip("zstandard")
+    compressor = ResponseCompressor(CompressionSettings(enabled=True))
+
+    response = compressor.compress(make_request("zstd, gzip"), JSONResponse(PAYLOAD))
+
+    assert response.headers["content-encoding"] == "zstd"
+    assert json.loads(zstandard.ZstdDecompressor().decompress(response.body)) == PAYLOAD
@@ -7,9 +7,14 @@ from fastapi.responses import JSONResponse, Response
 
 from fastapi_view.inertia import Inertia
 from fastapi_view.inertia.enums import InertiaHeader
-from fastapi_view.inertia.inertia import FLASH_PROPS_KEY, REQUEST_SESSION_KEY
+from fastapi_view.inertia.inertia import (
+    FLASH_PROPS_KEY,
+    REQUEST_SESSION_KEY,
+    VARY_HEADERS,
+)
 from fastapi_view.inertia.props import IgnoreFirstLoad, OptionalProp
 from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
 
 
 @pytest.fixture(autouse=True)
@@ -88,9 +93,9 @@ def test_is_partial_request(
 @pytest.mark.parametrize(
     "header_value,expected",
     [
-        (None, [""]),
-        ("name", ["name"]),
-        ("name, age , email", ["name", "age", "email"]),
+        (None, frozenset()),
+        ("name", frozenset({"name"})),
+        ("name, age , email", frozenset({"name", "age", "email"})),
     ],
 )
 def test_partial_only_keys(mock_request, inertia, header_value, expected):
@@ -104,9 +109,9 @@ def test_partial_only_keys(mock_request, inertia, header_value, expected):
 @pytest.mark.parametrize(
     "header_value,expected",
     [
-        (None, [""]),
-        ("password", ["password"]),
-        ("password, secret , token", ["password", "secret", "token"]),
+        (None, frozenset()),
+        ("password", frozenset({"password"})),
+        ("password, secret , token", frozenset({"password", "secret", "token"})),
     ],
 )
 def test_partial_except_keys(mock_request, inertia, header_value, expected):
@@ -131,59 +136,59 @@ def test_partial_except_keys(mock_request, inertia, header_value, expected):
         ({"lazy1": IgnoreFirstLoad(), "lazy2": OptionalProp("value")}, {}),
     ],
 )
-def test_resolve_partial_props_non_partial_request(inertia, props, expected):
-    """Test _resolve_partial_props with non-partial request"""
-    result = inertia._resolve_partial_props(props)
+def test_plan_props_resolve_non_partial_request(inertia, props, expected):
+    """Test _plan_props resolve with non-partial request"""
+    result = inertia._plan_props(props).resolve
 
     assert result == expected
 
 
-def test_resolve_partial_props_partial_request(mock_request, inertia):
-    """Test _resolve_partial_props with partial request"""
+def test_plan_props_resolve_partial_request(mock_request, inertia):
+    """Test _plan_props resolve with partial request"""
     mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "name,age"
     mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "TestComponent"
     inertia._component = "TestComponent"
 
     props = {"name": "John", "age": 30, "email": "john@example.com"}
-    result = inertia._resolve_partial_props(props)
+    result = inertia._plan_props(props).resolve
 
     assert result == {"name": "John", "age": 30}
 
 
-def test_resolve_partial_props_with_except_keys(mock_request, inertia):
-    """Test _resolve_partial_props with except keys"""
+def test_plan_props_resolve_with_except_keys(mock_request, inertia):
+    """Test _plan_props resolve with except keys"""
     mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "name,age,password"
     mock_request.headers[InertiaHeader.PARTIAL_EXCEPT] = "password"
     mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "TestComponent"
     inertia._component = "TestComponent"
 
     props = {"name": "John", "age": 30, "password": "secret"}
-    result = inertia._resolve_partial_props(props)
+    result = inertia._plan_props(props).resolve
 
     assert result == {"name": "John", "age": 30}
 
 
-def test_resolve_partial_props_no_matching_keys(mock_request, inertia):
-    """Test _resolve_partial_props with no matching keys"""
+def test_plan_props_resolve_no_matching_keys(mock_request, inertia):
+    """Test _plan_props resolve with no matching keys"""
     mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "nonexistent"
     mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "TestComponent"
     inertia._component = "TestComponent"
 
     props = {"name": "John", "age": 30}
-    result = inertia._resolve_partial_props(props)
+    result = inertia._plan_props(props).resolve
 
     assert result == {}
 
 
-def test_resolve_partial_props_ignore_first_load_in_partial(mock_request, inertia):
-    """Test _resolve_partial_props with IgnoreFirstLoad in partial request"""
+def test_plan_props_resolve_ignore_first_load_in_partial(mock_request, inertia):
+    """Test _plan_props resolve with IgnoreFirstLoad in partial request"""
     mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "name,lazy_data"
     mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "TestComponent"
     inertia._component = "TestComponent"
 
     lazy_prop = IgnoreFirstLoad()
     props = {"name": "John", "age": 30, "lazy_data": lazy_prop}
-    result = inertia._resolve_partial_props(props)
+    result = inertia._plan_props(props).resolve
 
     assert result == {"name": "John", "lazy_data": lazy_prop}
 
@@ -257,11 +262,11 @@ def test_optional_static_method(value):
 
 
 def test_build_page_object_basic(mock_request, inertia):
-    """Test _build_page_object basic functionality"""
+    """Test build_page_object basic functionality"""
     inertia._component = "TestComponent"
     props = {"name": "John", "age": 30}
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert result["version"] == "1.0.0"
     assert result["component"] == "TestComponent"
@@ -270,13 +275,13 @@ def test_build_page_object_basic(mock_request, inertia):
 
 
 def test_build_page_object_with_shared_props(mock_request, inertia):
-    """Test _build_page_object includes shared data"""
+    """Test build_page_object includes shared data"""
     inertia.share("app_name", "Test App")
     inertia.share("version", "1.0")
     inertia._component = "TestComponent"
     props = {"name": "John"}
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert result["props"] == {
         "app_name": "Test App",
@@ -287,17 +292,17 @@ def test_build_page_object_with_shared_props(mock_request, inertia):
 
 
 def test_build_page_object_with_callable_props(mock_request, inertia):
-    """Test _build_page_object handles callable props"""
+    """Test build_page_object handles callable props"""
     inertia._component = "TestComponent"
     props = {"name": "John", "timestamp": lambda: "2024-01-01"}
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert result["props"] == {"flash": {}, "name": "John", "timestamp": "2024-01-01"}
 
 
 def test_build_page_object_with_ignore_first_load(mock_request, inertia):
-    """Test _build_page_object handles IgnoreFirstLoad"""
+    """Test build_page_object handles IgnoreFirstLoad"""
     inertia._component = "TestComponent"
     props = {
         "name": "John",
@@ -305,7 +310,7 @@ def test_build_page_object_with_ignore_first_load(mock_request, inertia):
         "optional": OptionalProp("value"),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert result["props"] == {"flash": {}, "name": "John"}
 
@@ -319,7 +324,7 @@ def test_render_json_response(mock_request, inertia):
 
     assert isinstance(response, JSONResponse)
     assert response.headers[InertiaHeader.INERTIA] == "True"
-    assert response.headers["Vary"] == "Accept"
+    assert response.headers["Vary"] == ", ".join(VARY_HEADERS)
 
     content = json.loads(response.body.decode())
     assert content["component"] == "TestComponent"
@@ -376,21 +381,21 @@ def test_get_request_session(inertia, scope, session, expected):
 @pytest.mark.parametrize(
     "scope,session,expected",
     [
-        ({}, None, {FLASH_PROPS_KEY: {}}),
-        ({REQUEST_SESSION_KEY: True}, {"user": "John"}, {FLASH_PROPS_KEY: {}}),
+        ({}, None, {}),
+        ({REQUEST_SESSION_KEY: True}, {"user": "John"}, {}),
         (
             {REQUEST_SESSION_KEY: True},
             {FLASH_PROPS_KEY: {"success": "Done"}},
-            {FLASH_PROPS_KEY: {"success": "Done"}},
+            {"success": "Done"},
         ),
     ],
 )
-def test_get_flash_props(inertia, scope, session, expected):
-    """Test _get_flash_props returns flash messages in proper format"""
+def test_pull_flash_messages(inertia, scope, session, expected):
+    """Test _pull_flash_messages returns the pending flash messages"""
     inertia._request.scope = scope
     inertia._request.session = session
 
-    result = inertia._get_flash_props()
+    result = inertia._pull_flash_messages()
 
     assert result == expected
 
@@ -428,18 +433,16 @@ def test_flash_messages_are_removed_after_reading(inertia):
     inertia._request.scope = {REQUEST_SESSION_KEY: True}
     inertia._request.session = mock_session
 
-    # First read should return the flash messages in proper format
-    result = inertia._get_flash_props()
+    # First read should return the flash messages
+    result = inertia._pull_flash_messages()
 
-    assert result == {
-        FLASH_PROPS_KEY: {"success": "Test message", "info": "Another message"}
-    }
+    assert result == {"success": "Test message", "info": "Another message"}
     assert FLASH_PROPS_KEY not in mock_session
 
     # Second read should return empty flash dict (session is still available)
-    result_second = inertia._get_flash_props()
+    result_second = inertia._pull_flash_messages()
 
-    assert result_second == {FLASH_PROPS_KEY: {}}
+    assert result_second == {}
 
 
 @pytest.mark.parametrize(
@@ -478,14 +481,14 @@ def test_flash_supports_various_value_types(inertia, value):
 def test_build_page_object_with_flash_integration(
     inertia, scope, session, shared_data, expected_props
 ):
-    """Test _build_page_object correctly merges flash, shared, and regular props"""
+    """Test build_page_object correctly merges flash, shared, and regular props"""
     for key, value in shared_data.items():
         inertia.share(key, value)
     inertia._request.scope = scope
     inertia._request.session = session
     inertia._component = "TestComponent"
 
-    result = inertia._build_page_object({"user": "John"})
+    result = build_page_object(inertia, {"user": "John"})
 
     assert result["props"] == expected_props
 
@@ -501,7 +504,7 @@ def test_deferred_props_excluded_on_initial_load(inertia):
         "stats": DeferredProp(lambda: {"views": 100}, group="analytics"),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Deferred props should NOT be in resolved props
     assert "posts" not in result["props"]
@@ -532,7 +535,7 @@ def test_deferred_props_resolved_on_partial_request(mock_request, inertia):
         "posts": DeferredProp(lambda: ["post1", "post2"], group="content"),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Only requested deferred prop should be resolved
     assert "posts" in result["props"]
@@ -555,7 +558,7 @@ def test_deferred_props_with_multiple_groups(inertia):
         "stats": DeferredProp(lambda: {}, group="metrics"),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert result["deferredProps"] == {
         "content": ["posts", "comments"],
@@ -584,7 +587,7 @@ def test_deferred_props_default_group(inertia):
         "data2": DeferredProp(lambda: "value2"),  # No group specified
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert result["deferredProps"] == {
         "default": ["data1", "data2"],
@@ -603,7 +606,7 @@ def test_deferred_props_mixed_with_regular_props(inertia):
         "active": True,
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Regular props should be present
     assert result["props"]["user"] == {"name": "John"}
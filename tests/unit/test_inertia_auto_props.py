@@ -0,0 +1,143 @@
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.props import AutoProp, ResolvedProp
+from fastapi_view.inertia.stats import LatencyStats, latency_stats
+from fastapi_view.view import ViewContext
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_INERTIA_AUTO_DEFER_THRESHOLD", "0.05")
+
+    latency_stats.clear()
+
+
+@pytest.fixture
+def mock_request() -> Mock:
+    """Create mock Request object"""
+    request = Mock(spec=Request)
+    request.headers = {InertiaHeader.INERTIA: "true"}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    return request
+
+
+@pytest.fixture
+def inertia(mock_request: Mock) -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=mock_request)
+
+        return Inertia(mock_request)
+
+
+def test_latency_stats_percentile_over_rolling_window():
+    """Test percentiles only consider the latest samples"""
+    stats = LatencyStats(window=20)
+
+    assert stats.p95("Page", "key") is None
+
+    for _ in range(20):
+        stats.record("Page", "key", 1.0)
+    for _ in range(20):
+        stats.record("Page", "key", 0.01)
+
+    assert stats.count("Page", "key") == 20
+    assert stats.p95("Page", "key") == 0.01
+    assert stats.p95("Other", "key") is None
+
+
+def test_latency_stats_nearest_rank_percentile():
+    """Test the p95 picks the nearest-rank sample"""
+    stats = LatencyStats()
+
+    for value in range(1, 101):
+        stats.record("Page", "key", value / 100)
+
+    assert stats.p95("Page", "key") == 0.95
+    assert stats.percentile("Page", "key", 0.5) == 0.5
+
+
+def test_inertia_auto_helper_method():
+    """Test Inertia.auto() static method"""
+    prop = Inertia.auto(lambda: "data", group="analytics")
+
+    assert isinstance(prop, AutoProp)
+    assert prop.group == "analytics"
+    assert prop() == "data"
+
+
+def test_prop_latency_recorded_per_component_and_key_path(inertia):
+    """Test resolved callables are timed, nested ones under dotted paths"""
+    inertia._component = "Dashboard"
+
+    inertia._resolve_property_instances(
+        {
+            "stats": lambda: 1,
+            "user": {"permissions": lambda: []},
+            "static": "value",
+            "resolved": ResolvedProp("value"),
+        }
+    )
+
+    assert latency_stats.count("Dashboard", "stats") == 1
+    assert latency_stats.count("Dashboard", "user.permissions") == 1
+    assert latency_stats.count("Dashboard", "static") == 0
+    assert latency_stats.count("Dashboard", "resolved") == 0
+
+
+def test_auto_prop_resolved_inline_while_fast(inertia):
+    """Test auto props stay inline without history or below the threshold"""
+    response = inertia.render("Dashboard", {"stats": Inertia.auto(lambda: 1)})
+    content = json.loads(response.body)
+
+    assert content["props"]["stats"] == 1
+    assert "deferredProps" not in content
+
+    latency_stats.record("Dashboard", "stats", 0.01)
+    response = inertia.render("Dashboard", {"stats": Inertia.auto(lambda: 1)})
+
+    assert json.loads(response.body)["props"]["stats"] == 1
+
+
+def test_auto_prop_deferred_once_p95_crosses_threshold(inertia):
+    """Test slow auto props are sent as deferred props of their group"""
+    for _ in range(10):
+        latency_stats.record("Dashboard", "stats", 0.2)
+
+    response = inertia.render(
+        "Dashboard", {"stats": Inertia.auto(lambda: 1, group="analytics")}
+    )
+
+    content = json.loads(response.body)
+
+    assert "stats" not in content["props"]
+    assert content["deferredProps"] == {"analytics": ["stats"]}
+
+
+def test_auto_prop_resolved_on_partial_request(mock_request, inertia):
+    """Test deferred auto props resolve and keep being measured on partials"""
+    for _ in range(10):
+        latency_stats.record("Dashboard", "stats", 0.2)
+
+    mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "Dashboard"
+    mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "stats"
+
+    response = asyncio.run(
+        inertia.render_async("Dashboard", {"stats": Inertia.auto(lambda: 1)})
+    )
+
+    assert json.loads(response.body)["props"]["stats"] == 1
+    assert latency_stats.count("Dashboard", "stats") == 11
@@ -0,0 +1,155 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.props import DeferredProp
+from fastapi_view.inertia.stats import latency_stats
+from fastapi_view.view import ViewContext
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+    monkeypatch.setenv("FV_INERTIA_CHEAP_GROUP_THRESHOLD", "0.01")
+    monkeypatch.setenv("FV_INERTIA_CHEAP_GROUP_MIN_SAMPLES", "3")
+
+    latency_stats.clear()
+
+
+@pytest.fixture
+def mock_request() -> Mock:
+    """Create mock Request object"""
+    request = Mock(spec=Request)
+    request.headers = {}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    return request
+
+
+@pytest.fixture
+def inertia(mock_request: Mock) -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=mock_request)
+        inertia = Inertia(mock_request)
+        inertia._component = "Dashboard"
+
+        return inertia
+
+
+def deferred_groups(inertia: Inertia, props: dict) -> dict:
+    return inertia._merge_cheap_groups(inertia._plan_props(props).deferred_groups())
+
+
+def measure(key: str, seconds: float, samples: int = 3):
+    for _ in range(samples):
+        latency_stats.record("Dashboard", key, seconds)
+
+
+@pytest.fixture
+def props() -> dict:
+    return {
+        "stats": DeferredProp(lambda: {}, group="analytics"),
+        "activities": DeferredProp(lambda: [], group="analytics"),
+        "charts": DeferredProp(lambda: [], group="charts"),
+        "badges": DeferredProp(lambda: [], group="badges"),
+    }
+
+
+def test_groups_kept_without_measurements(inertia, props):
+    """Test groups are not merged until every prop has enough samples"""
+    measure("charts", 0.001)
+    measure("badges", 0.001, samples=2)
+
+    assert deferred_groups(inertia, props) == {
+        "analytics": ["stats", "activities"],
+        "charts": ["charts"],
+        "badges": ["badges"],
+    }
+
+
+def test_cheap_groups_merged_together(inertia, props):
+    """Test consistently cheap groups share one follow-up request"""
+    measure("stats", 0.5)
+    measure("activities", 0.3)
+    measure("charts", 0.001)
+    measure("badges", 0.002)
+
+    assert deferred_groups(inertia, props) == {
+        "analytics": ["stats", "activities"],
+        "charts+badges": ["charts", "badges"],
+    }
+
+
+def test_single_cheap_group_kept_apart_from_slow_groups(inertia, props):
+    """Test a lone cheap group is not held back by a slower group"""
+    measure("stats", 0.5)
+    measure("activities", 0.3)
+    measure("charts", 0.001)
+    measure("badges", 0.05)
+
+    assert deferred_groups(inertia, props) == {
+        "analytics": ["stats", "activities"],
+        "charts": ["charts"],
+        "badges": ["badges"],
+    }
+
+
+def test_unmeasured_groups_kept_without_minimum_samples(monkeypatch, inertia, props):
+    """Test props without samples are never cheap, even with no minimum"""
+    monkeypatch.setenv("FV_INERTIA_CHEAP_GROUP_MIN_SAMPLES", "0")
+    inertia._settings = type(inertia._settings)()
+
+    measure("charts", 0.001)
+
+    assert deferred_groups(inertia, props) == {
+        "analytics": ["stats", "activities"],
+        "charts": ["charts"],
+        "badges": ["badges"],
+    }
+
+
+def test_groups_kept_when_optimizer_disabled(monkeypatch, inertia, props):
+    """Test groups are left alone without a configured threshold"""
+    monkeypatch.delenv("FV_INERTIA_CHEAP_GROUP_THRESHOLD")
+    inertia._settings = type(inertia._settings)()
+
+    for key in props:
+        measure(key, 0.001)
+
+    assert len(deferred_groups(inertia, props)) == 3
+
+
+def test_merged_group_requested_through_partial_groups_header(
+    mock_request, inertia, props
+):
+    """Test merged group names select all their original groups"""
+    mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "Dashboard"
+    mock_request.headers[InertiaHeader.PARTIAL_GROUPS] = "charts+badges"
+
+    assert set(inertia._plan_props(props).resolve) == {"charts", "badges"}
+
+
+def test_render_merges_groups_from_measured_resolutions(mock_request, inertia, props):
+    """Test latencies measured on partial requests feed the optimizer"""
+    mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "Dashboard"
+    mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "charts,badges"
+
+    for _ in range(3):
+        inertia.render("Dashboard", props)
+
+    measure("stats", 0.5)
+    measure("activities", 0.3)
+    del mock_request.headers[InertiaHeader.PARTIAL_ONLY]
+
+    assert deferred_groups(inertia, props)["charts+badges"] == [
+        "charts",
+        "badges",
+    ]
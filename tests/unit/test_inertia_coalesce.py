@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.props import CoalescedProp, DeferredProp
+from fastapi_view.inertia.singleflight import SingleFlight
+from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object_async
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+
+@pytest.fixture
+def inertia() -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    request = Mock(spec=Request)
+    request.headers = {}
+    request.url = "http://test.com/"
+    request.scope = {}
+
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=request)
+
+        return Inertia(request)
+
+
+def test_single_flight_coalesces_concurrent_threads():
+    """Test concurrent thread callers share one computation"""
+    flight = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+
+        return "result"
+
+    def worker():
+        barrier.wait()
+
+        return flight.call("key", compute)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = [f.result() for f in [executor.submit(worker) for _ in range(5)]]
+
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert not flight.in_flight("key")
+
+
+def test_single_flight_coalesces_concurrent_tasks():
+    """Test concurrent async callers share one computation"""
+    flight = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(flight.acall("key", compute) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert len(calls) == 1
+
+
+def test_single_flight_propagates_exceptions_and_releases_key():
+    """Test leader exception reaches followers and key is released"""
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.acall("key", fail) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.call("key", lambda: "fresh") == "fresh"
+
+
+def test_single_flight_cancelled_leader_hands_over_to_follower():
+    """Test a cancelled leader does not cancel its followers"""
+    flight = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.acall("key", compute))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(flight.acall("key", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        return leader, await follower, follower
+
+    leader, result, follower = asyncio.run(main())
+
+    assert leader.cancelled()
+    assert not follower.cancelled()
+    assert result == "result"
+    assert len(calls) == 2
+    assert not flight.in_flight("key")
+
+
+def test_single_flight_does_not_cache_settled_results():
+    """Test sequential calls compute each time"""
+    flight = SingleFlight()
+    counter = iter(range(10))
+
+    assert flight.call("key", lambda: next(counter)) == 0
+    assert flight.call("key", lambda: next(counter)) == 1
+
+
+def test_inertia_coalesce_helper_method():
+    """Test Inertia.coalesce() static method"""
+    prop = Inertia.coalesce(lambda: "data", key="stats")
+
+    assert isinstance(prop, CoalescedProp)
+    assert prop.key == "stats"
+    assert prop() == "data"
+
+
+def test_coalesced_prop_inside_deferred_prop():
+    """Test a coalesced prop can be deferred"""
+    deferred = Inertia.defer(Inertia.coalesce(lambda: [1, 2], key="nested"), "group")
+
+    assert isinstance(deferred, DeferredProp)
+    assert deferred() == [1, 2]
+    assert asyncio.run(deferred.resolve_async()) == [1, 2]
+
+
+def test_render_async_resolves_coroutine_props(inertia):
+    """Test render_async awaits coroutine props while keeping key order"""
+    inertia._request.headers["X-Inertia"] = "true"
+
+    async def get_stats():
+        await asyncio.sleep(0.01)
+
+        return {"users": 3}
+
+    async def get_name():
+        return "John"
+
+    props = {
+        "stats": get_stats,
+        "static": "value",
+        "nested": {"name": get_name},
+        "coalesced": Inertia.coalesce(get_stats, key="render-async"),
+    }
+
+    page = asyncio.run(build_page_object_async(inertia, props))
+
+    assert list(page["props"]) == ["flash", "stats", "static", "nested", "coalesced"]
+    assert page["props"]["stats"] == {"users": 3}
+    assert page["props"]["nested"] == {"name": "John"}
+    assert page["props"]["coalesced"] == {"users": 3}
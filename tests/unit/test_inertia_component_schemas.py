@@ -0,0 +1,253 @@
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from typing_extensions import TypedDict
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.config import InertiaSettings
+from fastapi_view.inertia.encoder import (
+    InertiaJSONResponse,
+    RawJSON,
+    to_jsonable,
+    type_encoders,
+)
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.schemas import (
+    ComponentSchema,
+    PropsSchemaError,
+    component_schemas,
+)
+from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
+
+
+class Row(TypedDict):
+    id: int
+    created: date
+
+
+class ReportProps(TypedDict, total=False):
+    title: str
+    rows: list[Row]
+
+
+class Filters(BaseModel):
+    search: str
+    trashed: bool
+
+
+class FilteredProps(TypedDict):
+    filters: Filters
+
+
+class Invoice(TypedDict):
+    total: Decimal
+    duration: timedelta
+    sent_at: datetime
+    number: uuid.UUID
+
+
+class InvoiceProps(TypedDict):
+    invoice: Invoice
+    lines: list[dict[str, Decimal]]
+    reference: uuid.UUID
+
+
+class Opaque:
+    pass
+
+
+class DashboardProps(BaseModel):
+    views: int
+    extra: Opaque | None = None
+
+    model_config = {"arbitrary_types_allowed": True}
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+    yield
+
+    component_schemas.clear()
+
+
+@pytest.fixture
+def inertia() -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    request = Mock(spec=Request)
+    request.headers = {InertiaHeader.INERTIA: "true"}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=request)
+
+        inertia = Inertia(request)
+        inertia._component = "Report"
+
+        return inertia
+
+
+ROWS = [{"id": 1, "created": date(2024, 1, 1)}]
+
+
+def test_inertia_register_component_helper_method():
+    """Test Inertia.register_component stores one schema per component"""
+    schema = Inertia.register_component("Report", ReportProps)
+
+    assert isinstance(schema, ComponentSchema)
+    assert component_schemas["Report"] is schema
+    assert set(schema.adapters) == {"title", "rows"}
+
+
+def test_declared_props_encoded_by_schema():
+    """Test declared props are encoded into RawJSON fragments"""
+    schema = ComponentSchema(ReportProps)
+
+    encoded = schema.encode("rows", ROWS)
+
+    assert isinstance(encoded, RawJSON)
+    assert json.loads(encoded.encoded) == [{"id": 1, "created": "2024-01-01"}]
+    assert schema.encode("other", ROWS) is ROWS
+
+
+def test_pydantic_model_schema():
+    """Test pydantic models declare props through their fields"""
+    schema = ComponentSchema(DashboardProps)
+
+    # Types pydantic cannot build a serializer for are left out
+    assert set(schema.adapters) == {"views"}
+    assert schema.encode("views", 3) == RawJSON("3")
+
+
+def test_mismatching_props_encoded_generically_without_check():
+    """Test values not matching the schema fall back to the generic encoder"""
+    schema = ComponentSchema(DashboardProps)
+    opaque = Opaque()
+
+    assert schema.encode("views", "many") == RawJSON('"many"')
+    assert schema.encode("extra", opaque) is opaque
+
+
+def test_mismatching_props_raise_with_check():
+    """Test the schema check reports mismatching values while encoding"""
+    schema = ComponentSchema(ReportProps)
+
+    with pytest.raises(PropsSchemaError, match="Prop 'rows' does not match"):
+        schema.encode("rows", [{"id": "one", "created": date(2024, 1, 1)}], check=True)
+
+
+def test_page_object_with_component_schema(inertia):
+    """Test a registered component encodes its props by schema"""
+    Inertia.register_component("Report", ReportProps)
+
+    page_object = build_page_object(inertia, {"title": "Sales", "rows": lambda: ROWS})
+
+    assert isinstance(page_object["props"]["rows"], RawJSON)
+    assert json.loads(InertiaJSONResponse(page_object).body)["props"] == {
+        "flash": {},
+        "title": "Sales",
+        "rows": [{"id": 1, "created": "2024-01-01"}],
+    }
+
+
+def test_schema_check_setting(monkeypatch, inertia):
+    """Test FV_INERTIA_SCHEMA_CHECK enables the check during rendering"""
+    monkeypatch.setenv("FV_INERTIA_SCHEMA_CHECK", "true")
+    Inertia.register_component("Report", ReportProps)
+
+    inertia._settings = InertiaSettings()
+
+    with pytest.raises(PropsSchemaError):
+        build_page_object(inertia, {"title": 42})
+
+
+def test_schema_check_accepts_matching_dicts(monkeypatch, inertia):
+    """Test dicts shaped like a declared model pass the schema check"""
+    monkeypatch.setenv("FV_INERTIA_SCHEMA_CHECK", "true")
+    Inertia.register_component("Report", FilteredProps)
+    inertia._settings = InertiaSettings()
+
+    page_object = build_page_object(
+        inertia, {"filters": {"search": "acme", "trashed": False}}
+    )
+
+    assert json.loads(InertiaJSONResponse(page_object).body)["props"]["filters"] == {
+        "search": "acme",
+        "trashed": False,
+    }
+
+    with pytest.raises(PropsSchemaError):
+        build_page_object(inertia, {"filters": {"search": "acme", "trashed": "no"}})
+
+
+def test_schema_skipped_for_pruned_props(monkeypatch, inertia):
+    """Test nested partial reloads are not checked against the whole type"""
+    monkeypatch.setenv("FV_INERTIA_SCHEMA_CHECK", "true")
+    Inertia.register_component("Report", FilteredProps)
+    inertia._settings = InertiaSettings()
+    inertia._request.headers.update(
+        {
+            InertiaHeader.PARTIAL_COMPONENT: "Report",
+            InertiaHeader.PARTIAL_ONLY: "filters.search",
+        }
+    )
+
+    page_object = build_page_object(
+        inertia, {"filters": {"search": "acme", "trashed": False}}
+    )
+
+    assert json.loads(InertiaJSONResponse(page_object).body)["props"] == {
+        "filters": {"search": "acme"}
+    }
+
+
+def test_schema_encodes_like_jsonable_encoder():
+    """Test types pydantic encodes differently keep the generic encoding"""
+    schema = ComponentSchema(InvoiceProps)
+    invoice = {
+        "total": Decimal("1.50"),
+        "duration": timedelta(seconds=3),
+        "sent_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "number": uuid.UUID(int=1),
+    }
+    props = {
+        "invoice": invoice,
+        "lines": [{"amount": Decimal("2.50")}],
+        "reference": uuid.UUID(int=2),
+    }
+
+    encoded = {key: schema.encode(key, value) for key, value in props.items()}
+
+    assert encoded["invoice"] is invoice
+    assert isinstance(encoded["reference"], RawJSON)
+    assert json.loads(InertiaJSONResponse(to_jsonable(encoded)).body) == (
+        jsonable_encoder(props)
+    )
+
+
+def test_registered_encoders_apply_to_schema_props(monkeypatch):
+    """Test registering an encoder takes its types off the schema serializers"""
+    monkeypatch.setattr(type_encoders, "_encoders", dict(type_encoders._encoders))
+    monkeypatch.setattr(type_encoders, "_resolved", {})
+    schema = ComponentSchema(InvoiceProps)
+    reference = uuid.UUID(int=2)
+
+    assert isinstance(schema.encode("reference", reference), RawJSON)
+
+    Inertia.register_encoder(uuid.UUID, lambda value: value.hex)
+
+    assert schema.encode("reference", reference) is reference
+    assert to_jsonable(reference) == reference.hex
@@ -0,0 +1,215 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.concurrency import executor
+from fastapi_view.inertia.groups import GroupLimits, group_limits
+from fastapi_view.inertia.props import DeferredProp
+from fastapi_view.view import ViewContext
+
+
+@pytest.fixture(autouse=True)
+def reset_group_limits():
+    yield
+
+    group_limits.clear()
+
+
+@pytest.fixture
+def inertia() -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    request = Mock(spec=Request)
+    request.headers = {}
+    request.scope = {}
+
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=request)
+        inertia = Inertia(request)
+        inertia._component = "Dashboard"
+
+        return inertia
+
+
+def tracked(active: list, peak: list, seconds: float, value="done"):
+    lock = threading.Lock()
+
+    def resolve():
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(seconds)
+        with lock:
+            active.pop()
+
+        return value
+
+    return resolve
+
+
+def test_configure_group_registers_limits():
+    """Test Inertia.configure_group() registers process-wide limits"""
+    limits = Inertia.configure_group("analytics", max_concurrency=2, timeout=1.0)
+
+    assert isinstance(limits, GroupLimits)
+    assert group_limits["analytics"] is limits
+    assert limits.max_concurrency == 2
+    assert limits.timeout == 1.0
+
+
+def test_invalid_max_concurrency_rejected():
+    """Test non-positive concurrency limits are rejected"""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        GroupLimits(max_concurrency=0)
+
+
+def test_group_limits_bound_concurrent_resolutions():
+    """Test no more than max_concurrency props resolve at once"""
+    limits = GroupLimits(max_concurrency=2)
+    active, peak = [], []
+    prop = DeferredProp(tracked(active, peak, 0.05), group="analytics")
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(lambda _: limits.run("analytics", prop), range(6)))
+
+    assert results == ["done"] * 6
+    assert max(peak) == 2
+
+
+def test_group_timeout_returns_structured_error():
+    """Test timed-out props resolve to a structured error by default"""
+    limits = GroupLimits(timeout=0.05)
+    prop = DeferredProp(lambda: time.sleep(0.3), group="analytics")
+
+    assert limits.run("analytics", prop) == {
+        "error": "timeout",
+        "group": "analytics",
+        "timeout": 0.05,
+    }
+
+
+def test_group_timeout_returns_fallback_while_waiting_for_slot():
+    """Test props waiting too long for a slot resolve to the fallback"""
+    limits = GroupLimits(max_concurrency=1, timeout=0.05, fallback=lambda: [])
+    slow = DeferredProp(lambda: time.sleep(0.2) or "slow", group="analytics")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(limits.run, "analytics", slow)
+        time.sleep(0.01)
+        second = executor.submit(limits.run, "analytics", slow)
+
+        assert first.result() == []
+        assert second.result() == []
+
+
+def test_group_timeout_keeps_slot_until_computation_finishes():
+    """Test abandoned computations still count against the limit"""
+    limits = GroupLimits(max_concurrency=1, timeout=0.05, fallback=None)
+    slow = DeferredProp(lambda: time.sleep(0.2) or "slow", group="analytics")
+
+    assert limits.run("analytics", slow) is None
+    assert limits.run("analytics", DeferredProp(lambda: "fast")) is None
+
+    time.sleep(0.25)
+
+    assert limits.run("analytics", DeferredProp(lambda: "fast")) == "fast"
+
+
+def test_group_timeout_cancels_queued_computation():
+    """Test a prop still queued on the executor at the timeout never runs"""
+    limits = GroupLimits(max_concurrency=1, timeout=0.05, fallback="fallback")
+    calls = []
+    release = threading.Event()
+    blockers = [executor.submit(release.wait) for _ in range(executor._max_workers)]
+
+    try:
+        result = limits.run("g", DeferredProp(lambda: calls.append(1)))
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+
+    assert result == "fallback"
+    assert limits.run("g", DeferredProp(lambda: "next")) == "next"
+    assert calls == []
+
+
+def test_async_waiters_woken_by_release():
+    """Test tasks waiting for a slot are notified instead of polling"""
+    limits = GroupLimits(max_concurrency=1, timeout=1)
+    started = threading.Event()
+
+    def hold():
+        started.set()
+        time.sleep(0.1)
+
+        return "held"
+
+    async def wait_for_slot():
+        waiting = asyncio.ensure_future(
+            limits.run_async("g", DeferredProp(lambda: "waited"))
+        )
+        await asyncio.sleep(0.02)
+        waiters = len(limits._waiters)
+
+        return await waiting, waiters
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        holder = pool.submit(limits.run, "g", DeferredProp(hold))
+        started.wait()
+        result, waiters = asyncio.run(wait_for_slot())
+
+    assert holder.result() == "held"
+    assert result == "waited"
+    assert waiters == 1
+    assert not limits._waiters
+
+
+def test_group_limits_async_resolution():
+    """Test async props are throttled and cancelled on timeout"""
+    limits = GroupLimits(max_concurrency=1, timeout=0.1, fallback="fallback")
+    active, peak = [], []
+
+    async def resolve():
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.02)
+        active.pop()
+
+        return "done"
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    async def main():
+        results = await asyncio.gather(
+            *(limits.run_async("g", DeferredProp(resolve)) for _ in range(3))
+        )
+        timed_out = await limits.run_async("g", DeferredProp(hang))
+
+        return results, timed_out
+
+    results, timed_out = asyncio.run(main())
+
+    assert results == ["done"] * 3
+    assert max(peak) == 1
+    assert timed_out == "fallback"
+
+
+def test_group_limits_applied_when_resolving_deferred_props(inertia):
+    """Test Inertia resolution routes deferred props through their group limits"""
+    Inertia.configure_group("analytics", timeout=0.05, fallback="fallback")
+
+    resolved = inertia._resolve_property_instances(
+        {
+            "stats": DeferredProp(lambda: time.sleep(0.3), group="analytics"),
+            "charts": DeferredProp(lambda: "charts", group="charts"),
+        }
+    )
+
+    assert resolved == {"stats": "fallback", "charts": "charts"}
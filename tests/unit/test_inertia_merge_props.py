@@ -8,6 +8,7 @@ from fastapi_view.inertia.enums import InertiaHeader
 from fastapi_view.inertia.inertia import FLASH_PROPS_KEY, REQUEST_SESSION_KEY
 from fastapi_view.inertia.props import MergeProp
 from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
 
 
 @pytest.fixture(autouse=True)
@@ -146,7 +147,7 @@ def test_merge_props_excluded_on_initial_load(inertia):
         "posts": MergeProp(lambda: [{"id": 1, "title": "Post 1"}]),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Merge prop should NOT be in resolved props
     assert "posts" not in result["props"]
@@ -164,7 +165,7 @@ def test_merge_props_with_prepend_config(inertia):
         "notifications": MergeProp(lambda: []).prepend(),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert "prependProps" in result
     assert "notifications" in result["prependProps"]
@@ -177,7 +178,7 @@ def test_merge_props_with_deep_merge_config(inertia):
         "settings": MergeProp(lambda: {}).deep_merge(),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert "deepMergeProps" in result
     assert "settings" in result["deepMergeProps"]
@@ -190,7 +191,7 @@ def test_merge_props_with_match_on_config(inertia):
         "users": MergeProp(lambda: []).append(match_on="id"),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert "matchPropsOn" in result
     assert result["matchPropsOn"]["users"] == "id"
@@ -206,7 +207,7 @@ def test_merge_props_multiple_configurations(inertia):
         "posts": MergeProp(lambda: []),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # All merge props should be in mergeProps list
     assert "mergeProps" in result
@@ -237,7 +238,7 @@ def test_merge_props_no_config_when_none_present(inertia):
         "count": 42,
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # No merge config keys should be present
     assert "mergeProps" not in result
@@ -264,7 +265,7 @@ def test_merge_props_resolved_on_partial_request(mock_request, inertia):
         "posts": MergeProp(lambda: [{"id": 2, "title": "Post 2"}]),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Only requested merge prop should be resolved
     assert "posts" in result["props"]
@@ -291,7 +292,7 @@ def test_merge_props_partial_request_multiple_props(mock_request, inertia):
         "comments": MergeProp(lambda: [{"id": 3}]),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Only requested props should be resolved
     assert "posts" in result["props"]
@@ -347,7 +348,7 @@ def test_merge_props_combined_with_deferred_props(inertia):
         "paginated": MergeProp(lambda: [1, 2, 3]),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Both configs should coexist
     assert "deferredProps" in result
@@ -365,7 +366,7 @@ def test_merge_props_mixed_with_regular_props(inertia):
         "count": 42,
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Regular props should be included
     assert result["props"]["user"] == {"id": 1, "name": "John"}
@@ -385,7 +386,7 @@ def test_merge_props_with_shared_props(inertia):
         "posts": MergeProp(lambda: [{"id": 1}]),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Shared props should be included
     assert "auth" in result["props"]
@@ -408,7 +409,7 @@ def test_merge_prop_with_empty_list(inertia):
         "items": MergeProp(lambda: []),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert "mergeProps" in result
     assert "items" in result["mergeProps"]
@@ -421,7 +422,7 @@ def test_merge_prop_with_none_value(inertia):
         "data": MergeProp(lambda: None),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert "mergeProps" in result
     assert "data" in result["mergeProps"]
@@ -440,7 +441,7 @@ def test_merge_prop_append_and_prepend_false(inertia):
         "items": merge_prop,
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Should still be in mergeProps
     assert "mergeProps" in result
@@ -462,7 +463,7 @@ def test_merge_prop_multiple_match_on_fields(inertia):
         "items": merge_prop,
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Should use first match field (Laravel behavior)
     assert "matchPropsOn" in result
@@ -479,7 +480,7 @@ def test_merge_prop_chained_configuration(inertia):
         "items": merge_prop,
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     assert "mergeProps" in result
     assert "deepMergeProps" in result
@@ -503,7 +504,7 @@ def test_merge_props_with_flash_messages(inertia, mock_request):
         "posts": MergeProp(lambda: [{"id": 1}]),
     }
 
-    result = inertia._build_page_object(props)
+    result = build_page_object(inertia, props)
 
     # Flash messages should be included
     assert FLASH_PROPS_KEY in result["props"]
@@ -0,0 +1,156 @@
+import json
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.encoder import (
+    InertiaJSONResponse,
+    RawJSON,
+    dumps,
+    encode_models,
+    to_jsonable,
+)
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
+
+
+class Contact(BaseModel):
+    id: int
+    first_name: str = Field(alias="firstName")
+    created: date
+
+
+@dataclass
+class Organization:
+    id: int
+    name: str
+
+
+@dataclass
+class Invoice:
+    price: Decimal
+    took: timedelta
+
+
+class InvoiceModel(BaseModel):
+    price: Decimal
+    took: timedelta
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+
+@pytest.fixture
+def inertia() -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    request = Mock(spec=Request)
+    request.headers = {InertiaHeader.INERTIA: "true"}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=request)
+
+        inertia = Inertia(request)
+        inertia._component = "Contacts"
+
+        return inertia
+
+
+def contact(index: int) -> Contact:
+    return Contact(id=index, firstName=f"Name{index}", created=date(2024, 1, index))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        contact(1),
+        [contact(1), contact(2)],
+        (contact(1),),
+        InvoiceModel(price=Decimal("1.50"), took=timedelta(seconds=90)),
+    ],
+)
+def test_models_encoded_natively(value):
+    """Test models match jsonable_encoder output"""
+    encoded = encode_models(value)
+
+    assert isinstance(encoded, RawJSON)
+    assert json.loads(encoded.encoded) == jsonable_encoder(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        [contact(1), Organization(id=1, name="Acme")],
+        [{"id": 1}],
+        {"contact": "plain"},
+        Organization(id=1, name="Acme"),
+        [Organization(id=1, name="Acme")],
+    ],
+)
+def test_other_values_left_to_generic_encoder(value):
+    """Test mixed lists, plain data and dataclasses are unchanged"""
+    assert encode_models(value) is value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        Invoice(price=Decimal("1.50"), took=timedelta(seconds=90)),
+        [Invoice(price=Decimal("1.50"), took=timedelta(seconds=90))],
+        InvoiceModel(price=Decimal("1.50"), took=timedelta(seconds=90)),
+        {"invoice": InvoiceModel(price=Decimal("1.50"), took=timedelta(seconds=90))},
+    ],
+)
+def test_prop_encoding_matches_jsonable_encoder(inertia, value):
+    """Test the sent JSON is unchanged for dataclasses and models"""
+    page_object = build_page_object(inertia, {"value": value})
+    props = json.loads(InertiaJSONResponse(page_object).body)["props"]
+
+    assert props["value"] == jsonable_encoder(value)
+
+
+def test_nested_models_encoded_natively():
+    """Test models nested in plain data are encoded by pydantic as well"""
+    jsonable = to_jsonable({"page": {"contact": contact(1)}})
+
+    assert isinstance(jsonable["page"]["contact"], RawJSON)
+    assert json.loads(dumps(jsonable)) == {
+        "page": {
+            "contact": {"id": 1, "firstName": "Name1", "created": "2024-01-01"},
+        }
+    }
+
+
+def test_page_object_with_model_props(inertia):
+    """Test model props are sent as pydantic-encoded JSON"""
+    page_object = build_page_object(
+        inertia,
+        {
+            "contacts": lambda: [contact(1), contact(2)],
+            "organization": Organization(id=1, name="Acme"),
+        },
+    )
+
+    assert json.loads(InertiaJSONResponse(page_object).body)["props"] == {
+        "flash": {},
+        "contacts": [
+            {"id": 1, "firstName": "Name1", "created": "2024-01-01"},
+            {"id": 2, "firstName": "Name2", "created": "2024-01-02"},
+        ],
+        "organization": {"id": 1, "name": "Acme"},
+    }
@@ -0,0 +1,101 @@
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.props import OnceProp
+from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+
+@pytest.fixture
+def mock_request() -> Mock:
+    """Create mock Request object"""
+    request = Mock(spec=Request)
+    request.headers = {}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    return request
+
+
+@pytest.fixture
+def inertia(mock_request: Mock) -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=mock_request)
+        inertia = Inertia(mock_request)
+        inertia._component = "TestComponent"
+
+        return inertia
+
+
+def test_inertia_once_helper_method():
+    """Test Inertia.once() static method"""
+    prop = Inertia.once(lambda: ["org"], key="organizations")
+
+    assert isinstance(prop, OnceProp)
+    assert prop.once_key("orgs") == "organizations"
+    assert prop.expires_at() is None
+    assert prop() == ["org"]
+
+
+def test_once_prop_default_key_and_ttl():
+    """Test once key defaults to prop name and TTL yields a future timestamp"""
+    prop = OnceProp(lambda: [], ttl=60)
+
+    assert prop.once_key("organizations") == "organizations"
+    assert prop.expires_at() > int(time.time() * 1000)
+
+
+def test_once_prop_resolved_when_client_lacks_it(inertia):
+    """Test once props are sent with metadata on first visit"""
+    calls = []
+    props = {
+        "name": "John",
+        "orgs": Inertia.once(lambda: calls.append(1) or ["Acme"], key="organizations"),
+    }
+
+    result = build_page_object(inertia, props)
+
+    assert result["props"]["orgs"] == ["Acme"]
+    assert result["onceProps"] == {"organizations": {"prop": "orgs", "expiresAt": None}}
+    assert calls == [1]
+
+
+def test_once_prop_skipped_when_client_holds_it(mock_request, inertia):
+    """Test once props listed in the except header are not computed"""
+    mock_request.headers[InertiaHeader.EXCEPT_ONCE_PROPS] = "other, organizations"
+    calls = []
+    props = {
+        "name": "John",
+        "orgs": Inertia.once(lambda: calls.append(1) or ["Acme"], key="organizations"),
+    }
+
+    result = build_page_object(inertia, props)
+
+    assert result["props"] == {"flash": {}, "name": "John"}
+    assert result["onceProps"] == {"organizations": {"prop": "orgs", "expiresAt": None}}
+    assert calls == []
+
+
+def test_once_prop_resolved_when_explicitly_requested(mock_request, inertia):
+    """Test partial reloads asking for a once prop always receive it"""
+    mock_request.headers[InertiaHeader.EXCEPT_ONCE_PROPS] = "orgs"
+    mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "orgs"
+    mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "TestComponent"
+
+    result = build_page_object(inertia, {"orgs": Inertia.once(lambda: ["Acme"])})
+
+    assert result["props"]["orgs"] == ["Acme"]
@@ -0,0 +1,99 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.plan import PropsPlan
+from fastapi_view.inertia.props import (
+    DeferredProp,
+    IgnoreFirstLoad,
+    MergeProp,
+    OnceProp,
+    OptionalProp,
+)
+from fastapi_view.view import ViewContext
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+
+@pytest.fixture
+def mock_request() -> Mock:
+    """Create mock Request object"""
+    request = Mock(spec=Request)
+    request.headers = {InertiaHeader.INERTIA: "true"}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    return request
+
+
+@pytest.fixture
+def inertia(mock_request: Mock) -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=mock_request)
+
+        inertia = Inertia(mock_request)
+        inertia._component = "Dashboard"
+
+        return inertia
+
+
+def test_plan_initial_load(inertia):
+    """Test every prop is classified in one pass on the initial load"""
+    plan = inertia._plan_props(
+        {
+            "user": "John",
+            "lazy": OptionalProp(lambda: "lazy"),
+            "stats": DeferredProp(lambda: 1, group="stats"),
+            "feed": MergeProp(lambda: []),
+            "plans": OnceProp(lambda: ["basic"]),
+        }
+    )
+
+    assert isinstance(plan, PropsPlan)
+    assert list(plan.resolve) == ["user", "plans"]
+    assert plan.deferred_groups() == {"stats": ["stats"]}
+    assert plan.merge_config() == {"mergeProps": ["feed"]}
+    assert plan.once == {"plans": {"prop": "plans", "expiresAt": None}}
+
+
+def test_plan_partial_load(mock_request, inertia):
+    """Test partial loads keep requested keys and groups, minus except keys"""
+    mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "Dashboard"
+    mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "user, secret"
+    mock_request.headers[InertiaHeader.PARTIAL_EXCEPT] = "secret"
+    mock_request.headers[InertiaHeader.PARTIAL_GROUPS] = "stats"
+
+    plan = inertia._plan_props(
+        {
+            "user": "John",
+            "secret": "hidden",
+            "other": "skipped",
+            "stats": DeferredProp(lambda: 1, group="stats"),
+            "charts": DeferredProp(lambda: 2, group="charts"),
+            "lazy": IgnoreFirstLoad(),
+        }
+    )
+
+    assert list(plan.resolve) == ["user", "stats"]
+    assert plan.deferred == {}
+
+
+def test_header_key_sets_parsed_once(mock_request, inertia):
+    """Test partial header key sets are parsed once per request"""
+    mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "user"
+
+    assert inertia._partial_only_keys is inertia._partial_only_keys
+
+    mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "other"
+
+    assert inertia._partial_only_keys == frozenset({"user"})
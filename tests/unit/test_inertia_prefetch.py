@@ -0,0 +1,68 @@
+import asyncio
+import time
+from concurrent.futures import Future
+
+from fastapi_view.inertia.prefetch import PrefetchCache
+from fastapi_view.inertia.props import DeferredProp, PrefetchedProp
+
+
+def test_prefetch_cache_park_and_take():
+    """Test parked futures are taken exactly once"""
+    cache = PrefetchCache()
+
+    future = cache.park(("token", "/dashboard", "Dashboard", "analytics"), ttl=10)
+
+    assert cache.take(("token", "/dashboard", "Dashboard", "analytics")) is future
+    assert cache.take(("token", "/dashboard", "Dashboard", "analytics")) is None
+
+
+def test_prefetch_cache_expired_entries_are_not_served(monkeypatch):
+    """Test entries past their TTL are ignored and purged"""
+    cache = PrefetchCache()
+    cache.park(("token", "/dashboard", "Dashboard", "analytics"), ttl=1)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 5)
+
+    assert cache.take(("token", "/dashboard", "Dashboard", "analytics")) is None
+
+    cache.park(("token", "/dashboard", "Dashboard", "charts"), ttl=1)
+    cache.park(("other", "Dashboard", "charts"), ttl=1)
+
+    assert len(cache) == 2
+
+
+def test_prefetch_cache_evicts_oldest_entry_when_full():
+    """Test the cache stays bounded"""
+    cache = PrefetchCache(max_entries=2)
+
+    cache.park(("a", "Page", "group"), ttl=10)
+    cache.park(("b", "Page", "group"), ttl=10)
+    cache.park(("c", "Page", "group"), ttl=10)
+
+    assert len(cache) == 2
+    assert cache.take(("a", "Page", "group")) is None
+
+
+def test_prefetched_prop_serves_group_result():
+    """Test prefetched props read their key from the group result"""
+    future = Future()
+    future.set_result({"stats": {"users": 3}, "activities": []})
+    prop = PrefetchedProp(DeferredProp(lambda: "fresh"), future, "stats", timeout=1)
+
+    assert prop() == {"users": 3}
+    assert asyncio.run(prop.resolve_async()) == {"users": 3}
+
+
+def test_prefetched_prop_falls_back_on_failure_or_timeout():
+    """Test the original prop is resolved when prefetching did not succeed"""
+    failed = Future()
+    failed.set_exception(RuntimeError("db down"))
+    pending = Future()
+
+    assert PrefetchedProp(DeferredProp(lambda: "fresh"), failed, "k", 1)() == "fresh"
+
+    prop = PrefetchedProp(DeferredProp(lambda: "fresh"), pending, "k", timeout=0.01)
+
+    assert prop() == "fresh"
+    assert asyncio.run(prop.resolve_async()) == "fresh"
@@ -0,0 +1,140 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.encoder import InertiaJSONResponse, JSONStream, RawJSON
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.hashes import (
+    apply_prop_hashes,
+    hashed_components,
+    parse_prop_hashes,
+    prop_hash,
+)
+from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+    yield
+
+    hashed_components.clear()
+
+
+def make_inertia(headers: dict) -> Inertia:
+    request = Mock(spec=Request)
+    request.headers = {InertiaHeader.INERTIA: "true", **headers}
+    request.url = "http://test.com/orders"
+    request.session = None
+    request.scope = {}
+
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=request)
+
+        inertia = Inertia(request)
+        inertia._component = "Orders"
+
+        return inertia
+
+
+ORDERS = [{"id": 1, "total": 10}, {"id": 2, "total": 20}]
+
+
+def test_parse_prop_hashes():
+    """Test the echoed hashes header is parsed into a mapping"""
+    assert parse_prop_hashes(" orders=abc, count=def,,broken, =x") == {
+        "orders": "abc",
+        "count": "def",
+    }
+
+
+def test_apply_prop_hashes_encodes_once():
+    """Test hashed props are replaced by their encoded fragments"""
+    props = {"orders": ORDERS, "rows": JSONStream(iter([]))}
+
+    hashes, unchanged = apply_prop_hashes(props, {})
+
+    assert unchanged == []
+    assert props["orders"] == RawJSON(
+        '[{"id": 1, "total": 10}, {"id": 2, "total": 20}]'
+    )
+    assert hashes == {"orders": prop_hash(props["orders"].encoded)}
+    assert isinstance(props["rows"], JSONStream)
+
+
+def test_apply_prop_hashes_omits_known_props():
+    """Test props whose hash the client already has are dropped"""
+    hashes, _ = apply_prop_hashes({"orders": ORDERS, "count": 2}, {})
+    props = {"orders": ORDERS, "count": 3}
+
+    new_hashes, unchanged = apply_prop_hashes(props, hashes)
+
+    assert unchanged == ["orders"]
+    assert list(props) == ["count"]
+    assert new_hashes["orders"] == hashes["orders"]
+    assert new_hashes["count"] != hashes["count"]
+
+
+def test_inertia_hash_props_helper_method():
+    """Test Inertia.hash_props opts a component in"""
+    Inertia.hash_props("Orders")
+
+    assert "Orders" in hashed_components
+
+
+def test_page_object_without_opt_in_has_no_hashes():
+    """Test components are not hashed by default"""
+    page_object = build_page_object(make_inertia({}), {"orders": ORDERS})
+
+    assert "propHashes" not in page_object
+
+
+def test_page_object_lists_prop_hashes():
+    """Test opted-in components send a hash for each prop"""
+    Inertia.hash_props("Orders")
+
+    page_object = build_page_object(make_inertia({}), {"orders": lambda: ORDERS})
+
+    assert set(page_object["propHashes"]) == {"flash", "orders"}
+    assert "unchangedProps" not in page_object
+
+
+def test_partial_reload_omits_unchanged_props():
+    """Test a partial reload skips the props the client echoed unchanged"""
+    Inertia.hash_props("Orders")
+    hashes = build_page_object(make_inertia({}), {"orders": ORDERS, "count": 2})[
+        "propHashes"
+    ]
+
+    inertia = make_inertia(
+        {
+            InertiaHeader.PARTIAL_COMPONENT: "Orders",
+            InertiaHeader.PARTIAL_ONLY: "orders,count",
+            InertiaHeader.PROP_HASHES: ",".join(
+                f"{key}={digest}" for key, digest in hashes.items()
+            ),
+        }
+    )
+    page_object = build_page_object(inertia, {"orders": ORDERS, "count": 3})
+
+    assert page_object["unchangedProps"] == ["orders"]
+    assert json.loads(InertiaJSONResponse(page_object).body)["props"] == {"count": 3}
+
+
+def test_echoed_hashes_ignored_outside_partial_reloads():
+    """Test full visits always send every prop"""
+    Inertia.hash_props("Orders")
+    hashes = build_page_object(make_inertia({}), {"orders": ORDERS})["propHashes"]
+
+    inertia = make_inertia({InertiaHeader.PROP_HASHES: f"orders={hashes['orders']}"})
+    page_object = build_page_object(inertia, {"orders": ORDERS})
+
+    assert "orders" in page_object["props"]
+    assert "unchangedProps" not in page_object
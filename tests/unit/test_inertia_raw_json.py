@@ -0,0 +1,106 @@
+import json
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.encoder import (
+    InertiaJSONResponse,
+    RawJSON,
+    dumps,
+    to_jsonable,
+)
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+
+@pytest.fixture
+def mock_request() -> Mock:
+    """Create mock Request object"""
+    request = Mock(spec=Request)
+    request.headers = {InertiaHeader.INERTIA: "true"}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    return request
+
+
+@pytest.fixture
+def inertia(mock_request: Mock) -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=mock_request)
+
+        inertia = Inertia(mock_request)
+        inertia._component = "Reports"
+
+        return inertia
+
+
+def test_inertia_raw_helper_method():
+    """Test Inertia.raw accepts bytes and str"""
+    assert Inertia.raw(b'{"a": 1}') == RawJSON('{"a": 1}')
+    assert Inertia.raw("[1, 2]").encoded == "[1, 2]"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ({"rows": RawJSON('[{"id": 1}]')}, '{"rows": [{"id": 1}]}'),
+        (
+            [RawJSON("1"), "text", {"nested": RawJSON('{"b":true}')}],
+            '[1, "text", {"nested": {"b":true}}]',
+        ),
+        ({"plain": "no fragments"}, '{"plain": "no fragments"}'),
+    ],
+)
+def test_dumps_splices_fragments(value, expected):
+    """Test raw fragments are copied into the output verbatim"""
+    assert dumps(value) == expected
+
+
+def test_dumps_rejects_unknown_types():
+    """Test values that are not JSON-ready still fail to serialize"""
+    with pytest.raises(TypeError, match="date is not JSON serializable"):
+        dumps({"day": date(2024, 1, 1)})
+
+
+def test_to_jsonable_keeps_fragments():
+    """Test jsonable encoding leaves fragments untouched"""
+    raw = RawJSON('{"a": 1}')
+
+    assert to_jsonable({"day": date(2024, 1, 1), "raw": [raw]}) == {
+        "day": "2024-01-01",
+        "raw": [raw],
+    }
+
+
+def test_page_object_with_raw_props(inertia):
+    """Test raw props survive page building and are spliced into the response"""
+    page_object = build_page_object(
+        inertia,
+        {
+            "summary": Inertia.raw(b'{"total": 3}'),
+            "rows": lambda: RawJSON('[{"id": 1, "name": "Zo\\u00eb"}]'),
+        },
+    )
+
+    body = InertiaJSONResponse(page_object).body
+
+    assert json.loads(body)["props"] == {
+        "flash": {},
+        "summary": {"total": 3},
+        "rows": [{"id": 1, "name": "Zoë"}],
+    }
+    assert b'"rows":[{"id": 1, "name": "Zo\\u00eb"}]' in body
@@ -0,0 +1,84 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi import Request
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.encoder import InertiaJSONResponse, dumps
+from fastapi_view.inertia.enums import InertiaHeader
+from fastapi_view.inertia.props import StaticProp
+from fastapi_view.view import ViewContext
+from tests.unit.pages import build_page_object
+
+SETTINGS = {"theme": {"colors": {"primary": "#000"}}, "locales": ["en", "fr"]}
+
+
+@pytest.fixture(autouse=True)
+def setup_test_env(monkeypatch):
+    """Set up test environment variables"""
+    monkeypatch.setenv("FV_INERTIA_ROOT_TEMPLATE", "app.html")
+    monkeypatch.setenv("FV_INERTIA_ASSETS_VERSION", "1.0.0")
+
+
+@pytest.fixture
+def mock_request() -> Mock:
+    """Create mock Request object"""
+    request = Mock(spec=Request)
+    request.headers = {InertiaHeader.INERTIA: "true"}
+    request.url = "http://test.com/"
+    request.session = None
+    request.scope = {}
+
+    return request
+
+
+@pytest.fixture
+def inertia(mock_request: Mock) -> Inertia:
+    """Create Inertia instance with mocked ViewContext"""
+    with patch("fastapi_view.inertia.inertia.ViewContext") as mock_view_cls:
+        mock_view_cls.return_value = Mock(spec=ViewContext, _request=mock_request)
+
+        inertia = Inertia(mock_request)
+        inertia._component = "Settings"
+
+        return inertia
+
+
+def test_inertia_static_helper_method():
+    """Test Inertia.static creates StaticProp instances"""
+    prop = Inertia.static(SETTINGS)
+
+    assert isinstance(prop, StaticProp)
+    assert prop.value is SETTINGS
+
+
+def test_static_props_not_traversed(inertia):
+    """Test static data is neither searched for callables nor copied"""
+    prop = Inertia.static(SETTINGS)
+
+    resolved = inertia._resolve_property_instances({"settings": prop})
+
+    assert resolved["settings"] is prop
+
+
+def test_static_props_encoded_as_is(inertia):
+    """Test static data is serialized directly into the page"""
+    page_object = build_page_object(inertia, {"settings": Inertia.static(SETTINGS)})
+
+    assert page_object["props"]["settings"].value is SETTINGS
+    assert json.loads(InertiaJSONResponse(page_object).body)["props"] == {
+        "flash": {},
+        "settings": SETTINGS,
+    }
+    assert dumps(page_object["props"]["settings"]) == json.dumps(SETTINGS)
+
+
+def test_static_props_pruned_by_nested_partial_keys(mock_request, inertia):
+    """Test dotted partial keys still apply to static data"""
+    mock_request.headers[InertiaHeader.PARTIAL_COMPONENT] = "Settings"
+    mock_request.headers[InertiaHeader.PARTIAL_ONLY] = "settings.theme"
+
+    page_object = build_page_object(inertia, {"settings": Inertia.static(SETTINGS)})
+
+    assert page_object["props"] == {"settings": {"theme": SETTINGS["theme"]}}
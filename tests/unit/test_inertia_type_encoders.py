@@ -0,0 +1,143 @@
+import dataclasses
+import enum
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import PurePosixPath
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from fastapi_view.inertia import Inertia
+from fastapi_view.inertia.encoder import (
+    RawJSON,
+    TypeEncoders,
+    to_jsonable,
+    type_encoders,
+)
+
+
+class Status(str, enum.Enum):
+    ACTIVE = "active"
+
+
+class Money:
+    def __init__(self, amount: Decimal, currency: str):
+        self.amount = amount
+        self.currency = currency
+
+
+class Euro(Money):
+    pass
+
+
+@dataclasses.dataclass
+class LineItem:
+    sku: str
+    price: Money
+
+
+@dataclasses.dataclass
+class Shipment:
+    weight: Decimal
+    sent: date
+    lines: list[LineItem]
+
+
+class Parcel:
+    def __init__(self, price: Money):
+        self.price = price
+
+
+@pytest.fixture
+def encoders() -> TypeEncoders:
+    return TypeEncoders()
+
+
+def test_encoder_applies_to_subclasses(encoders):
+    """Test encoders are resolved along the MRO"""
+    encoders.register(Money, lambda money: str(money.amount))
+
+    assert encoders.lookup(Euro)(Euro(Decimal("1.50"), "EUR")) == "1.50"
+    assert encoders.lookup(str) is None
+
+
+def test_resolved_encoder_cached_per_type(encoders):
+    """Test the MRO is walked once per type"""
+    encoders.register(Money, str)
+    encoders.lookup(Euro)
+
+    assert encoders._resolved == {Euro: str}
+
+
+def test_registering_clears_resolved_encoders(encoders):
+    """Test a more specific registration wins after the cache was filled"""
+    encoders.register(Money, str)
+    encoders.lookup(Euro)
+    encoders.register(Euro, repr)
+
+    assert encoders.lookup(Euro) is repr
+
+
+def test_encoder_registered_by_qualified_name(encoders):
+    """Test types can be registered without importing them"""
+    encoders.register("decimal.Decimal", float)
+
+    assert encoders.lookup(Decimal) is float
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"price": Decimal("9.99"), "count": Decimal("3")},
+        [date(2024, 1, 1), datetime(2024, 1, 1, 12, 30), timedelta(seconds=90)],
+        {"status": Status.ACTIVE, Status.ACTIVE: uuid.UUID(int=1)},
+        OrderedDict(path=PurePosixPath("/tmp"), tags={"a"}),
+        ("nested", [{"deep": (Decimal("0.5"),)}]),
+        {"_sa_instance_state": object(), "name": "John"},
+        Shipment(Decimal("1.5"), date(2024, 1, 1), []),
+    ],
+)
+def test_to_jsonable_matches_jsonable_encoder(value):
+    """Test the registry produces FastAPI's output"""
+    assert to_jsonable(value) == jsonable_encoder(value)
+
+
+def test_to_jsonable_keeps_pre_encoded_values():
+    """Test raw fragments are left in place"""
+    raw = RawJSON("[1]")
+
+    assert to_jsonable({"raw": raw})["raw"] is raw
+
+
+def test_inertia_register_encoder_helper_method(monkeypatch):
+    """Test Inertia.register_encoder registers process-wide encoders"""
+    monkeypatch.setattr(type_encoders, "_encoders", dict(type_encoders._encoders))
+    monkeypatch.setattr(type_encoders, "_resolved", {})
+
+    Inertia.register_encoder(
+        Money, lambda money: {"amount": money.amount, "currency": money.currency}
+    )
+
+    assert to_jsonable([Euro(Decimal("2.5"), "EUR")]) == [
+        {"amount": 2.5, "currency": "EUR"}
+    ]
+
+
+def test_registered_encoders_apply_inside_objects(monkeypatch):
+    """Test dataclass fields and object attributes consult the registry"""
+    monkeypatch.setattr(type_encoders, "_encoders", dict(type_encoders._encoders))
+    monkeypatch.setattr(type_encoders, "_resolved", {})
+    Inertia.register_encoder(Money, lambda money: f"${money.amount}")
+
+    shipment = Shipment(
+        Decimal("2.5"), date(2024, 1, 1), [LineItem("A-1", Money(Decimal("3"), "USD"))]
+    )
+
+    assert to_jsonable(shipment) == {
+        "weight": 2.5,
+        "sent": "2024-01-01",
+        "lines": [{"sku": "A-1", "price": "$3"}],
+    }
+    assert to_jsonable(Parcel(Money(Decimal("4"), "USD"))) == {"price": "$4"}